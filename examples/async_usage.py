@@ -16,6 +16,9 @@ from skillkit import SkillManager
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
 
+# Skills directory shared by every demo below
+SKILLS_DIR = Path(__file__).parent / "skills"
+
 
 async def fastapi_example():
     """Demonstrate FastAPI-style async pattern."""
@@ -23,7 +26,7 @@ async def fastapi_example():
     print("skillkit: FastAPI Integration Pattern")
     print("=" * 60)
 
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     # Initialize manager (typically done at app startup)
@@ -52,7 +55,7 @@ async def concurrent_invocations_example():
     print("skillkit: Concurrent Invocations Example")
     print("=" * 60)
 
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     # Initialize manager
@@ -94,7 +97,7 @@ async def multi_source_async_example():
     print("skillkit: Multi-Source Async Discovery")
     print("=" * 60)
 
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     # Create manager with multiple sources
@@ -131,7 +134,7 @@ async def performance_comparison():
     print("skillkit: Performance Comparison (Sync vs Async)")
     print("=" * 60)
 
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
 
     # Sync version
     print("\n[Sync] Running sync discovery and invocations...")
@@ -14,6 +14,9 @@ from skillkit import SkillManager
 # Configure logging to see skill discovery and invocation
 logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
 
+# Skills directory shared by every demo below
+SKILLS_DIR = Path(__file__).parent / "skills"
+
 
 def sync_example() -> None:
     """Demonstrate sync skill manager usage (v0.1 compatible)."""
@@ -22,7 +25,7 @@ def sync_example() -> None:
     print("=" * 60)
 
     # Use example skills from examples/skills/ directory
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     # Create skill manager
@@ -90,7 +93,7 @@ async def async_example() -> None:
     print("=" * 60)
 
     # Use example skills from examples/skills/ directory
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     # Create skill manager
@@ -18,6 +18,9 @@ from skillkit import SkillManager
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
 
+# Skills directory shared by every demo below
+SKILLS_DIR = Path(__file__).parent / "skills"
+
 
 def measure_time_ms(func, *args, **kwargs):
     """Measure function execution time in milliseconds."""
@@ -42,7 +45,7 @@ def sync_caching_demo() -> None:
     print("=" * 70)
 
     # Use example skills
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     # Create manager with default cache (100 entries)
@@ -105,6 +108,8 @@ def sync_caching_demo() -> None:
     print(f"  Cache misses: {final_stats.misses}")
     print(f"  Hit rate: {final_stats.hit_rate:.1%}")
     print(f"  Cache size: {final_stats.size}/{final_stats.max_size} entries")
+    print(f"  Evictions: {final_stats.evictions} (LRU, cache full)")
+    print(f"  Invalidations: {final_stats.invalidations} (SKILL.md modified)")
 
     print("\n[6] Cache Clearing Demo")
     print("-" * 70)
@@ -130,7 +135,7 @@ async def async_caching_demo() -> None:
     print("skillkit v0.4: Caching Performance Demo (Async)")
     print("=" * 70)
 
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     manager = SkillManager(project_skill_dir=skills_dir, max_cache_size=100)
@@ -155,7 +160,7 @@ async def async_caching_demo() -> None:
 
     print("\n[2] Concurrent Invocations - Same Skill, Different Arguments")
     print("-" * 70)
-    # These will execute in parallel (per-skill locking)
+    # These will execute in parallel (locks are per skill + arguments)
     start_concurrent = time.perf_counter()
     results = await asyncio.gather(
         manager.ainvoke_skill(skill_name, "Generate commit for feature A"),
@@ -166,7 +171,7 @@ async def async_caching_demo() -> None:
 
     print(f"  Total time (3 invocations): {concurrent_time:.2f}ms")
     print(f"  Average per invocation: {concurrent_time / 3:.2f}ms")
-    print(f"  Note: Per-skill locking serializes same-skill invocations")
+    print(f"  Note: Only identical (skill, arguments) misses are coalesced")
 
     print("\n[3] Concurrent Invocations - Different Skills (Parallel Execution)")
     print("-" * 70)
@@ -222,7 +227,7 @@ def main():
     print("  2. Cached invocations: <1ms (memory lookup)")
     print("  3. Whitespace variations → same cache entry (normalization)")
     print("  4. Different arguments → different cache entries")
-    print("  5. Concurrent same-skill → serialized (safe)")
+    print("  5. Concurrent identical calls → file read once (coalesced)")
     print("  6. Concurrent different-skills → parallel (fast)")
     print("  7. File modifications → automatic cache invalidation")
     print("  8. Cache stats available for monitoring")
@@ -19,6 +19,9 @@ from skillkit import SkillManager
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
 
+# Skills directory shared by every demo below
+SKILLS_DIR = Path(__file__).parent / "skills"
+
 
 def main() -> None:
     """Demonstrate LangChain agent integration."""
@@ -36,7 +39,7 @@ def main() -> None:
         return
 
     # Use example skills from examples/skills/ directory
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     # Create skill manager and discover skills
@@ -177,7 +180,7 @@ async def async_agent_demo() -> None:
         return
 
     # Use example skills from examples/skills/ directory
-    skills_dir = Path(__file__).parent / "skills"
+    skills_dir = SKILLS_DIR
     print(f"\nUsing skills directory: {skills_dir}")
 
     # Create skill manager and discover skills ASYNCHRONOUSLY
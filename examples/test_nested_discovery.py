@@ -10,6 +10,9 @@ from pathlib import Path
 
 from skillkit import SkillManager
 
+# Skills directory shared by every demo below
+NESTED_SKILLS_DIR = Path(__file__).parent / "skills" / "nested-example"
+
 
 def test_sync_nested_discovery():
     """Test synchronous nested skill discovery."""
@@ -18,7 +21,7 @@ def test_sync_nested_discovery():
     print("=" * 70)
 
     # Use the nested-example directory
-    nested_skills_dir = Path(__file__).parent / "skills" / "nested-example"
+    nested_skills_dir = NESTED_SKILLS_DIR
 
     if not nested_skills_dir.exists():
         print(f"ERROR: Nested skills directory not found: {nested_skills_dir}")
@@ -71,7 +74,7 @@ async def test_async_nested_discovery():
     print("=" * 70)
 
     # Use the nested-example directory
-    nested_skills_dir = Path(__file__).parent / "skills" / "nested-example"
+    nested_skills_dir = NESTED_SKILLS_DIR
 
     if not nested_skills_dir.exists():
         print(f"ERROR: Nested skills directory not found: {nested_skills_dir}")
@@ -123,7 +126,7 @@ async def test_sync_async_consistency():
     print("Testing Sync/Async Consistency")
     print("=" * 70)
 
-    nested_skills_dir = Path(__file__).parent / "skills" / "nested-example"
+    nested_skills_dir = NESTED_SKILLS_DIR
 
     # Sync discovery
     manager_sync = SkillManager(project_skill_dir=nested_skills_dir)
@@ -20,6 +20,7 @@ from skillkit.core.exceptions import (
     SuspiciousInputError,
 )
 from skillkit.core.manager import SkillManager
+from skillkit.core.metrics import CounterMetricsSink, MetricsSink
 from skillkit.core.models import CacheStats, ContentCache, Skill, SkillMetadata
 from skillkit.core.parser import SkillParser
 from skillkit.core.processors import (
@@ -41,6 +42,8 @@ __all__ = [
     # Cache
     "ContentCache",
     "CacheStats",
+    "MetricsSink",
+    "CounterMetricsSink",
     # Processors
     "ContentProcessor",
     "BaseDirectoryProcessor",
@@ -6,24 +6,45 @@ and locating SKILL.md files, and plugin manifest discovery functionality.
 
 import asyncio
 import logging
+import os
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Tuple
 
 if TYPE_CHECKING:
     from skillkit.core.models import PluginManifest, SkillSource
 
 logger = logging.getLogger(__name__)
 
+# Directory listings whose mtime is this recent are not memoized: entries added
+# within the filesystem's timestamp granularity would not change the mtime
+# (2s covers the coarsest common filesystems)
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# Parsed plugin manifests shared by every SkillManager in the process:
+# manifest path -> (st_mtime_ns, st_size, manifest)
+_MANIFEST_CACHE: Dict[str, Tuple[int, int, "PluginManifest"]] = {}
+
 
 class SkillDiscovery:
     """Filesystem scanner for discovering SKILL.md files.
 
     Supports flat directory structure (.claude/skills/skill-name/SKILL.md)
     with case-insensitive SKILL.md matching.
+
+    Directory listings are memoized per instance, keyed by the directory's
+    st_mtime_ns (which changes whenever an entry is added, removed or renamed),
+    so re-discovery of an unchanged tree costs one stat() per directory
+    instead of a full listing.
     """
 
     SKILL_FILE_NAME = "SKILL.md"
 
+    def __init__(self) -> None:
+        """Initialize scanner with an empty directory listing memo."""
+        # dir path -> (st_mtime_ns, SKILL.md file names, subdirectory names)
+        self._listing_cache: Dict[str, Tuple[int, List[str], List[str]]] = {}
+
     def discover_skills(self, source: "SkillSource") -> List[Path]:
         """Discover skills from a specific source.
 
@@ -54,10 +75,7 @@ class SkillDiscovery:
         if source.source_type == SourceType.PLUGIN and source.plugin_manifest:
             all_skill_files: List[Path] = []
 
-            for skill_dir_rel in source.plugin_manifest.skills:
-                # Resolve skill directory relative to plugin root
-                skill_dir = source.directory / skill_dir_rel
-
+            for skill_dir in self._source_scan_dirs(source):
                 # Scan this skill directory
                 skill_files = self.scan_directory(skill_dir)
                 all_skill_files.extend(skill_files)
@@ -87,15 +105,46 @@ class SkillDiscovery:
             >>> print(f"Found {len(skills)} skills")
             Found 3 skills
         """
+        if not self._is_scannable_dir(skills_dir):
+            return []
+
+        return self.find_skill_files(skills_dir)
+
+    def _source_scan_dirs(self, source: "SkillSource") -> List[Path]:
+        """Directories to scan for a source.
+
+        Args:
+            source: SkillSource instance with directory and metadata
+
+        Returns:
+            Manifest skill directories for plugins with a manifest, otherwise
+            the source directory itself
+        """
+        from skillkit.core.models import SourceType
+
+        if source.source_type == SourceType.PLUGIN and source.plugin_manifest:
+            # Resolve skill directories relative to plugin root
+            return [source.directory / rel for rel in source.plugin_manifest.skills]
+        return [source.directory]
+
+    def _is_scannable_dir(self, skills_dir: Path) -> bool:
+        """Check that a scan root exists and is a directory, logging if not.
+
+        Args:
+            skills_dir: Root directory to scan for skills
+
+        Returns:
+            True if the directory can be scanned
+        """
         if not skills_dir.exists():
             logger.debug(f"Skills directory does not exist: {skills_dir}")
-            return []
+            return False
 
         if not skills_dir.is_dir():
             logger.warning(f"Skills path is not a directory: {skills_dir}")
-            return []
+            return False
 
-        return self.find_skill_files(skills_dir)
+        return True
 
     def find_skill_files(self, skills_dir: Path, max_depth: int = 5) -> List[Path]:
         """Find SKILL.md files recursively with depth limit.
@@ -123,15 +172,30 @@ class SkillDiscovery:
             Found: /home/user/.claude/skills/data/csv-parser/SKILL.md
         """
         skill_files: List[Path] = []
+        self._walk_skill_files(skills_dir, skill_files.append, max_depth)
+        logger.info(f"Discovery found {len(skill_files)} skill(s) in {skills_dir}")
+        return skill_files
+
+    def _walk_skill_files(
+        self, skills_dir: Path, on_found: Callable[[Path], None], max_depth: int = 5
+    ) -> None:
+        """Walk a directory tree, reporting each SKILL.md file as it is found.
+
+        Args:
+            skills_dir: Directory to search
+            on_found: Called with the absolute path of each SKILL.md file
+            max_depth: Maximum nesting depth to search
+        """
         visited_dirs: set[tuple[int, int]] = (
             set()
         )  # Track visited directories to detect circular symlinks
 
         try:
-            # Use recursive search with depth tracking
+            # Use recursive search with depth tracking; the walk works on str
+            # paths and only builds Path objects for the SKILL.md files it reports
             self._find_skill_files_recursive(
-                skills_dir,
-                skill_files,
+                os.fspath(skills_dir.absolute()),
+                on_found,
                 visited_dirs,
                 current_depth=0,
                 max_depth=max_depth,
@@ -142,13 +206,10 @@ class SkillDiscovery:
         except OSError as e:
             logger.warning(f"Error scanning directory {skills_dir}: {e}")
 
-        logger.info(f"Discovery found {len(skill_files)} skill(s) in {skills_dir}")
-        return skill_files
-
     def _find_skill_files_recursive(
         self,
-        current_dir: Path,
-        skill_files: List[Path],
+        current_dir: str,
+        on_found: Callable[[Path], None],
         visited_dirs: set[tuple[int, int]],
         current_depth: int,
         max_depth: int,
@@ -156,8 +217,8 @@ class SkillDiscovery:
         """Recursively find SKILL.md files with depth limit and circular symlink detection.
 
         Args:
-            current_dir: Current directory being scanned
-            skill_files: Accumulator list for discovered skill files
+            current_dir: Current directory being scanned (absolute path string)
+            on_found: Called with each discovered skill file
             visited_dirs: Set of visited directory inodes to detect circular symlinks
             current_depth: Current recursion depth (0 = root)
             max_depth: Maximum allowed depth
@@ -165,25 +226,20 @@ class SkillDiscovery:
         Note:
             This is an internal helper method. Use find_skill_files() instead.
         """
-        # Resolve symlinks and check for circular references
+        # Get directory identity (following symlinks) for circular symlink detection
         try:
-            resolved_dir = current_dir.resolve(strict=True)
-        except (OSError, RuntimeError) as e:
-            logger.warning(f"Cannot resolve directory {current_dir}: {e}")
-            return
-
-        # Get directory inode for circular symlink detection
-        try:
-            dir_stat = resolved_dir.stat()
-            dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+            dir_stat = os.stat(current_dir)
         except OSError as e:
-            logger.warning(f"Cannot stat directory {resolved_dir}: {e}")
+            logger.warning(f"Cannot stat directory {current_dir}: {e}")
             return
 
+        dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+
         # Check for circular symlink
         if dir_id in visited_dirs:
             logger.warning(
-                f"Circular symlink detected at {current_dir} -> {resolved_dir}. Skipping."
+                f"Circular symlink detected at {current_dir} -> "
+                f"{os.path.realpath(current_dir)}. Skipping."
             )
             return
 
@@ -198,28 +254,83 @@ class SkillDiscovery:
             )
             return
 
-        # Scan current directory
-        try:
-            for item in current_dir.iterdir():
-                # Check for SKILL.md file (case-insensitive)
-                if item.is_file() and item.name.upper() == self.SKILL_FILE_NAME.upper():
-                    skill_files.append(item.absolute())
-                    logger.debug(f"Found skill file: {item} (depth={current_depth})")
-
-                # Recurse into subdirectories
-                elif item.is_dir():
-                    self._find_skill_files_recursive(
-                        item,
-                        skill_files,
-                        visited_dirs,
-                        current_depth + 1,
-                        max_depth,
-                    )
+        # List current directory (memoized while its mtime is unchanged)
+        listing = self._list_directory(current_dir, dir_stat.st_mtime_ns)
+        if listing is None:
+            return
+        skill_file_names, subdir_names = listing
+
+        for name in skill_file_names:
+            skill_file = Path(os.path.join(current_dir, name))
+            on_found(skill_file)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Found skill file: {skill_file} (depth={current_depth})")
+
+        # Recurse into subdirectories (their own mtimes decide whether to re-list)
+        for name in subdir_names:
+            self._find_skill_files_recursive(
+                os.path.join(current_dir, name),
+                on_found,
+                visited_dirs,
+                current_depth + 1,
+                max_depth,
+            )
+
+    def _list_directory(self, directory: str, mtime_ns: int) -> Tuple[List[str], List[str]] | None:
+        """List SKILL.md files and subdirectories of a directory.
+
+        Uses os.scandir(), whose entries carry the file type from the directory
+        read, so no per-entry stat() is needed for regular files and
+        directories. Results are reused while the directory mtime is unchanged.
+
+        Args:
+            directory: Directory to list
+            mtime_ns: Current st_mtime_ns of the directory
+
+        Returns:
+            Tuple of (SKILL.md file names, subdirectory names), or None if the
+            directory cannot be read
+        """
+        cached = self._listing_cache.get(directory)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        skill_file_name = self.SKILL_FILE_NAME.upper()
+        file_names: List[str] = []
+        subdir_names: List[str] = []
 
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        # Check for SKILL.md file (case-insensitive); the length
+                        # check skips upper() for almost every other entry
+                        if (
+                            len(name) == len(skill_file_name)
+                            and name.upper() == skill_file_name
+                            and entry.is_file()
+                        ):
+                            file_names.append(name)
+                        elif entry.is_dir():
+                            # d_type from the directory read; stat() only for symlinks
+                            subdir_names.append(name)
+                    except OSError:
+                        continue
         except PermissionError:
-            logger.warning(f"Permission denied accessing: {current_dir}")
+            logger.warning(f"Permission denied accessing: {directory}")
+            return None
         except OSError as e:
-            logger.warning(f"Error reading directory {current_dir}: {e}")
+            logger.warning(f"Error reading directory {directory}: {e}")
+            return None
+
+        # Do not trust listings of directories modified within the racy window
+        if time.time_ns() - mtime_ns > _RACY_MTIME_WINDOW_NS:
+            self._listing_cache[directory] = (mtime_ns, file_names, subdir_names)
+        else:
+            self._listing_cache.pop(directory, None)
+
+        return file_names, subdir_names
 
     async def _read_skill_file_async(self, path: Path) -> str:
         """Async wrapper for reading skill files.
@@ -274,10 +385,7 @@ class SkillDiscovery:
         if source.source_type == SourceType.PLUGIN and source.plugin_manifest:
             all_skill_files: List[Path] = []
 
-            for skill_dir_rel in source.plugin_manifest.skills:
-                # Resolve skill directory relative to plugin root
-                skill_dir = source.directory / skill_dir_rel
-
+            for skill_dir in self._source_scan_dirs(source):
                 # Scan this skill directory asynchronously
                 skill_files = await self.ascan_directory(skill_dir)
                 all_skill_files.extend(skill_files)
@@ -289,6 +397,52 @@ class SkillDiscovery:
         # For non-plugin sources, scan the source directory directly
         return await self.ascan_directory(source.directory)
 
+    async def aiter_skill_files(self, source: "SkillSource") -> AsyncIterator[Path]:
+        """Stream SKILL.md paths for a source as the directory walk finds them.
+
+        The walk runs in a worker thread and hands each path to the event loop
+        as soon as it is found, so callers can start processing (e.g. parsing)
+        before the whole tree has been listed. Paths are yielded in the same
+        order adiscover_skills() returns them.
+
+        Args:
+            source: SkillSource instance with directory and metadata
+
+        Yields:
+            Absolute paths to SKILL.md files
+
+        Raises:
+            Any unexpected error raised by the directory walk, after the paths
+            found before it have been yielded
+
+        Example:
+            >>> async for skill_file in discovery.aiter_skill_files(source):
+            ...     print(skill_file)
+        """
+        loop = asyncio.get_running_loop()
+        found: asyncio.Queue[Path | None] = asyncio.Queue()
+
+        def report(skill_file: Path | None) -> None:
+            loop.call_soon_threadsafe(found.put_nowait, skill_file)
+
+        def _walk() -> None:
+            """Sync walk pushing paths to the queue; None marks the end."""
+            try:
+                for skill_dir in self._source_scan_dirs(source):
+                    if self._is_scannable_dir(skill_dir):
+                        self._walk_skill_files(skill_dir, report)
+            finally:
+                report(None)
+
+        walker = asyncio.ensure_future(asyncio.to_thread(_walk))
+        try:
+            while (skill_file := await found.get()) is not None:
+                yield skill_file
+        finally:
+            # Surfaces walk errors; the thread cannot be interrupted, so an
+            # early exit by the caller waits for the walk to finish
+            await walker
+
     async def ascan_directory(self, skills_dir: Path) -> List[Path]:
         """Async version of scan_directory for non-blocking skill discovery.
 
@@ -359,6 +513,10 @@ def discover_plugin_manifest(plugin_dir: Path) -> "PluginManifest | None":
     This function implements graceful degradation: malformed manifests are logged
     as warnings but do not halt discovery of other plugins.
 
+    Successful parses are cached process-wide, keyed by the manifest's
+    st_mtime_ns and st_size, so constructing further SkillManager instances
+    costs one stat() per plugin until the manifest changes.
+
     Args:
         plugin_dir: Absolute path to plugin root directory
 
@@ -388,11 +546,21 @@ def discover_plugin_manifest(plugin_dir: Path) -> "PluginManifest | None":
 
     # Check for manifest at expected location
     manifest_path = plugin_dir / ".claude-plugin" / "plugin.json"
+    manifest_key = str(manifest_path)
 
-    if not manifest_path.exists():
+    try:
+        st = os.stat(manifest_key)
+    except OSError:
+        _MANIFEST_CACHE.pop(manifest_key, None)
         logger.debug(f"No plugin manifest found at {manifest_path}")
         return None
 
+    # Reuse the previous parse while the file's mtime and size are unchanged
+    cached = _MANIFEST_CACHE.get(manifest_key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    _MANIFEST_CACHE.pop(manifest_key, None)
+
     # Attempt to parse manifest with graceful error handling
     try:
         manifest = parse_plugin_manifest(manifest_path)
@@ -400,6 +568,9 @@ def discover_plugin_manifest(plugin_dir: Path) -> "PluginManifest | None":
             f"Discovered plugin '{manifest.name}' v{manifest.version} "
             f"with {len(manifest.skills)} skill directory(ies) at {plugin_dir}"
         )
+        # Do not trust manifests modified within the racy window
+        if time.time_ns() - st.st_mtime_ns > _RACY_MTIME_WINDOW_NS:
+            _MANIFEST_CACHE[manifest_key] = (st.st_mtime_ns, st.st_size, manifest)
         return manifest
 
     except ManifestNotFoundError as e:
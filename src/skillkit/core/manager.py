@@ -6,28 +6,46 @@ skill discovery, access, and invocation.
 
 import asyncio
 import logging
+import os
+import stat
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List
-
-import aiofiles
-import aiofiles.os
-
-from skillkit.core.discovery import SkillDiscovery
-from skillkit.core.exceptions import ConfigurationError, SkillNotFoundError, SkillsUseError
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from skillkit.core.discovery import SkillDiscovery, discover_plugin_manifest
+from skillkit.core.exceptions import (
+    AsyncStateError,
+    ConfigurationError,
+    ContentLoadError,
+    ScriptNotFoundError,
+    SkillNotFoundError,
+    SkillsUseError,
+)
+from skillkit.core.metrics import MetricsSink
 from skillkit.core.models import (
     CacheStats,
     ContentCache,
     InitMode,
+    PluginManifest,
+    QualifiedSkillName,
     Skill,
     SkillMetadata,
     SkillSource,
     SourceType,
 )
 from skillkit.core.parser import SkillParser
-from skillkit.core.processors import normalize_arguments, process_skill_content
-
-if TYPE_CHECKING:
-    from skillkit.core.scripts import ScriptExecutionResult
+from skillkit.core.processors import (
+    apply_arguments_template,
+    apply_base_directory,
+    normalize_arguments,
+    split_arguments_template,
+)
+from skillkit.core.script_workers import ScriptWorkerPool
+from skillkit.core.scripts import ScriptExecutionResult, ScriptExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +59,141 @@ PRIORITY_ANTHROPIC = 50
 PRIORITY_PLUGIN = 10
 PRIORITY_CUSTOM_BASE = 5
 
+# Maximum SKILL.md files parsed concurrently in worker threads by adiscover()
+ADISCOVER_PARSE_CONCURRENCY = 32
+
+
+def _is_directory(path: Path) -> bool:
+    """Check that a path exists and is a directory with a single stat() call.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if path is an existing directory (symlinks followed)
+    """
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _resolve_plugin_dir(plugin_dir: Path | str) -> Tuple[Path, Path, PluginManifest | None]:
+    """Validate a configured plugin directory and parse its manifest.
+
+    Args:
+        plugin_dir: Plugin root directory as configured
+
+    Returns:
+        Tuple of (configured path, resolved path, manifest or None if
+        absent/invalid)
+
+    Raises:
+        ConfigurationError: If the directory does not exist
+    """
+    plugin_path = Path(plugin_dir) if isinstance(plugin_dir, str) else plugin_dir
+
+    # Validate explicit plugin path exists
+    if not _is_directory(plugin_path):
+        raise ConfigurationError(
+            f"Explicitly configured plugin directory does not exist: '{plugin_path}'",
+            parameter_name="plugin_dirs",
+            invalid_path=str(plugin_path),
+        )
+
+    # T038: Parse plugin manifest
+    resolved_path = plugin_path.resolve()
+    return plugin_path, resolved_path, discover_plugin_manifest(resolved_path)
+
+
+def _decode_skill_text(data: bytes) -> str:
+    """Decode SKILL.md bytes like open(encoding="utf-8-sig") in text mode.
+
+    Reading bytes and decoding once is cheaper than the text-mode codec and
+    newline translation layer; the BOM and CR checks are plain scans that
+    are false for almost every file.
+
+    Args:
+        data: Raw file contents
+
+    Returns:
+        Decoded text with any UTF-8 BOM removed and newlines normalized to \\n
+
+    Raises:
+        UnicodeDecodeError: If data is not valid UTF-8
+    """
+    if data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _file_version(st: os.stat_result) -> int:
+    """Fingerprint a file by modification time and size.
+
+    Folding st_size into the value means an edit that keeps the mtime (cp -p,
+    some checkouts and deployment tools) still invalidates the cache when it
+    changes the file's length. The encoding is injective for any mtime that
+    fits in 64 bits, so different (mtime, size) pairs never compare equal.
+
+    Args:
+        st: Result of os.stat() / os.fstat()
+
+    Returns:
+        st_size * 2**64 + st_mtime_ns
+    """
+    return (st.st_size << 64) + st.st_mtime_ns
+
+
+def _read_skill_file(file_path: Path) -> Tuple[str, int]:
+    """Read a SKILL.md file and its mtime with a single open.
+
+    The mtime (as a _file_version() fingerprint) comes from fstat() on the
+    open descriptor, so it describes the exact content that was read. Async callers run this in one
+    asyncio.to_thread() hop instead of separate stat and read round-trips.
+
+    Args:
+        file_path: Path to SKILL.md
+
+    Returns:
+        Tuple of (raw_content, file_version)
+
+    Raises:
+        ContentLoadError: If the file is missing, unreadable, or not valid UTF-8
+    """
+    try:
+        with open(file_path, "rb") as f:
+            file_version = _file_version(os.fstat(f.fileno()))
+            data = f.read()
+    except FileNotFoundError as e:
+        raise ContentLoadError(
+            f"Skill file not found: {file_path}. File may have been deleted after discovery."
+        ) from e
+    except PermissionError as e:
+        raise ContentLoadError(f"Permission denied reading skill: {file_path}") from e
+
+    try:
+        return _decode_skill_text(data), file_version
+    except UnicodeDecodeError as e:
+        raise ContentLoadError(f"Skill file contains invalid UTF-8: {file_path}") from e
+
+
+class _KeyLock:
+    """Reference-counted threading lock guarding a single cache key.
+
+    Attributes:
+        lock: Lock serializing cache-miss loads for the key
+        users: Number of threads holding or waiting on the lock
+    """
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.users: int = 0
+
 
 class SkillManager:
     """Central skill registry with discovery and invocation capabilities.
@@ -60,7 +213,7 @@ class SkillManager:
     (e.g., "plugin-name:skill-name").
 
     Attributes:
-        sources: Priority-ordered list of SkillSource objects
+        sources: Priority-ordered tuple of SkillSource objects
         _skills: Internal skill registry (name → metadata)
         _plugin_skills: Plugin-namespaced skills (plugin_name → skill_name → metadata)
         _parser: YAML frontmatter parser
@@ -77,6 +230,11 @@ class SkillManager:
         additional_search_paths: List[Path | str] | None = None,
         default_script_timeout: int = 30,
         max_cache_size: int = 100,
+        stat_ttl: float = 0.0,
+        persistent_workers: bool = False,
+        metrics_sink: MetricsSink | None = None,
+        *,
+        _resolved_plugins: List[Tuple[Path, Path, PluginManifest | None]] | None = None,
     ) -> None:
         """Initialize skill manager with flexible multi-source configuration.
 
@@ -113,8 +271,28 @@ class SkillManager:
                 - Typical memory: ~2.1KB per entry, ~5MB cache overhead
                 - Increase for agents with many skills or diverse arguments
 
+            stat_ttl: Seconds to trust a SKILL.md mtime before re-checking it (default: 0.0)
+                - 0.0: stat() the file on every invocation (edits seen immediately)
+                - >0: cache hits within the window skip the stat() syscall
+                - Edits may go unnoticed for up to stat_ttl seconds
+
+            persistent_workers: Run Python scripts in long-lived workers (default: False)
+                - Interpreter startup is paid once per script instead of per call
+                - A changed environment replaces the script's worker
+                - Only sys.stdout/sys.stderr output is captured
+                - Workers stop at interpreter exit, when the manager is garbage
+                  collected, or via shutdown_script_workers()
+
+            metrics_sink: Callable receiving (metric_name, increment) for cache events (default: None)
+                - Called on every cache hit, miss, eviction and invalidation
+                - Use CounterMetricsSink to forward to Prometheus/OpenTelemetry counters
+                - Sink exceptions are logged and never fail an invocation
+
+            _resolved_plugins: Internal; plugin_dirs already validated by create()
+
         Raises:
             ConfigurationError: When explicitly provided directory path doesn't exist
+            ValueError: If stat_ttl is negative
 
         Priority Resolution:
             When skills with the same name exist in multiple sources, the source with
@@ -186,16 +364,22 @@ class SkillManager:
             project_skill_dir = skill_dir
 
         # Build priority-ordered sources
-        self.sources: List[SkillSource] = self._build_sources(
+        self.sources: Tuple[SkillSource, ...] = self._build_sources(
             project_skill_dir,
             anthropic_config_dir,
             plugin_dirs,
             additional_search_paths,
+            _resolved_plugins,
         )
 
         # Skill registries
         self._skills: Dict[str, SkillMetadata] = {}
         self._plugin_skills: Dict[str, Dict[str, SkillMetadata]] = {}
+        # Source each registered skill came from, for conflict reporting
+        self._skill_sources: Dict[str, SkillSource] = {}
+        # Qualified names of plugin skills shadowed by a higher-priority skill,
+        # in registration order (dict used as an ordered set)
+        self._qualified_conflicts: Dict[str, None] = {}
 
         # Infrastructure
         self._parser = SkillParser()
@@ -206,24 +390,78 @@ class SkillManager:
 
         # Script execution configuration (v0.3+)
         self.default_script_timeout = default_script_timeout
+        self._script_workers: ScriptWorkerPool | None = None
+        # SKILL.md path -> Skill used for script execution, so script detection
+        # and the scripts_by_name index are built once per registered skill
+        self._script_skills: Dict[Path, Skill] = {}
+        # Executors are stateless between calls, so one per timeout value is reused
+        self._script_executors: Dict[int, ScriptExecutor] = {}
+        if persistent_workers:
+            self._script_workers = ScriptWorkerPool()
 
         # Cache system (v0.4+)
-        self._cache = ContentCache(max_size=max_cache_size)
-        self._skill_locks: Dict[str, asyncio.Lock] = {}
-        self._locks_lock = asyncio.Lock()
+        if stat_ttl < 0:
+            raise ValueError(f"stat_ttl must be >= 0, got: {stat_ttl}")
+        self.stat_ttl = stat_ttl
+        self._cache = ContentCache(max_size=max_cache_size, metrics_sink=metrics_sink)
+        # Skill name -> (file version, base-directory content split on $ARGUMENTS),
+        # so a miss on new arguments only stats the file and joins the segments
+        self._base_contents: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+        # SKILL.md path -> (file version, time.monotonic() of the check), used when stat_ttl > 0
+        self._mtime_checks: Dict[Path, Tuple[int, float]] = {}
+        # In-flight async cache-miss loads, shared by concurrent identical calls
+        self._inflight: Dict[Tuple[str, str], asyncio.Future[str]] = {}
+        self._sync_key_locks: Dict[Tuple[str, str], _KeyLock] = {}
+        self._sync_key_locks_guard = threading.Lock()
 
         # Legacy v0.1 compatibility attribute
         self.skills_dir = (
             Path(project_skill_dir) if project_skill_dir else Path.cwd() / ".claude" / "skills"
         )
 
+    @classmethod
+    async def create(cls, **kwargs: Any) -> "SkillManager":
+        """Async constructor that validates plugin directories concurrently.
+
+        Each plugin directory costs a stat() and a manifest parse; on network
+        mounts these add up when done one plugin at a time. create() runs them
+        for all plugin_dirs at once in worker threads, then builds the manager
+        in a worker thread so construction never blocks the event loop.
+
+        Args:
+            **kwargs: Same keyword arguments as SkillManager()
+
+        Returns:
+            Configured SkillManager (call adiscover() next)
+
+        Raises:
+            ConfigurationError: When explicitly provided directory path doesn't exist
+
+        Example:
+            >>> manager = await SkillManager.create(plugin_dirs=["./plugins/a", "./plugins/b"])
+            >>> await manager.adiscover()
+        """
+        plugin_dirs = kwargs.get("plugin_dirs")
+        if plugin_dirs:
+            # gather() keeps plugin_dirs order, so duplicate-name suffixes match __init__
+            kwargs["_resolved_plugins"] = list(
+                await asyncio.gather(
+                    *(
+                        asyncio.to_thread(_resolve_plugin_dir, plugin_dir)
+                        for plugin_dir in plugin_dirs
+                    )
+                )
+            )
+        return await asyncio.to_thread(partial(cls, **kwargs))
+
     def _build_sources(
         self,
         project_skill_dir: Path | str | None,
         anthropic_config_dir: Path | str | None,
         plugin_dirs: List[Path | str] | None,
         additional_search_paths: List[Path | str] | None,
-    ) -> List[SkillSource]:
+        resolved_plugins: List[Tuple[Path, Path, PluginManifest | None]] | None = None,
+    ) -> Tuple[SkillSource, ...]:
         """Build priority-ordered list of skill sources with tri-state parameter logic.
 
         Args:
@@ -240,9 +478,11 @@ class SkillManager:
                 - []: Explicit opt-out (skip)
                 - [Path, ...]: Validate each → add valid OR raise ConfigurationError
             additional_search_paths: Additional skill directories (priority: 5, 4, 3, ...)
+            resolved_plugins: _resolve_plugin_dir() results for plugin_dirs, in
+                order, when already computed (see create()); None resolves here
 
         Returns:
-            List of SkillSource objects sorted by priority (descending)
+            Tuple of SkillSource objects sorted by priority (descending)
 
         Raises:
             ConfigurationError: When explicitly provided non-empty path doesn't exist
@@ -259,7 +499,7 @@ class SkillManager:
         # Project skills (highest priority) - TRI-STATE LOGIC
         if project_skill_dir is None:
             # None/omitted: Apply default directory discovery
-            if DEFAULT_PROJECT_DIR.exists() and DEFAULT_PROJECT_DIR.is_dir():
+            if _is_directory(DEFAULT_PROJECT_DIR):
                 sources.append(
                     SkillSource(
                         source_type=SourceType.PROJECT,
@@ -275,7 +515,7 @@ class SkillManager:
             project_path = (
                 Path(project_skill_dir) if isinstance(project_skill_dir, str) else project_skill_dir
             )
-            if not project_path.exists() or not project_path.is_dir():
+            if not _is_directory(project_path):
                 raise ConfigurationError(
                     f"Explicitly configured directory does not exist: project_skill_dir='{project_path}'",
                     parameter_name="project_skill_dir",
@@ -292,7 +532,7 @@ class SkillManager:
         # Anthropic config skills - TRI-STATE LOGIC
         if anthropic_config_dir is None:
             # None/omitted: Apply default directory discovery
-            if DEFAULT_ANTHROPIC_DIR.exists() and DEFAULT_ANTHROPIC_DIR.is_dir():
+            if _is_directory(DEFAULT_ANTHROPIC_DIR):
                 sources.append(
                     SkillSource(
                         source_type=SourceType.ANTHROPIC,
@@ -310,7 +550,7 @@ class SkillManager:
                 if isinstance(anthropic_config_dir, str)
                 else anthropic_config_dir
             )
-            if not anthropic_path.exists() or not anthropic_path.is_dir():
+            if not _is_directory(anthropic_path):
                 raise ConfigurationError(
                     f"Explicitly configured directory does not exist: anthropic_config_dir='{anthropic_path}'",
                     parameter_name="anthropic_config_dir",
@@ -326,25 +566,13 @@ class SkillManager:
 
         # Plugin skills (with duplicate name detection and validation)
         if plugin_dirs:
-            from skillkit.core.discovery import discover_plugin_manifest
+            if resolved_plugins is None:
+                resolved_plugins = [_resolve_plugin_dir(plugin_dir) for plugin_dir in plugin_dirs]
 
             # T062: Track plugin names to detect duplicates
             plugin_name_counts: Dict[str, int] = {}
 
-            for plugin_dir in plugin_dirs:
-                plugin_path = Path(plugin_dir) if isinstance(plugin_dir, str) else plugin_dir
-
-                # Validate explicit plugin path exists
-                if not plugin_path.exists() or not plugin_path.is_dir():
-                    raise ConfigurationError(
-                        f"Explicitly configured plugin directory does not exist: '{plugin_path}'",
-                        parameter_name="plugin_dirs",
-                        invalid_path=str(plugin_path),
-                    )
-
-                # T038: Parse plugin manifest
-                manifest = discover_plugin_manifest(plugin_path.resolve())
-
+            for plugin_path, resolved_path, manifest in resolved_plugins:
                 if manifest:
                     plugin_name = manifest.name
                 else:
@@ -373,7 +601,7 @@ class SkillManager:
                 sources.append(
                     SkillSource(
                         source_type=SourceType.PLUGIN,
-                        directory=plugin_path.resolve(),
+                        directory=resolved_path,
                         priority=PRIORITY_PLUGIN,
                         plugin_name=plugin_name,
                         plugin_manifest=manifest,
@@ -386,7 +614,7 @@ class SkillManager:
                 custom_path = Path(search_path) if isinstance(search_path, str) else search_path
 
                 # Validate explicit custom path exists
-                if not custom_path.exists() or not custom_path.is_dir():
+                if not _is_directory(custom_path):
                     raise ConfigurationError(
                         f"Explicitly configured custom directory does not exist: '{custom_path}'",
                         parameter_name="additional_search_paths",
@@ -413,7 +641,82 @@ class SkillManager:
             f"{[(s.source_type.value, s.priority) for s in sources]}"
         )
 
-        return sources
+        # Sources never change after construction
+        return tuple(sources)
+
+    def _register_metadata(
+        self,
+        metadata: SkillMetadata,
+        skill_file: Path,
+        source: SkillSource,
+        plugin_name: str | None,
+        plugin_namespace: Dict[str, SkillMetadata] | None,
+        debug_enabled: bool,
+    ) -> bool:
+        """Add parsed metadata to the registries (shared by discover/adiscover).
+
+        Args:
+            metadata: Parsed skill metadata
+            skill_file: Path the metadata was parsed from
+            source: Source the file was discovered in
+            plugin_name: Plugin namespace for plugin sources, else None
+            plugin_namespace: The plugin's registry in _plugin_skills, else None
+            debug_enabled: Whether per-skill debug messages should be built
+
+        Returns:
+            True if the skill was added to the main registry, False if a
+            higher priority skill with the same name was already registered
+        """
+        name = metadata.name
+
+        # T040: Plugin skills - add to plugin namespace registry
+        if plugin_namespace is not None:
+            plugin_namespace[name] = metadata
+            if debug_enabled:
+                logger.debug(
+                    f"Registered plugin skill: {plugin_name}:{name} from {source.directory}"
+                )
+
+        # T029: Add to main registry (highest priority wins - sources already sorted)
+        if name not in self._skills:
+            self._skills[name] = metadata
+            self._skill_sources[name] = source
+            if debug_enabled:
+                logger.debug(f"Registered skill: {name} from {source.source_type.value}")
+            return True
+
+        # T061: A shadowed plugin skill stays reachable by its qualified name
+        if plugin_name:
+            self._qualified_conflicts[f"{plugin_name}:{name}"] = None
+
+        # T028/T060: Duplicate name - enhanced conflict logging with all paths
+        # and resolution details (only built when warnings are enabled)
+        if logger.isEnabledFor(logging.WARNING):
+            existing_metadata = self._skills[name]
+
+            # Source of the existing skill (recorded when it was registered)
+            existing_source = self._skill_sources.get(name)
+            existing_source_type = (
+                existing_source.source_type.value if existing_source else "unknown"
+            )
+            existing_priority = existing_source.priority if existing_source else "unknown"
+
+            # Build qualified name hint
+            qualified_hint = ""
+            if plugin_name:
+                qualified_hint = (
+                    f" Use qualified name '{plugin_name}:{name}' to access the ignored version."
+                )
+
+            logger.warning(
+                f"Skill name conflict detected for '{name}':\n"
+                f"  KEEPING: {existing_metadata.skill_path} "
+                f"(source: {existing_source_type}, priority: {existing_priority})\n"
+                f"  IGNORING: {skill_file} "
+                f"(source: {source.source_type.value}, priority: {source.priority})\n"
+                f"  RESOLUTION: Higher priority source wins.{qualified_hint}"
+            )
+        return False
 
     @property
     def init_mode(self) -> InitMode:
@@ -454,8 +757,6 @@ class SkillManager:
             >>> print(f"Found {len(manager.list_skills())} skills")
             Found 5 skills
         """
-        from skillkit.core.exceptions import AsyncStateError
-
         # Check for mixing sync/async initialization
         if self._init_mode == InitMode.ASYNC:
             raise AsyncStateError(
@@ -471,13 +772,19 @@ class SkillManager:
         # Clear existing skills
         self._skills.clear()
         self._plugin_skills.clear()
+        self._skill_sources.clear()
+        self._qualified_conflicts.clear()
+        self._base_contents.clear()
+        self._script_skills.clear()
 
         # T027: Multi-source discovery loop in priority order
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         total_skills_found = 0
         for source in self.sources:
-            logger.debug(
-                f"Scanning source: {source.source_type.value} at {source.directory} (priority: {source.priority})"
-            )
+            if debug_enabled:
+                logger.debug(
+                    f"Scanning source: {source.source_type.value} at {source.directory} (priority: {source.priority})"
+                )
 
             # Discover skills from this source
             skill_files = self._discovery.discover_skills(source)
@@ -486,82 +793,52 @@ class SkillManager:
                 logger.debug(f"No skills found in {source.directory}")
                 continue
 
+            # Per-source values hoisted out of the per-file loop
+            plugin_name = source.plugin_name if source.source_type is SourceType.PLUGIN else None
+            plugin_namespace = (
+                self._plugin_skills.setdefault(plugin_name, {}) if plugin_name else None
+            )
+
             # Parse each skill file (graceful degradation)
             for skill_file in skill_files:
                 try:
                     metadata = self._parser.parse_skill_file(skill_file)
 
-                    # T040: Plugin skills - add to plugin namespace registry
-                    if source.source_type == SourceType.PLUGIN and source.plugin_name:
-                        plugin_name = source.plugin_name
-
-                        # Initialize plugin namespace if not exists
-                        if plugin_name not in self._plugin_skills:
-                            self._plugin_skills[plugin_name] = {}
-
-                        # Store in plugin namespace
-                        self._plugin_skills[plugin_name][metadata.name] = metadata
-                        logger.debug(
-                            f"Registered plugin skill: {plugin_name}:{metadata.name} from {source.directory}"
-                        )
-
-                    # T028/T060: Check for duplicate names (conflict detection with enhanced logging)
-                    if metadata.name in self._skills:
-                        existing_metadata = self._skills[metadata.name]
-
-                        # Find the source of the existing skill
-                        existing_source = None
-                        for s in self.sources:
-                            if str(s.directory) in str(existing_metadata.skill_path):
-                                existing_source = s
-                                break
-
-                        # T060: Enhanced conflict logging with all paths and resolution details
-                        existing_source_type = (
-                            existing_source.source_type.value if existing_source else "unknown"
-                        )
-                        existing_priority = (
-                            existing_source.priority if existing_source else "unknown"
-                        )
-
-                        # Build qualified name hint
-                        qualified_hint = ""
-                        if source.source_type == SourceType.PLUGIN and source.plugin_name:
-                            qualified_hint = f" Use qualified name '{source.plugin_name}:{metadata.name}' to access the ignored version."
-
-                        logger.warning(
-                            f"Skill name conflict detected for '{metadata.name}':\n"
-                            f"  KEEPING: {existing_metadata.skill_path} "
-                            f"(source: {existing_source_type}, priority: {existing_priority})\n"
-                            f"  IGNORING: {skill_file} "
-                            f"(source: {source.source_type.value}, priority: {source.priority})\n"
-                            f"  RESOLUTION: Higher priority source wins.{qualified_hint}"
-                        )
-                        continue
-
-                    # T029: Add to main registry (highest priority wins - sources already sorted)
-                    self._skills[metadata.name] = metadata
-                    logger.debug(
-                        f"Registered skill: {metadata.name} from {source.source_type.value}"
-                    )
-                    total_skills_found += 1
+                    if self._register_metadata(
+                        metadata, skill_file, source, plugin_name, plugin_namespace, debug_enabled
+                    ):
+                        total_skills_found += 1
 
                 except SkillsUseError as e:
-                    # Log parsing errors but continue with other skills
-                    logger.error(f"Failed to parse skill at {skill_file}: {e}", exc_info=True)
+                    # Log parsing errors but continue with other skills; the
+                    # message says what is wrong, tracebacks only under DEBUG
+                    logger.error(
+                        f"Failed to parse skill at {skill_file}: {e}", exc_info=debug_enabled
+                    )
                 except Exception as e:
                     # Catch unexpected errors
                     logger.error(f"Unexpected error parsing {skill_file}: {e}", exc_info=True)
 
+            # A plugin whose files all failed to parse gets no namespace
+            if plugin_name and not plugin_namespace:
+                del self._plugin_skills[plugin_name]
+
         logger.info(
             f"Discovery complete: {total_skills_found} skill(s) registered from {len(self.sources)} source(s)"
         )
 
-    async def adiscover(self) -> None:
+    async def adiscover(self, prewarm: bool = False) -> None:
         """Async version of discover() for non-blocking skill discovery.
 
+        Args:
+            prewarm: Load every discovered skill's no-argument content into the
+                cache after registration (default: False), so the first
+                ainvoke_skill(name) is already a cache hit. Only free cache
+                slots are filled; skills beyond them are left to load lazily
+
         Behavior:
-            - Scans all configured sources in priority order (non-blocking)
+            - Scans all configured sources concurrently (non-blocking), then
+              registers them in priority order
             - Parses YAML frontmatter asynchronously
             - Continues processing even if individual skills fail parsing
             - Logs errors via module logger (skillkit.core.manager)
@@ -579,7 +856,8 @@ class SkillManager:
 
         Performance:
             - Target: <200ms for 500 skills (spec requirement SC-001)
-            - Uses asyncio.gather() for concurrent scanning
+            - Uses asyncio.gather() for concurrent scanning: all sources are
+              scanned at once, so wall time is roughly the slowest single scan
 
         Example:
             >>> manager = SkillManager(project_skill_dir="./skills")
@@ -587,8 +865,6 @@ class SkillManager:
             >>> print(f"Found {len(manager.list_skills())} skills")
             Found 5 skills
         """
-        from skillkit.core.exceptions import AsyncStateError
-
         # T016: Check for mixing sync/async initialization
         if self._init_mode == InitMode.SYNC:
             raise AsyncStateError(
@@ -604,92 +880,163 @@ class SkillManager:
         # Clear existing skills
         self._skills.clear()
         self._plugin_skills.clear()
+        self._skill_sources.clear()
+        self._qualified_conflicts.clear()
+        self._base_contents.clear()
+        self._script_skills.clear()
+
+        # Parsing (file read + YAML) runs in worker threads, bounded so large
+        # trees don't queue unbounded work or open too many files at once
+        parse_slots = asyncio.Semaphore(ADISCOVER_PARSE_CONCURRENCY)
+
+        async def parse_in_thread(skill_file: Path) -> SkillMetadata:
+            async with parse_slots:
+                return await self._parser.aparse_skill_file(skill_file)
+
+        async def scan_and_parse(
+            source: SkillSource,
+        ) -> List[Tuple[Path, SkillMetadata | BaseException]]:
+            """Start parsing each file as soon as the directory walk yields it."""
+            skill_files: List[Path] = []
+            parses: List[asyncio.Future[SkillMetadata]] = []
+            try:
+                async for skill_file in self._discovery.aiter_skill_files(source):
+                    skill_files.append(skill_file)
+                    parses.append(asyncio.ensure_future(parse_in_thread(skill_file)))
+            finally:
+                # Never leave parse tasks behind, even if the walk failed
+                parse_results = await asyncio.gather(*parses, return_exceptions=True)
+            return list(zip(skill_files, parse_results, strict=True))
+
+        # T032: Scan all sources concurrently; they touch independent directories
+        sources = self.sources
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            for source in sources:
+                logger.debug(
+                    f"Scanning source: {source.source_type.value} at {source.directory} (priority: {source.priority})"
+                )
+        scan_results = await asyncio.gather(
+            *(scan_and_parse(source) for source in sources),
+            return_exceptions=True,
+        )
 
-        # T032: Multi-source discovery loop in priority order (async version)
+        # Register in priority order (sources are sorted) so the highest
+        # priority source still wins conflicts
         total_skills_found = 0
-        for source in self.sources:
-            logger.debug(
-                f"Scanning source: {source.source_type.value} at {source.directory} (priority: {source.priority})"
-            )
-
-            # Discover skills from this source asynchronously
-            skill_files = await self._discovery.adiscover_skills(source)
+        for source, scan_result in zip(sources, scan_results, strict=True):
+            if isinstance(scan_result, BaseException):
+                if not isinstance(scan_result, Exception):
+                    raise scan_result
+                # Graceful degradation: a failing source contributes no skills
+                logger.error(
+                    f"Failed to scan source {source.source_type.value} at {source.directory}: "
+                    f"{scan_result}",
+                    exc_info=scan_result,
+                )
+                continue
 
-            if not skill_files:
+            if not scan_result:
                 logger.debug(f"No skills found in {source.directory}")
                 continue
 
-            # Parse each skill file (graceful degradation)
-            for skill_file in skill_files:
+            # Per-source values hoisted out of the per-file loop
+            plugin_name = source.plugin_name if source.source_type is SourceType.PLUGIN else None
+            plugin_namespace = (
+                self._plugin_skills.setdefault(plugin_name, {}) if plugin_name else None
+            )
+
+            # Register parsed files one by one on the event loop, in discovery
+            # order (graceful degradation)
+            for skill_file, parse_result in scan_result:
                 try:
-                    metadata = self._parser.parse_skill_file(skill_file)
+                    if isinstance(parse_result, BaseException):
+                        raise parse_result
+                    metadata = parse_result
 
-                    # T040: Plugin skills - add to plugin namespace registry
-                    if source.source_type == SourceType.PLUGIN and source.plugin_name:
-                        plugin_name = source.plugin_name
-
-                        # Initialize plugin namespace if not exists
-                        if plugin_name not in self._plugin_skills:
-                            self._plugin_skills[plugin_name] = {}
-
-                        # Store in plugin namespace
-                        self._plugin_skills[plugin_name][metadata.name] = metadata
-                        logger.debug(
-                            f"Registered plugin skill: {plugin_name}:{metadata.name} from {source.directory}"
-                        )
-
-                    # T060: Check for duplicate names (conflict detection with enhanced logging)
-                    if metadata.name in self._skills:
-                        existing_metadata = self._skills[metadata.name]
-
-                        # Find the source of the existing skill
-                        existing_source = None
-                        for s in self.sources:
-                            if str(s.directory) in str(existing_metadata.skill_path):
-                                existing_source = s
-                                break
-
-                        # T060: Enhanced conflict logging with all paths and resolution details
-                        existing_source_type = (
-                            existing_source.source_type.value if existing_source else "unknown"
-                        )
-                        existing_priority = (
-                            existing_source.priority if existing_source else "unknown"
-                        )
-
-                        # Build qualified name hint
-                        qualified_hint = ""
-                        if source.source_type == SourceType.PLUGIN and source.plugin_name:
-                            qualified_hint = f" Use qualified name '{source.plugin_name}:{metadata.name}' to access the ignored version."
-
-                        logger.warning(
-                            f"Skill name conflict detected for '{metadata.name}':\n"
-                            f"  KEEPING: {existing_metadata.skill_path} "
-                            f"(source: {existing_source_type}, priority: {existing_priority})\n"
-                            f"  IGNORING: {skill_file} "
-                            f"(source: {source.source_type.value}, priority: {source.priority})\n"
-                            f"  RESOLUTION: Higher priority source wins.{qualified_hint}"
-                        )
-                        continue
-
-                    # Add to registry (highest priority wins - sources already sorted)
-                    self._skills[metadata.name] = metadata
-                    logger.debug(
-                        f"Registered skill: {metadata.name} from {source.source_type.value}"
-                    )
-                    total_skills_found += 1
+                    if self._register_metadata(
+                        metadata, skill_file, source, plugin_name, plugin_namespace, debug_enabled
+                    ):
+                        total_skills_found += 1
 
                 except SkillsUseError as e:
-                    # Log parsing errors but continue with other skills
-                    logger.error(f"Failed to parse skill at {skill_file}: {e}", exc_info=True)
+                    # Log parsing errors but continue with other skills; the
+                    # message says what is wrong, tracebacks only under DEBUG
+                    logger.error(
+                        f"Failed to parse skill at {skill_file}: {e}", exc_info=debug_enabled
+                    )
                 except Exception as e:
                     # Catch unexpected errors
                     logger.error(f"Unexpected error parsing {skill_file}: {e}", exc_info=True)
 
+            # A plugin whose files all failed to parse gets no namespace
+            if plugin_name and not plugin_namespace:
+                del self._plugin_skills[plugin_name]
+
         logger.info(
             f"Async discovery complete: {total_skills_found} skill(s) registered from {len(self.sources)} source(s)"
         )
 
+        if prewarm:
+            await self.aprewarm_cache()
+
+    async def aprewarm_cache(self, names: Iterable[str] | None = None) -> int:
+        """Load skills' no-argument content into the cache concurrently.
+
+        Call after adiscover() for skills on a latency-critical path, so their
+        first ainvoke_skill(name) is already a cache hit. All files are read at
+        once in worker threads (bounded by the default thread pool).
+
+        Args:
+            names: Skill names (simple or qualified) to load, in the form they
+                will be invoked with. None loads every registered skill, but
+                only into free cache slots so existing entries are never evicted
+
+        Returns:
+            Number of skills loaded into the cache
+
+        Raises:
+            SkillNotFoundError: If an explicitly named skill is not registered
+
+        Example:
+            >>> await manager.adiscover()
+            >>> await manager.aprewarm_cache(["code-reviewer", "data-tools:csv-parser"])
+            2
+        """
+        if names is None:
+            stats = self._cache.get_stats()
+            free_slots = stats.max_size - stats.size
+            if free_slots <= 0:
+                return 0
+            targets = [(metadata.name, metadata) for metadata in self._skills.values()]
+            targets = targets[:free_slots]
+        else:
+            # Resolve everything first so an unknown name fails before any I/O
+            targets = [(sys.intern(name), self.get_skill(name)) for name in names]
+
+        normalized_args = normalize_arguments("")
+        results = await asyncio.gather(
+            *(
+                self._load_into_cache(
+                    name, normalized_args, "", metadata.skill_path, metadata.base_directory
+                )
+                for name, metadata in targets
+            ),
+            return_exceptions=True,
+        )
+
+        loaded = 0
+        for (name, _), result in zip(targets, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                # Left to fail (with the real error) when the skill is invoked
+                logger.warning(f"Failed to prewarm cache for skill '{name}': {result}")
+            else:
+                loaded += 1
+        logger.debug(f"Prewarmed cache with {loaded} skill(s)")
+        return loaded
+
     def list_skills(self, include_qualified: bool = False) -> List[SkillMetadata] | List[str]:
         """Return all discovered skill metadata (lightweight).
 
@@ -704,6 +1051,7 @@ class SkillManager:
         Performance:
             - O(n) where n = number of skills
             - Copies internal list (~1-5ms for 100 skills)
+            - Qualified names are precomputed at discovery (no per-call scan)
 
         Example:
             >>> # Get metadata objects (default)
@@ -725,27 +1073,10 @@ class SkillManager:
         if not include_qualified:
             return list(self._skills.values())
 
-        # T030/T061: Return skill names including qualified names only for conflicts
-        names: List[str] = []
-
-        # Add all simple names from main registry
-        names.extend(self._skills.keys())
-
-        # Add qualified plugin names ONLY if they differ from the main registry version
-        # (i.e., only for skills that were shadowed by higher-priority sources)
-        for plugin_name, plugin_skills in self._plugin_skills.items():
-            for skill_name, skill_metadata in plugin_skills.items():
-                # Check if this plugin skill is different from the one in main registry
-                if skill_name in self._skills:
-                    # Conflict exists - check if plugin version is the same as main version
-                    main_skill = self._skills[skill_name]
-                    if main_skill.skill_path != skill_metadata.skill_path:
-                        # Different version - add qualified name
-                        qualified_name = f"{plugin_name}:{skill_name}"
-                        names.append(qualified_name)
-                # If skill_name not in main registry, the plugin skill IS the main version
-                # (no conflict), so we don't need to add a qualified name
-
+        # T030/T061: Simple names, plus qualified names only for plugin skills
+        # shadowed by higher-priority sources (recorded during discovery)
+        names: List[str] = list(self._skills)
+        names.extend(self._qualified_conflicts)
         return names
 
     def get_skill(self, name: str) -> SkillMetadata:
@@ -764,6 +1095,7 @@ class SkillManager:
 
         Performance:
             - O(1) dictionary lookup (~1μs)
+            - Registered simple names are returned before any name parsing
 
         Example:
             >>> # Simple name lookup
@@ -779,7 +1111,11 @@ class SkillManager:
             >>> manager.get_skill("nonexistent")
             SkillNotFoundError: Skill 'nonexistent' not found
         """
-        from skillkit.core.models import QualifiedSkillName
+        # Fast path: registered simple name (the common invocation case)
+        if ":" not in name:
+            metadata = self._skills.get(name)
+            if metadata is not None:
+                return metadata
 
         # T031: Parse QualifiedSkillName and support qualified lookups
         try:
@@ -788,6 +1124,20 @@ class SkillManager:
             # Convert validation errors to SkillNotFoundError for consistent API
             raise SkillNotFoundError(str(e)) from e
 
+        return self._resolve_metadata(parsed)
+
+    def _resolve_metadata(self, parsed: QualifiedSkillName) -> SkillMetadata:
+        """Look up an already-parsed skill name in the registries.
+
+        Args:
+            parsed: Parsed simple or qualified skill name
+
+        Returns:
+            SkillMetadata instance
+
+        Raises:
+            SkillNotFoundError: If the plugin or skill is not registered
+        """
         # If qualified name (plugin:skill)
         if parsed.plugin is not None:
             # Look in plugin skills registry
@@ -841,50 +1191,182 @@ class SkillManager:
         """
         metadata = self.get_skill(name)
 
-        # Base directory is the parent of SKILL.md file
-        base_directory = metadata.skill_path.parent
+        # Base directory is the parent of SKILL.md file (precomputed on the metadata)
+        return Skill(metadata=metadata, base_directory=metadata.base_directory)
+
+    def _recent_mtime(self, file_path: Path) -> int | None:
+        """Return the remembered mtime of a file if checked within stat_ttl.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            Remembered file version, or None if it must be re-checked
+        """
+        if self.stat_ttl > 0:
+            entry = self._mtime_checks.get(file_path)
+            if entry is not None and time.monotonic() - entry[1] < self.stat_ttl:
+                return entry[0]
+        return None
+
+    def _remember_mtime(self, file_path: Path, file_mtime: int) -> None:
+        """Record a freshly observed mtime for stat_ttl reuse.
+
+        Args:
+            file_path: Path to file
+            file_mtime: File version just observed
+        """
+        if self.stat_ttl > 0:
+            self._mtime_checks[file_path] = (file_mtime, time.monotonic())
+
+    def _get_file_mtime_sync(self, file_path: Path) -> int:
+        """Get file modification time, honouring stat_ttl.
+
+        Args:
+            file_path: Path to file
 
-        return Skill(metadata=metadata, base_directory=base_directory)
+        Returns:
+            File version from _file_version() (st_mtime_ns and st_size)
+        """
+        file_mtime = self._recent_mtime(file_path)
+        if file_mtime is None:
+            file_mtime = _file_version(os.stat(file_path))
+            self._remember_mtime(file_path, file_mtime)
+        return file_mtime
 
-    async def _get_file_mtime(self, file_path: Path) -> float:
-        """Get file modification time asynchronously.
+    async def _get_file_mtime(self, file_path: Path) -> int:
+        """Get file modification time asynchronously, honouring stat_ttl.
 
         Args:
             file_path: Path to file
 
         Returns:
-            Modification time as float (seconds since epoch)
+            File version from _file_version() (st_mtime_ns and st_size)
 
         Performance:
-            - <1ms (single stat() call)
+            - <1ms (single stat() call in a worker thread)
+            - ~0 when the mtime was checked within stat_ttl
+        """
+        file_mtime = self._recent_mtime(file_path)
+        if file_mtime is None:
+            stat_result = await asyncio.to_thread(os.stat, file_path)
+            file_mtime = _file_version(stat_result)
+            self._remember_mtime(file_path, file_mtime)
+        return file_mtime
+
+    def _load_skill_content(
+        self, name: str, file_path: Path, base_dir: Path, arguments: str
+    ) -> Tuple[str, int]:
+        """Read and process a SKILL.md file (cache-miss workload).
+
+        The base-directory-prefixed content is kept per skill, pre-split on
+        $ARGUMENTS, so a miss on new arguments for an unchanged file costs a
+        stat() and a str.join() instead of a read and a substitution scan.
+        Async callers run this whole method in a single worker-thread hop.
+
+        Args:
+            name: Skill name
+            file_path: Path to SKILL.md
+            base_dir: Skill base directory for file resolution context
+            arguments: Caller's arguments to substitute (as given, not normalized)
+
+        Returns:
+            Tuple of (processed_content, file_version)
+
+        Raises:
+            ContentLoadError: If the file cannot be read
+            SizeLimitExceededError: If arguments exceed 1MB
         """
-        stat_result = await aiofiles.os.stat(file_path)
-        return stat_result.st_mtime
+        entry = self._base_contents.get(name)
+        if entry is not None:
+            try:
+                file_mtime = self._get_file_mtime_sync(file_path)
+            except OSError:
+                file_mtime = None  # Let the read below report the error
+            if file_mtime == entry[0]:
+                return apply_arguments_template(entry[1], arguments), file_mtime
 
-    async def _get_skill_lock(self, skill_name: str) -> asyncio.Lock:
-        """Get or create lock for a specific skill.
+        raw_content, file_mtime = _read_skill_file(file_path)
+        template = split_arguments_template(apply_base_directory(raw_content, base_dir))
+        self._base_contents[name] = (file_mtime, template)
+        return apply_arguments_template(template, arguments), file_mtime
 
-        Uses a lock-protected dictionary to ensure thread-safe lock creation.
+    async def _load_into_cache(
+        self, name: str, normalized_args: str, arguments: str, file_path: Path, base_dir: Path
+    ) -> str:
+        """Load, process and cache skill content (async cache-miss path).
+
+        Reads and processes in a single worker-thread hop so that misses for
+        different skills overlap instead of running on the event loop.
 
         Args:
-            skill_name: Skill identifier
+            name: Skill name
+            normalized_args: Normalized arguments (cache key component)
+            arguments: Caller's arguments to substitute
+            file_path: Path to SKILL.md
+            base_dir: Skill base directory
 
         Returns:
-            asyncio.Lock for the skill
+            Processed skill content
+        """
+        processed_content, file_mtime = await asyncio.to_thread(
+            self._load_skill_content, name, file_path, base_dir, arguments
+        )
+        self._remember_mtime(file_path, file_mtime)
 
-        Performance:
-            - <1ms (fast lock acquisition + dict lookup)
+        # Store in cache
+        await self._cache.put(name, normalized_args, processed_content, file_mtime)
+        return processed_content
+
+    def _inflight_done(self, key: Tuple[str, str], future: "asyncio.Future[str]") -> None:
+        """Drop a finished in-flight load from the registry.
+
+        Also marks a failure as retrieved, so a load whose callers were all
+        cancelled does not log "exception was never retrieved".
+
+        Args:
+            key: Cache key of the load
+            future: The finished load
         """
-        async with self._locks_lock:
-            if skill_name not in self._skill_locks:
-                self._skill_locks[skill_name] = asyncio.Lock()
-            return self._skill_locks[skill_name]
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()
+
+    @contextmanager
+    def _sync_key_lock(self, key: Tuple[str, str]) -> Iterator[None]:
+        """Hold the stampede lock for a cache key from synchronous code.
+
+        Concurrent identical cache misses in invoke_skill() are serialized so
+        that only the first one reads the file. The registry itself is guarded
+        by a threading.Lock since callers may run in different threads.
+
+        Args:
+            key: Cache key to lock
+
+        Yields:
+            None while the lock is held
+        """
+        with self._sync_key_locks_guard:
+            entry = self._sync_key_locks.get(key)
+            if entry is None:
+                entry = self._sync_key_locks[key] = _KeyLock()
+            entry.users += 1
+        try:
+            with entry.lock:
+                yield
+        finally:
+            with self._sync_key_locks_guard:
+                entry.users -= 1
+                if entry.users == 0:
+                    del self._sync_key_locks[key]
 
     def get_cache_stats(self) -> CacheStats:
         """Get cache statistics snapshot.
 
         Returns:
-            CacheStats with current metrics (size, hits, misses, hit_rate)
+            CacheStats with current metrics (size, hits, misses, hit_rate,
+            evictions, invalidations)
 
         Example:
             >>> stats = manager.get_cache_stats()
@@ -895,6 +1377,17 @@ class SkillManager:
         """
         return self._cache.get_stats()
 
+    def _forget_base_contents(self, skill_name: str | None) -> None:
+        """Drop remembered base-directory content so the next miss re-reads.
+
+        Args:
+            skill_name: Forget only this skill (default: forget all)
+        """
+        if skill_name is None:
+            self._base_contents.clear()
+        else:
+            self._base_contents.pop(skill_name, None)
+
     def clear_cache(self, skill_name: str | None = None) -> int:
         """Clear cache entries (synchronous wrapper).
 
@@ -905,26 +1398,16 @@ class SkillManager:
             Number of entries cleared
 
         Note:
-            This is a synchronous wrapper around the async clear method.
-            It creates a new event loop if needed.
+            Safe to call with or without a running event loop; the cache is
+            cleared directly, no event loop is involved.
 
         Example:
             >>> cleared = manager.clear_cache("my-skill")
             >>> print(f"Cleared {cleared} entries")
             Cleared 3 entries
         """
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            # No event loop running, create temporary one
-            return asyncio.run(self._cache.clear(skill_name))
-        else:
-            # Event loop already running, schedule as task
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, self._cache.clear(skill_name))
-                return future.result()
+        self._forget_base_contents(skill_name)
+        return self._cache.clear_sync(skill_name)
 
     async def aclear_cache(self, skill_name: str | None = None) -> int:
         """Clear cache entries (async version).
@@ -940,13 +1423,14 @@ class SkillManager:
             >>> print(f"Cleared {cleared} entries")
             Cleared 3 entries
         """
+        self._forget_base_contents(skill_name)
         return await self._cache.clear(skill_name)
 
     def invoke_skill(self, name: str, arguments: str = "") -> str:
         """Load and invoke skill with caching (v0.4+).
 
-        Synchronous wrapper around async ainvoke_skill for backward compatibility.
-        Uses asyncio.run to execute the async caching logic.
+        Synchronous counterpart of ainvoke_skill(). Uses the cache's sync
+        methods directly, so no event loop is created per call.
 
         Args:
             name: Skill name (case-sensitive)
@@ -968,6 +1452,8 @@ class SkillManager:
         Caching Behavior:
             - Same as ainvoke_skill()
             - Cache shared between sync and async methods
+            - Skill names are interned (sys.intern) on entry; names built
+              dynamically by the caller are still correct, just not faster
 
         Example:
             >>> result = manager.invoke_skill("code-reviewer", "review main.py")
@@ -976,65 +1462,52 @@ class SkillManager:
 
             Review the following code: review main.py
         """
+        # Interned so cache-key comparisons against stored keys are identity checks
+        name = sys.intern(name)
+
         # Get skill metadata
         metadata = self.get_skill(name)
         file_path = metadata.skill_path
-        base_dir = file_path.parent
 
         # Normalize arguments for cache key
         normalized_args = normalize_arguments(arguments)
 
-        # Get file mtime (synchronous)
-        current_mtime = file_path.stat().st_mtime
-
-        # Check cache (use asyncio.run for async cache access)
-        try:
-            asyncio.get_running_loop()
-            # Event loop already running, cannot use asyncio.run
-            # Fall back to sync processing without cache
-            logger.warning(
-                f"invoke_skill called from async context for skill '{name}'. "
-                f"Use ainvoke_skill() instead for optimal caching."
+        # Check cache; the mtime is only fetched when there is an entry to
+        # validate, a cold miss gets it from the open() that reads the file
+        key = (name, normalized_args)
+        if key in self._cache:
+            current_mtime = self._get_file_mtime_sync(file_path)
+            cached_content = self._cache.get_sync(name, normalized_args, current_mtime)
+            if cached_content is not None:
+                return cached_content
+        else:
+            self._cache.record_miss()
+
+        with self._sync_key_lock(key):
+            # Another thread may have filled the entry while we waited
+            if key in self._cache:
+                current_mtime = self._get_file_mtime_sync(file_path)
+                cached_content = self._cache.peek_sync(name, normalized_args, current_mtime)
+                if cached_content is not None:
+                    return cached_content
+
+            # Cache miss - load and process content (with the mtime of what was read)
+            processed_content, file_mtime = self._load_skill_content(
+                name, file_path, metadata.base_directory, arguments
             )
-            skill = self.load_skill(name)
-            return skill.invoke(arguments)
-        except RuntimeError:
-            # No event loop running, safe to use asyncio.run
-            pass
-
-        # Check cache using temporary event loop
-        cached_content = asyncio.run(self._cache.get(name, normalized_args, current_mtime))
-        if cached_content is not None:
-            return cached_content
+            self._remember_mtime(file_path, file_mtime)
 
-        # Cache miss - load and process content
-        from skillkit.core.exceptions import ContentLoadError
-
-        try:
-            # Load content synchronously
-            raw_content = file_path.read_text(encoding="utf-8-sig")
-        except FileNotFoundError as e:
-            raise ContentLoadError(
-                f"Skill file not found: {file_path}. File may have been deleted after discovery."
-            ) from e
-        except PermissionError as e:
-            raise ContentLoadError(f"Permission denied reading skill: {file_path}") from e
-        except UnicodeDecodeError as e:
-            raise ContentLoadError(f"Skill file contains invalid UTF-8: {file_path}") from e
-
-        # Process content with base directory and arguments
-        processed_content = process_skill_content(raw_content, base_dir, arguments)
+            # Store in cache
+            self._cache.put_sync(name, normalized_args, processed_content, file_mtime)
 
-        # Store in cache
-        asyncio.run(self._cache.put(name, normalized_args, processed_content, current_mtime))
-
-        return processed_content
+            return processed_content
 
     async def ainvoke_skill(self, name: str, arguments: str = "") -> str:
         """Async version of invoke_skill() with caching (v0.4+).
 
-        Implements LRU cache with mtime-based invalidation and per-skill locking
-        for thread-safe concurrent invocations.
+        Implements LRU cache with mtime-based invalidation. Cache hits are served
+        without locking; concurrent misses on the same (skill, arguments) key
+        share a single in-flight load so the file is read only once.
 
         Args:
             name: Skill name (case-sensitive)
@@ -1053,12 +1526,15 @@ class SkillManager:
         Performance:
             - Cache hit: <1ms (no file I/O)
             - Cache miss: ~10-25ms (file I/O + processing + caching)
-            - Per-skill locking enables concurrent execution of different skills
+            - Different skills, and different arguments for the same skill,
+              load concurrently; only identical keys are coalesced
 
         Caching Behavior:
             - Cache key: (skill_name, normalized_arguments)
             - Cache invalidation: Automatic on file mtime change
             - Normalization: Whitespace variations map to same cache entry
+            - Skill names are interned (sys.intern) on entry so key comparisons
+              are identity checks
 
         Example:
             >>> # First invocation - cache miss
@@ -1069,8 +1545,6 @@ class SkillManager:
             >>> result2 = await manager.ainvoke_skill("code-reviewer", "review main.py")
             >>> # <1ms
         """
-        from skillkit.core.exceptions import AsyncStateError
-
         # Validate async initialization
         if self._init_mode == InitMode.SYNC:
             raise AsyncStateError(
@@ -1084,50 +1558,68 @@ class SkillManager:
                 "Manager not initialized. Call adiscover() before invoking skills."
             )
 
-        # Get per-skill lock for thread-safe invocation
-        lock = await self._get_skill_lock(name)
+        # Interned so cache-key comparisons against stored keys are identity checks
+        name = sys.intern(name)
 
-        async with lock:
-            # Get skill metadata
-            metadata = self.get_skill(name)
-            file_path = metadata.skill_path
-            base_dir = file_path.parent
+        # Get skill metadata
+        metadata = self.get_skill(name)
+        file_path = metadata.skill_path
 
-            # Normalize arguments for cache key
-            normalized_args = normalize_arguments(arguments)
+        # Normalize arguments for cache key
+        normalized_args = normalize_arguments(arguments)
 
-            # Get file mtime for cache validation
+        # Fast path: cache hits never wait on a lock. The mtime is only
+        # fetched when there is an entry to validate; a cold miss gets it from
+        # the same open() that reads the file.
+        key = (name, normalized_args)
+        if key in self._cache:
             current_mtime = await self._get_file_mtime(file_path)
-
-            # Check cache
             cached_content = await self._cache.get(name, normalized_args, current_mtime)
             if cached_content is not None:
                 return cached_content
+        else:
+            self._cache.record_miss()
+
+        # Cache miss: join the in-flight load for this key, or start one. The
+        # load runs as its own task and callers await it through shield(), so
+        # a cancelled caller never cancels the load shared with the others.
+        load = self._inflight.get(key)
+        if load is None:
+            load = asyncio.ensure_future(
+                self._load_into_cache(
+                    name, normalized_args, arguments, file_path, metadata.base_directory
+                )
+            )
+            self._inflight[key] = load
+            load.add_done_callback(partial(self._inflight_done, key))
 
-            # Cache miss - load and process content
-            from skillkit.core.exceptions import ContentLoadError
+        return await asyncio.shield(load)
 
-            try:
-                # Load content asynchronously
-                async with aiofiles.open(file_path, encoding="utf-8-sig") as f:
-                    raw_content = await f.read()
-            except FileNotFoundError as e:
-                raise ContentLoadError(
-                    f"Skill file not found: {file_path}. "
-                    f"File may have been deleted after discovery."
-                ) from e
-            except PermissionError as e:
-                raise ContentLoadError(f"Permission denied reading skill: {file_path}") from e
-            except UnicodeDecodeError as e:
-                raise ContentLoadError(f"Skill file contains invalid UTF-8: {file_path}") from e
-
-            # Process content with base directory and arguments
-            processed_content = process_skill_content(raw_content, base_dir, arguments)
-
-            # Store in cache with original arguments (already normalized for key)
-            await self._cache.put(name, normalized_args, processed_content, current_mtime)
+    async def ainvoke_skills(self, requests: Iterable[Tuple[str, str]]) -> List[str]:
+        """Invoke several skills concurrently.
 
-            return processed_content
+        Cache misses read their files in parallel worker threads; identical
+        (name, arguments) pairs share one load.
+
+        Args:
+            requests: (skill_name, arguments) pairs
+
+        Returns:
+            Processed contents, in the order of requests
+
+        Raises:
+            Same as ainvoke_skill(); the first failure is raised
+
+        Example:
+            >>> results = await manager.ainvoke_skills(
+            ...     [("code-reviewer", "review main.py"), ("git-helper", "")]
+            ... )
+        """
+        return list(
+            await asyncio.gather(
+                *(self.ainvoke_skill(name, arguments) for name, arguments in requests)
+            )
+        )
 
     def execute_skill_script(
         self,
@@ -1135,7 +1627,7 @@ class SkillManager:
         script_name: str,
         arguments: Dict[str, Any],
         timeout: int | None = None,
-    ) -> "ScriptExecutionResult":
+    ) -> ScriptExecutionResult:
         """Execute a specific script from a skill.
 
         This method provides script execution capabilities for skills that bundle
@@ -1177,7 +1669,8 @@ class SkillManager:
 
         Performance:
             - Typical overhead: 10-50ms (path validation + subprocess spawn)
-            - Script detection is lazy (only runs when accessing skill.scripts)
+            - Script detection runs on the first call for a skill and is reused
+              until the next discover()/adiscover()
             - Detection time: <10ms for skills with ≤50 scripts
 
         Example:
@@ -1197,24 +1690,22 @@ class SkillManager:
         Version:
             Added in v0.3.0
         """
-        from skillkit.core.exceptions import ScriptNotFoundError
-        from skillkit.core.scripts import ScriptExecutor
-
         # Validate manager is initialized
         if self._init_mode == InitMode.UNINITIALIZED:
             raise SkillsUseError(
                 "Manager not initialized. Call discover() or adiscover() before executing scripts."
             )
 
-        # Look up skill
-        skill = self.load_skill(skill_name)
+        # Look up skill, reusing the Skill (and its detected scripts) built for
+        # this registry entry on an earlier call
+        metadata = self.get_skill(skill_name)
+        skill = self._script_skills.get(metadata.skill_path)
+        if skill is None or skill.metadata is not metadata:
+            skill = Skill(metadata=metadata, base_directory=metadata.base_directory)
+            self._script_skills[metadata.skill_path] = skill
 
         # Find script in skill's detected scripts (triggers lazy detection)
-        script_metadata = None
-        for script in skill.scripts:
-            if script.name == script_name:
-                script_metadata = script
-                break
+        script_metadata = skill.scripts_by_name.get(script_name)
 
         if script_metadata is None:
             raise ScriptNotFoundError(
@@ -1227,15 +1718,36 @@ class SkillManager:
 
         # Normalize argument keys to lowercase for case-insensitive matching
         # This ensures scripts receive predictable parameter names regardless
-        # of how framework integrations or LLMs capitalize them
-        normalized_arguments = {k.lower(): v for k, v in arguments.items()}
-
-        # Create executor and execute script
-        executor = ScriptExecutor(timeout=effective_timeout)
+        # of how framework integrations or LLMs capitalize them. Already-lowercase
+        # dicts (the common case) are passed through without a copy; the
+        # executor only serializes them
+        normalized_arguments = arguments
+        if any(k != k.lower() for k in arguments):
+            normalized_arguments = {k.lower(): v for k, v in arguments.items()}
+
+        # Reuse the executor for this timeout (created on first use)
+        executor = self._script_executors.get(effective_timeout)
+        if executor is None:
+            executor = ScriptExecutor(timeout=effective_timeout, worker_pool=self._script_workers)
+            self._script_executors[effective_timeout] = executor
 
         return executor.execute(
             script_path=script_metadata.path,
             arguments=normalized_arguments,
             skill_base_dir=skill.base_directory,
-            skill_metadata=skill.metadata,
+            skill_metadata=metadata,
         )
+
+    def shutdown_script_workers(self) -> None:
+        """Stop persistent script workers (no-op unless persistent_workers=True).
+
+        Workers are restarted on demand by the next script execution.
+
+        Example:
+            >>> manager = SkillManager(persistent_workers=True)
+            >>> manager.discover()
+            >>> manager.execute_skill_script("pdf-extractor", "extract", {"file": "a.pdf"})
+            >>> manager.shutdown_script_workers()
+        """
+        if self._script_workers is not None:
+            self._script_workers.close()
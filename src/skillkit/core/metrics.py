@@ -0,0 +1,78 @@
+"""Metrics export hooks for cache monitoring.
+
+ContentCache reports hits, misses, evictions and invalidations to an optional
+metrics sink as they happen, so monitoring systems can scrape counters without
+the application polling get_cache_stats(). A sink is any callable taking a
+metric name and an increment.
+
+Metric names:
+    skillkit_cache_hits_total: Valid cached content returned
+    skillkit_cache_misses_total: Lookups that had to load the skill file
+    skillkit_cache_evictions_total: Entries dropped by LRU eviction
+    skillkit_cache_invalidations_total: Entries dropped after an mtime change
+
+Classes:
+    CounterMetricsSink: Adapter forwarding metrics to Prometheus or
+        OpenTelemetry counter objects
+
+Version:
+    Added in v0.5.0
+"""
+
+from typing import Any, Callable, Dict, Mapping
+
+# Metric names reported by ContentCache
+CACHE_HITS = "skillkit_cache_hits_total"
+CACHE_MISSES = "skillkit_cache_misses_total"
+CACHE_EVICTIONS = "skillkit_cache_evictions_total"
+CACHE_INVALIDATIONS = "skillkit_cache_invalidations_total"
+
+# Callable receiving (metric_name, increment)
+MetricsSink = Callable[[str, int], None]
+
+
+class CounterMetricsSink:
+    """Forward cache metrics to counter objects from a metrics library.
+
+    Works with prometheus_client.Counter (incremented via ``inc()``) and
+    opentelemetry.metrics.Counter (incremented via ``add()``) without importing
+    either library. Metrics without a registered counter are ignored.
+
+    Example:
+        >>> from prometheus_client import Counter
+        >>> sink = CounterMetricsSink({
+        ...     CACHE_HITS: Counter("skillkit_cache_hits", "Cache hits"),
+        ...     CACHE_MISSES: Counter("skillkit_cache_misses", "Cache misses"),
+        ... })
+        >>> manager = SkillManager(metrics_sink=sink)
+    """
+
+    def __init__(self, counters: Mapping[str, Any]) -> None:
+        """Bind each counter's increment method once.
+
+        Args:
+            counters: Mapping of metric name to counter object
+
+        Raises:
+            TypeError: If a counter has neither inc() nor add()
+        """
+        self._increments: Dict[str, Callable[[int], Any]] = {}
+        for name, counter in counters.items():
+            increment = getattr(counter, "inc", None) or getattr(counter, "add", None)
+            if increment is None:
+                raise TypeError(
+                    f"Counter for '{name}' must provide inc() or add(), "
+                    f"got {type(counter).__name__}"
+                )
+            self._increments[name] = increment
+
+    def __call__(self, name: str, value: int) -> None:
+        """Increment the counter registered for a metric.
+
+        Args:
+            name: Metric name
+            value: Increment
+        """
+        increment = self._increments.get(name)
+        if increment is not None:
+            increment(value)
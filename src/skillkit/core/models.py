@@ -4,19 +4,30 @@ This module defines the SkillMetadata and Skill dataclasses that implement
 the progressive disclosure pattern for memory-efficient skill management.
 """
 
-import asyncio
+import logging
 import sys
+import threading
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from skillkit.core.metrics import (
+    CACHE_EVICTIONS,
+    CACHE_HITS,
+    CACHE_INVALIDATIONS,
+    CACHE_MISSES,
+    MetricsSink,
+)
+
 if TYPE_CHECKING:
     from skillkit.core.processors import CompositeProcessor
     from skillkit.core.scripts import ScriptMetadata
 
+logger = logging.getLogger(__name__)
+
 # Check Python version for slots support on all dataclasses
 # Note: Project requires Python 3.10+ (per pyproject.toml), so slots=True is safe
 # The variable is kept for documentation purposes
@@ -36,8 +47,14 @@ class CacheStats:
         hits: Total cache hits since creation
         misses: Total cache misses since creation
         hit_rate: Calculated hit rate (hits / total requests, 0.0-1.0)
+        evictions: Entries dropped by LRU eviction to stay within max_size
+        invalidations: Entries dropped because the skill file changed (mtime)
 
-    Memory: ~80 bytes per instance
+    A high eviction count alongside a low hit rate indicates the cache is
+    thrashing and max_size should be raised; a high invalidation count points
+    at frequently edited skill files instead.
+
+    Memory: ~100 bytes per instance
     """
 
     size: int
@@ -45,36 +62,69 @@ class CacheStats:
     hits: int
     misses: int
     hit_rate: float
+    evictions: int = 0
+    invalidations: int = 0
 
 
 class ContentCache:
     """LRU cache for processed skill content with mtime-based invalidation.
 
-    Thread-safe for concurrent async access via asyncio.Lock. Implements
-    Least Recently Used (LRU) eviction policy using OrderedDict.
+    Reads are lock-free: lookups rely on single dict operations being atomic
+    under the GIL, and hit/miss counters are single-attribute increments. A
+    short threading.Lock is held only while the OrderedDict is mutated (LRU
+    reorder, insertion, eviction, invalidation), so it never blocks across an
+    await and is safe from both sync and async callers. Implements Least
+    Recently Used (LRU) eviction policy using OrderedDict.
+
+    Every operation is pure memory work, so the *_sync methods are the real
+    implementations and the async methods are thin wrappers kept for async
+    callers; synchronous code never needs an event loop to use the cache.
 
     Cache Key: (skill_name: str, normalized_arguments: str)
-    Cache Value: (processed_content: str, file_mtime: float)
+    Cache Value: (processed_content: str, file_mtime: int)
+
+    An entry is valid only while the file mtime equals the one it was cached
+    with; any change invalidates it, including an mtime moving backwards
+    (a file replaced by an older copy). Mtimes are integer nanoseconds
+    (os.stat().st_mtime_ns), so validity checks are exact integer
+    comparisons with no float rounding. SkillManager also folds the file
+    size into the value, so any integer file version works.
 
     Performance:
         - get(): O(1) with mtime validation
         - put(): O(1) with LRU eviction
-        - clear(): O(n) for specific skill, O(1) for all
+        - clear(): O(k) for a specific skill with k entries, O(1) for all
 
     Memory: ~2.1KB per cached entry (typical), ~5KB cache overhead
 
     Example:
         >>> cache = ContentCache(max_size=100)
-        >>> await cache.put("skill-a", "args", "content", 1000.0)
-        >>> content = await cache.get("skill-a", "args", 1000.0)  # Cache hit
-        >>> content = await cache.get("skill-a", "args", 2000.0)  # Cache miss (stale)
+        >>> await cache.put("skill-a", "args", "content", 1_000_000_000)
+        >>> content = await cache.get("skill-a", "args", 1_000_000_000)  # Cache hit
+        >>> content = await cache.get("skill-a", "args", 2_000_000_000)  # Cache miss (stale)
+        >>> content = cache.get_sync("skill-a", "args", 1_000_000_000)  # From sync code
     """
 
-    def __init__(self, max_size: int = 100) -> None:
+    __slots__ = (
+        "_cache",
+        "_max_size",
+        "_hits",
+        "_misses",
+        "_evictions",
+        "_invalidations",
+        "_metrics_sink",
+        "_lock",
+        "_stats_snapshot",
+        "_keys_by_skill",
+    )
+
+    def __init__(self, max_size: int = 100, metrics_sink: MetricsSink | None = None) -> None:
         """Initialize cache with maximum size.
 
         Args:
             max_size: Maximum number of entries (default 100)
+            metrics_sink: Optional callable receiving (metric_name, increment)
+                for every hit, miss, eviction and invalidation (v0.5+)
 
         Raises:
             ValueError: If max_size <= 0
@@ -83,24 +133,53 @@ class ContentCache:
             raise ValueError(f"max_size must be positive, got: {max_size}")
 
         # Cache storage: (skill_name, normalized_args) -> (content, mtime)
-        self._cache: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+        self._cache: OrderedDict[tuple[str, str], tuple[str, int]] = OrderedDict()
         self._max_size: int = max_size
         self._hits: int = 0
         self._misses: int = 0
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self._evictions: int = 0
+        self._invalidations: int = 0
+        self._metrics_sink: MetricsSink | None = metrics_sink
+        # Guards OrderedDict mutations only; never held across an await
+        self._lock: threading.Lock = threading.Lock()
+        # skill_name -> arguments of its cached entries, for clear(skill_name)
+        self._keys_by_skill: dict[str, set[str]] = {}
+        # Last get_stats() result, returned again while nothing has changed
+        self._stats_snapshot: CacheStats | None = None
 
     async def get(
         self,
         skill_name: str,
         arguments: str,
-        file_mtime: float,
+        file_mtime: int,
+    ) -> str | None:
+        """Get cached content if valid (async wrapper around get_sync()).
+
+        Args:
+            skill_name: Skill identifier
+            arguments: Normalized argument string
+            file_mtime: Current file modification time (st_mtime_ns)
+
+        Returns:
+            Cached content if valid, None if miss or stale
+        """
+        return self.get_sync(skill_name, arguments, file_mtime)
+
+    def get_sync(
+        self,
+        skill_name: str,
+        arguments: str,
+        file_mtime: int,
     ) -> str | None:
         """Get cached content if valid (mtime check).
 
+        Pure in-memory lookup, callable from synchronous code without an
+        event loop.
+
         Args:
             skill_name: Skill identifier
             arguments: Normalized argument string
-            file_mtime: Current file modification time
+            file_mtime: Current file modification time (st_mtime_ns)
 
         Returns:
             Cached content if valid, None if miss or stale
@@ -109,28 +188,129 @@ class ContentCache:
             - Cache hit (valid mtime): <1ms
             - Cache miss or stale: <1ms + invalidation overhead
         """
-        async with self._lock:
-            key = (skill_name, arguments)
-            if key in self._cache:
-                content, cached_mtime = self._cache[key]
-                if cached_mtime >= file_mtime:
-                    # Valid cache entry - mark as recently used
-                    self._cache.move_to_end(key)
-                    self._hits += 1
-                    return content
-                else:
-                    # Stale entry - invalidate
+        key = (skill_name, arguments)
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[1] == file_mtime:
+                # Valid cache entry - mark as recently used. Skipped when it
+                # already is (the common case for repeated calls); a concurrent
+                # mutation during the peek just falls back to the locked move.
+                try:
+                    is_most_recent = next(reversed(self._cache)) == key
+                except (StopIteration, RuntimeError):
+                    is_most_recent = False
+                if not is_most_recent:
+                    with self._lock:
+                        if key in self._cache:
+                            self._cache.move_to_end(key)
+                self._hits += 1
+                if self._metrics_sink is not None:
+                    self._emit(CACHE_HITS)
+                return entry[0]
+
+            # Stale entry - invalidate unless it was already replaced
+            invalidated = False
+            with self._lock:
+                if self._cache.get(key) is entry:
                     del self._cache[key]
+                    self._unindex(key)
+                    self._invalidations += 1
+                    invalidated = True
+            if invalidated and self._metrics_sink is not None:
+                self._emit(CACHE_INVALIDATIONS)
+
+        self.record_miss()
+        return None
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        """Check whether an entry exists for a key, valid or not.
+
+        Does not touch statistics or LRU order. Lets callers skip the stat()
+        needed to validate an entry when there is no entry at all.
+
+        Args:
+            key: (skill_name, normalized_arguments)
+
+        Returns:
+            True if an entry is cached for the key
+        """
+        return key in self._cache
+
+    def record_miss(self) -> None:
+        """Count a miss for a lookup resolved without calling get().
+
+        Used when the caller already knows the key is absent (see
+        __contains__) and goes straight to loading.
+        """
+        self._misses += 1
+        if self._metrics_sink is not None:
+            self._emit(CACHE_MISSES)
+
+    async def peek(
+        self,
+        skill_name: str,
+        arguments: str,
+        file_mtime: int,
+    ) -> str | None:
+        """Async wrapper around peek_sync().
+
+        Args:
+            skill_name: Skill identifier
+            arguments: Normalized argument string
+            file_mtime: Current file modification time (st_mtime_ns)
+
+        Returns:
+            Cached content if valid, None if missing or stale
+        """
+        return self.peek_sync(skill_name, arguments, file_mtime)
+
+    def peek_sync(
+        self,
+        skill_name: str,
+        arguments: str,
+        file_mtime: int,
+    ) -> str | None:
+        """Get cached content if valid, without touching hit/miss statistics.
+
+        Used for the double-checked lookup after waiting on a stampede lock, so
+        that a coalesced invocation is only counted once (by its initial get()).
+
+        Args:
+            skill_name: Skill identifier
+            arguments: Normalized argument string
+            file_mtime: Current file modification time (st_mtime_ns)
 
-            self._misses += 1
-            return None
+        Returns:
+            Cached content if valid, None if missing or stale
+        """
+        entry = self._cache.get((skill_name, arguments))
+        if entry is not None and entry[1] == file_mtime:
+            return entry[0]
+        return None
 
     async def put(
         self,
         skill_name: str,
         arguments: str,
         content: str,
-        file_mtime: float,
+        file_mtime: int,
+    ) -> None:
+        """Store processed content with mtime (async wrapper around put_sync()).
+
+        Args:
+            skill_name: Skill identifier
+            arguments: Normalized argument string
+            content: Processed skill content
+            file_mtime: File modification time at processing (st_mtime_ns)
+        """
+        self.put_sync(skill_name, arguments, content, file_mtime)
+
+    def put_sync(
+        self,
+        skill_name: str,
+        arguments: str,
+        content: str,
+        file_mtime: int,
     ) -> None:
         """Store processed content with mtime.
 
@@ -140,27 +320,77 @@ class ContentCache:
             skill_name: Skill identifier
             arguments: Normalized argument string
             content: Processed skill content
-            file_mtime: File modification time at processing
+            file_mtime: File modification time at processing (st_mtime_ns)
 
         Performance:
             - Without eviction: <1ms
             - With eviction: <1ms (removes oldest entry)
         """
-        async with self._lock:
-            key = (skill_name, arguments)
-
+        key = (skill_name, arguments)
+        evicted = False
+        with self._lock:
             # Remove old entry if exists
             if key in self._cache:
                 del self._cache[key]
 
             # Evict oldest entry if at capacity
             elif len(self._cache) >= self._max_size:
-                self._cache.popitem(last=False)
+                evicted_key, _ = self._cache.popitem(last=False)
+                self._unindex(evicted_key)
+                self._evictions += 1
+                evicted = True
 
             # Add new entry (most recent)
             self._cache[key] = (content, file_mtime)
+            skill_keys = self._keys_by_skill.get(skill_name)
+            if skill_keys is None:
+                skill_keys = self._keys_by_skill[skill_name] = set()
+            skill_keys.add(arguments)
+
+        if evicted and self._metrics_sink is not None:
+            self._emit(CACHE_EVICTIONS)
+
+    def _unindex(self, key: tuple[str, str]) -> None:
+        """Remove a dropped entry from the per-skill key index (lock held).
+
+        Args:
+            key: (skill_name, normalized_arguments) of the dropped entry
+        """
+        skill_keys = self._keys_by_skill.get(key[0])
+        if skill_keys is not None:
+            skill_keys.discard(key[1])
+            if not skill_keys:
+                del self._keys_by_skill[key[0]]
+
+    def _emit(self, metric: str) -> None:
+        """Report one event to the metrics sink.
+
+        Sink failures are logged and swallowed so monitoring problems never
+        break skill invocation. Called outside the lock; a no-op without a sink.
+
+        Args:
+            metric: Metric name (see skillkit.core.metrics)
+        """
+        sink = self._metrics_sink
+        if sink is None:
+            return
+        try:
+            sink(metric, 1)
+        except Exception as e:
+            logger.warning(f"Metrics sink failed for '{metric}': {e}")
 
     async def clear(self, skill_name: str | None = None) -> int:
+        """Clear cache entries (async wrapper around clear_sync()).
+
+        Args:
+            skill_name: Clear only this skill (default: clear all)
+
+        Returns:
+            Number of entries cleared
+        """
+        return self.clear_sync(skill_name)
+
+    def clear_sync(self, skill_name: str | None = None) -> int:
         """Clear cache entries.
 
         Args:
@@ -171,41 +401,60 @@ class ContentCache:
 
         Performance:
             - Clear all: O(1)
-            - Clear specific: O(n) where n = total cache size
+            - Clear specific: O(k) where k = entries cached for that skill
         """
-        async with self._lock:
+        with self._lock:
             if skill_name is None:
                 # Clear all
                 count = len(self._cache)
                 self._cache.clear()
+                self._keys_by_skill.clear()
                 return count
             else:
-                # Clear specific skill
-                keys_to_remove = [key for key in self._cache if key[0] == skill_name]
-                for key in keys_to_remove:
-                    del self._cache[key]
-                return len(keys_to_remove)
+                # Clear specific skill via the per-skill key index
+                arguments_set = self._keys_by_skill.pop(skill_name, ())
+                for arguments in arguments_set:
+                    del self._cache[(skill_name, arguments)]
+                return len(arguments_set)
 
     def get_stats(self) -> CacheStats:
         """Get cache statistics snapshot.
 
         Returns:
-            CacheStats with current metrics
+            CacheStats with current metrics. The previous snapshot object is
+            returned again when no counter or the size has changed since,
+            so frequent polling of an idle cache allocates nothing.
 
         Note:
             This method is synchronous and does not acquire the lock.
             Statistics may be approximate during concurrent operations.
         """
+        size = len(self._cache)
+        snapshot = self._stats_snapshot
+        if (
+            snapshot is not None
+            and snapshot.hits == self._hits
+            and snapshot.misses == self._misses
+            and snapshot.size == size
+            and snapshot.evictions == self._evictions
+            and snapshot.invalidations == self._invalidations
+        ):
+            return snapshot
+
         total = self._hits + self._misses
         hit_rate = self._hits / total if total > 0 else 0.0
 
-        return CacheStats(
-            size=len(self._cache),
+        snapshot = CacheStats(
+            size=size,
             max_size=self._max_size,
             hits=self._hits,
             misses=self._misses,
             hit_rate=hit_rate,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
         )
+        self._stats_snapshot = snapshot
+        return snapshot
 
 
 class SourceType(str, Enum):
@@ -258,6 +507,7 @@ class SkillMetadata:
         skill_path: Absolute path to SKILL.md file
         allowed_tools: Tool names allowed for this skill (optional, not enforced in v0.1)
         version: Skill version string (optional, defaults to None if not specified in SKILL.md)
+        base_directory: Directory containing SKILL.md (derived, computed once)
     """
 
     name: str
@@ -265,6 +515,7 @@ class SkillMetadata:
     skill_path: Path
     allowed_tools: tuple[str, ...] = field(default_factory=tuple)
     version: str | None = None
+    base_directory: Path = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate skill path exists on construction.
@@ -274,6 +525,8 @@ class SkillMetadata:
         """
         if not self.skill_path.exists():
             raise ValueError(f"Skill path does not exist: {self.skill_path}")
+        # Use object.__setattr__ because dataclass is frozen
+        object.__setattr__(self, "base_directory", self.skill_path.parent)
 
 
 # Note: Cannot use slots=True with cached_property, so Skill uses only frozen=True
@@ -500,6 +753,24 @@ class Skill:
 
         return scripts
 
+    @cached_property
+    def scripts_by_name(self) -> "dict[str, ScriptMetadata]":
+        """Detected scripts indexed by name for O(1) lookup (v0.5+).
+
+        If several scripts share a name, the first one in scripts wins.
+
+        Returns:
+            Dictionary mapping script name to ScriptMetadata
+
+        Example:
+            >>> skill.scripts_by_name.get("extract")
+            ScriptMetadata(name='extract', path=Path('scripts/extract.py'), ...)
+        """
+        index: dict[str, ScriptMetadata] = {}
+        for script in self.scripts:
+            index.setdefault(script.name, script)
+        return index
+
 
 @dataclass(frozen=True, slots=True)
 class PluginManifest:
@@ -691,22 +962,39 @@ class QualifiedSkillName:
 
             >>> QualifiedSkillName.parse("data-tools:csv-parser")
             QualifiedSkillName(plugin="data-tools", skill="csv-parser")
+
+        Performance:
+            - Names up to 256 characters are memoized (repeat lookups are O(1))
         """
-        if not name:
-            raise ValueError("Skill name cannot be empty")
+        if len(name) <= _QUALIFIED_NAME_MEMO_MAX_LENGTH:
+            return _parse_qualified_name_memoized(name)
+        return _parse_qualified_name(name)
+
+
+def _parse_qualified_name(name: str) -> QualifiedSkillName:
+    """Parse a skill name into plugin and skill parts (see QualifiedSkillName.parse)."""
+    if not name:
+        raise ValueError("Skill name cannot be empty")
+
+    # Check for qualified name
+    if ":" in name:
+        parts = name.split(":", 1)
+        if len(parts) != 2:
+            raise ValueError(f"Invalid qualified name format: {name}")
+
+        plugin, skill = parts
 
-        # Check for qualified name
-        if ":" in name:
-            parts = name.split(":", 1)
-            if len(parts) != 2:
-                raise ValueError(f"Invalid qualified name format: {name}")
+        if not plugin or not skill:
+            raise ValueError(f"Invalid qualified name (empty plugin or skill): {name}")
 
-            plugin, skill = parts
+        return QualifiedSkillName(plugin=plugin, skill=skill)
 
-            if not plugin or not skill:
-                raise ValueError(f"Invalid qualified name (empty plugin or skill): {name}")
+    # Unqualified name
+    return QualifiedSkillName(plugin=None, skill=name)
 
-            return QualifiedSkillName(plugin=plugin, skill=skill)
 
-        # Unqualified name
-        return QualifiedSkillName(plugin=None, skill=name)
+# Memoize parsing of short names (invocations repeat the same few names); the
+# instances are frozen, so sharing them between callers is safe
+_QUALIFIED_NAME_MEMO_SIZE = 1024
+_QUALIFIED_NAME_MEMO_MAX_LENGTH = 256
+_parse_qualified_name_memoized = lru_cache(maxsize=_QUALIFIED_NAME_MEMO_SIZE)(_parse_qualified_name)
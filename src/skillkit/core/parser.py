@@ -8,6 +8,7 @@ import asyncio
 import json
 import logging
 import re
+import sys
 from pathlib import Path
 from typing import Any, Dict
 
@@ -25,6 +26,15 @@ from skillkit.core.models import PluginManifest, SkillMetadata
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader (several times faster); fall back to the
+# pure-Python SafeLoader when PyYAML was built without libyaml
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
+    logger.debug("libyaml not available, using pure-Python YAML loader")
+
 # Security constant: Maximum plugin manifest file size (1 MB)
 MAX_MANIFEST_SIZE = 1_000_000  # bytes
 
@@ -39,6 +49,10 @@ class SkillParser:
     # Cross-platform regex for frontmatter extraction (handles \n and \r\n)
     FRONTMATTER_PATTERN = re.compile(r"^---[\r\n]+(.*?)[\r\n]+---", re.DOTALL | re.MULTILINE)
 
+    # Characters read up front when parsing; frontmatter almost always fits, and
+    # the rest of the file is only read when the closing --- is not found
+    FRONTMATTER_READ_SIZE = 8192
+
     # Typo detection map (common mistakes → correct field names)
     TYPO_MAP = {
         "allowed_tools": "allowed-tools",
@@ -70,9 +84,10 @@ class SkillParser:
         """
         from skillkit.core.exceptions import ContentLoadError
 
-        # Read file with UTF-8-sig encoding (auto-strips BOM)
+        # Read the head of the file with UTF-8-sig encoding (auto-strips BOM);
+        # the markdown body is not needed for metadata
         try:
-            content = skill_path.read_text(encoding="utf-8-sig")
+            content = self._read_frontmatter_head(skill_path)
         except FileNotFoundError as e:
             raise ContentLoadError(f"Skill file not found: {skill_path}") from e
         except PermissionError as e:
@@ -87,14 +102,16 @@ class SkillParser:
         self._check_for_typos(frontmatter_dict, skill_path)
 
         # Validate and extract required fields
-        name = self._extract_required_field(frontmatter_dict, "name", skill_path)
+        # Interned: skill names are used as registry and cache key components
+        name = sys.intern(self._extract_required_field(frontmatter_dict, "name", skill_path))
         description = self._extract_required_field(frontmatter_dict, "description", skill_path)
 
         # Extract optional fields
         allowed_tools = self._extract_allowed_tools(frontmatter_dict, skill_path)
         version = self._extract_version(frontmatter_dict, skill_path)
 
-        logger.debug(f"Successfully parsed skill '{name}' from {skill_path.parent.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Successfully parsed skill '{name}' from {skill_path.parent.name}")
 
         return SkillMetadata(
             name=name,
@@ -104,6 +121,70 @@ class SkillParser:
             version=version,
         )
 
+    async def aparse_skill_file(self, skill_path: Path) -> SkillMetadata:
+        """Async version of parse_skill_file() that runs in a worker thread.
+
+        Both the file read and the YAML parse happen off the event loop.
+
+        Args:
+            skill_path: Absolute path to SKILL.md file
+
+        Returns:
+            SkillMetadata instance with parsed fields
+
+        Raises:
+            Same exceptions as parse_skill_file()
+        """
+        return await asyncio.to_thread(self.parse_skill_file, skill_path)
+
+    def _read_frontmatter_head(self, skill_path: Path) -> str:
+        """Read enough of a SKILL.md file to contain its frontmatter.
+
+        Reads FRONTMATTER_READ_SIZE characters and falls back to the whole
+        file only when the closing --- delimiter is not within them. Invalid
+        UTF-8 after the frontmatter is therefore reported when content is
+        loaded, not during discovery.
+
+        Args:
+            skill_path: Absolute path to SKILL.md file
+
+        Returns:
+            File text starting at the beginning, including the frontmatter
+            when present
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            PermissionError: If no read permission
+            UnicodeDecodeError: If the text read is not valid UTF-8
+        """
+        with open(skill_path, encoding="utf-8-sig") as f:
+            head = f.read(self.FRONTMATTER_READ_SIZE)
+            if len(head) < self.FRONTMATTER_READ_SIZE or self._split_frontmatter(head) is not None:
+                return head
+            return head + f.read()
+
+    def _split_frontmatter(self, content: str) -> str | None:
+        """Return the YAML text between the --- delimiters, or None.
+
+        The common layout ("---\\n" opening, "\\n---" closing) is split with
+        str.find(); anything else (CRLF, blank lines around the delimiters)
+        goes through FRONTMATTER_PATTERN. Both give the same result.
+
+        Args:
+            content: SKILL.md text (at least the head of the file)
+
+        Returns:
+            Frontmatter text without delimiters, or None if not found
+        """
+        if content.startswith("---\n") and content[4:5] not in ("", "\r", "\n"):
+            end = content.find("\n---", 4)
+            if end != -1 and "\r---" not in content[4:end]:
+                # Trailing newlines before the closing --- belong to the delimiter
+                return content[4:end].rstrip("\r\n")
+
+        match = self.FRONTMATTER_PATTERN.match(content)
+        return match.group(1) if match else None
+
     def _extract_frontmatter(self, content: str, skill_path: Path) -> Dict[str, Any]:
         """Extract and parse YAML frontmatter from content.
 
@@ -119,17 +200,15 @@ class SkillParser:
             InvalidYAMLError: If YAML syntax error
         """
         # Check for frontmatter delimiters
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if not match:
+        frontmatter_text = self._split_frontmatter(content)
+        if frontmatter_text is None:
             raise InvalidFrontmatterError(
                 f"Skill file missing YAML frontmatter delimiters (---): {skill_path}"
             )
 
-        frontmatter_text = match.group(1)
-
         # Parse YAML with detailed error extraction
         try:
-            frontmatter_dict = yaml.safe_load(frontmatter_text)
+            frontmatter_dict = yaml.load(frontmatter_text, Loader=_YamlSafeLoader)
         except yaml.YAMLError as e:
             # Extract line/column if available
             line = getattr(e, "problem_mark", None)
@@ -5,6 +5,7 @@ within skill directories while preventing directory traversal attacks.
 """
 
 import logging
+import os
 from pathlib import Path
 
 from .exceptions import PathSecurityError
@@ -12,6 +13,26 @@ from .exceptions import PathSecurityError
 logger = logging.getLogger(__name__)
 
 
+def _is_path_within_root(path_str: str, root_str: str) -> bool:
+    """Check that a canonical path lies inside a canonical root directory.
+
+    A plain string-prefix test on already-resolved paths, avoiding the
+    Path.is_relative_to() parts comparison. The separator suffix stops
+    "/skills/a-b" from matching root "/skills/a".
+
+    Args:
+        path_str: Resolved absolute path
+        root_str: Resolved absolute root directory
+
+    Returns:
+        True if path_str equals root_str or is nested below it
+    """
+    if path_str == root_str:
+        return True
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    return path_str.startswith(prefix)
+
+
 class FilePathResolver:
     """Secure path resolution for skill supporting files.
 
@@ -20,7 +41,7 @@ class FilePathResolver:
     directory traversal, symlink escape, and absolute path injection.
 
     Security Features:
-    - Path traversal prevention using Path.resolve() + is_relative_to()
+    - Path traversal prevention using Path.resolve() + root-prefix check
     - Symlink resolution and escape detection
     - Absolute path rejection
     - Detailed error logging for security violations
@@ -78,8 +99,10 @@ class FilePathResolver:
             PathSecurityError: Path traversal attempt detected: '../../../etc/passwd'
                                resolves outside skill directory /skills/data-processor
         """
-        # Normalize base directory to canonical absolute path
-        base_dir_resolved = base_directory.resolve()
+        # Normalize base directory to canonical absolute path (resolved once,
+        # reused as the string prefix for the containment check below)
+        base_dir_str = os.path.realpath(base_directory)
+        base_dir_resolved = Path(base_dir_str)
 
         # Join relative path to base and resolve to canonical path
         # This collapses .. sequences, resolves symlinks, and normalizes separators
@@ -94,7 +117,7 @@ class FilePathResolver:
             logger.error(
                 "Path resolution failed",
                 extra={
-                    "base_directory": str(base_dir_resolved),
+                    "base_directory": base_dir_str,
                     "requested_path": relative_path,
                     "error": str(e),
                     "error_type": type(e).__name__,
@@ -103,7 +126,7 @@ class FilePathResolver:
             raise PathSecurityError(error_msg) from e
 
         # SECURITY: Validate resolved path is within base directory
-        if not requested_path.is_relative_to(base_dir_resolved):
+        if not _is_path_within_root(str(requested_path), base_dir_str):
             error_msg = (
                 f"Path traversal attempt detected: '{relative_path}' resolves "
                 f"outside skill directory {base_dir_resolved}"
@@ -111,7 +134,7 @@ class FilePathResolver:
             logger.error(
                 "SECURITY VIOLATION: Path traversal attempt detected",
                 extra={
-                    "base_directory": str(base_dir_resolved),
+                    "base_directory": base_dir_str,
                     "requested_path": relative_path,
                     "resolved_path": str(requested_path),
                     "violation_type": "path_traversal",
@@ -123,7 +146,7 @@ class FilePathResolver:
         logger.debug(
             "Path resolved successfully",
             extra={
-                "base_directory": str(base_dir_resolved),
+                "base_directory": base_dir_str,
                 "requested_path": relative_path,
                 "resolved_path": str(requested_path),
             },
@@ -9,9 +9,10 @@ import logging
 import re
 import sys
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from string import Template
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from skillkit.core.exceptions import (
     ArgumentProcessingError,
@@ -20,8 +21,16 @@ from skillkit.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
-# Compile regex once at module level for efficient reuse
-_WHITESPACE_NORMALIZE = re.compile(r"\s+")
+# Memoize normalization of short argument strings (repeat invocations hit this);
+# longer strings bypass the memo so it never pins large payloads in memory
+_NORMALIZE_MEMO_SIZE = 1024
+_NORMALIZE_MEMO_MAX_LENGTH = 4096
+
+
+@lru_cache(maxsize=_NORMALIZE_MEMO_SIZE)
+def _normalize_memoized(arguments: str) -> str:
+    """Memoized strip + whitespace collapse for short argument strings."""
+    return " ".join(arguments.split())
 
 
 def normalize_arguments(arguments: str | None) -> str:
@@ -53,19 +62,20 @@ def normalize_arguments(arguments: str | None) -> str:
         ''
 
     Performance:
-        - O(n) where n = length of string
-        - ~1-2 microseconds for typical arguments
+        - Repeated arguments (<=4KB): O(1) memo lookup
+        - Otherwise O(n) where n = length of string
+        - ~1-2 microseconds for typical arguments on first sight
     """
     if arguments is None:
         return ""
 
-    # Strip leading/trailing whitespace
-    normalized = arguments.strip()
+    if len(arguments) <= _NORMALIZE_MEMO_MAX_LENGTH:
+        return _normalize_memoized(arguments)
 
-    # Collapse multiple spaces to single space
-    normalized = _WHITESPACE_NORMALIZE.sub(" ", normalized)
-
-    return normalized
+    # Strip leading/trailing whitespace, collapse whitespace runs to one space.
+    # str.split() splits on exactly the characters re's \s matches, and is
+    # several times faster than a regex substitution
+    return " ".join(arguments.split())
 
 
 def process_skill_content(
@@ -75,12 +85,13 @@ def process_skill_content(
 ) -> str:
     """Process skill content with base directory context and argument substitution.
 
-    This is a standalone function that combines base directory injection and
-    argument substitution, optimized for use with caching systems.
+    This is a standalone function that combines base directory injection
+    (apply_base_directory) and argument substitution (apply_arguments),
+    optimized for use with caching systems.
 
     Processing Steps:
-        1. Validate argument size (1MB limit)
-        2. Prepend base directory context
+        1. Prepend base directory context
+        2. Validate argument size (1MB limit)
         3. If arguments is None: return content with base dir only
         4. If $ARGUMENTS exists: replace all instances with arguments (even if empty)
         5. If no $ARGUMENTS and arguments non-empty: append "ARGUMENTS: {args}"
@@ -113,31 +124,108 @@ def process_skill_content(
         - ~1-5ms per invocation (dominated by string operations)
         - No file I/O, pure in-memory processing
     """
-    # 1. Validate argument size (1MB limit)
-    if arguments is not None and len(arguments.encode("utf-8")) > 1_000_000:
-        raise SizeLimitExceededError("Arguments exceed maximum size of 1000000 bytes")
+    return apply_arguments(apply_base_directory(content, base_dir), arguments)
+
+
+def apply_base_directory(content: str, base_dir: Path) -> str:
+    """Prepend the base directory context to skill content.
+
+    This is the argument-independent half of process_skill_content(); its
+    result can be reused for every invocation of the same skill file.
 
-    # 2. Prepend base directory context
-    result = f"Base directory for this skill: {base_dir}\n\n"
-    result += "Supporting files can be referenced using relative paths from this base directory.\n"
-    result += (
+    Args:
+        content: Raw skill content (excluding frontmatter)
+        base_dir: Skill base directory for file resolution context
+
+    Returns:
+        Content prefixed with the base directory context
+    """
+    return (
+        f"Base directory for this skill: {base_dir}\n\n"
+        "Supporting files can be referenced using relative paths from this base directory.\n"
         "Use FilePathResolver.resolve_path(base_dir, relative_path) to securely access files.\n\n"
+        f"{content}"
     )
-    result += content
 
-    # 3. Handle arguments
+
+def apply_arguments(content: str, arguments: str | None) -> str:
+    """Substitute or append arguments in base-directory-prefixed content.
+
+    This is the per-invocation half of process_skill_content().
+
+    Args:
+        content: Output of apply_base_directory()
+        arguments: User-provided arguments (may be None or empty)
+
+    Returns:
+        Content with arguments handled
+
+    Raises:
+        SizeLimitExceededError: If arguments exceed 1MB
+    """
+    # Validate argument size (1MB limit)
+    if arguments is not None and len(arguments.encode("utf-8")) > 1_000_000:
+        raise SizeLimitExceededError("Arguments exceed maximum size of 1000000 bytes")
+
     if arguments is None:
-        return result  # No arguments provided
+        return content  # No arguments provided
 
-    if "$ARGUMENTS" in result:
+    if "$ARGUMENTS" in content:
         # Replace all $ARGUMENTS placeholders (including empty string)
-        return result.replace("$ARGUMENTS", arguments)
+        return content.replace("$ARGUMENTS", arguments)
     elif arguments:  # Non-empty after normalization
         # Append arguments
-        return f"{result}\n\nARGUMENTS: {arguments}"
+        return f"{content}\n\nARGUMENTS: {arguments}"
     else:
         # Empty arguments, no placeholder
-        return result
+        return content
+
+
+def split_arguments_template(content: str) -> Tuple[str, ...]:
+    """Split content on $ARGUMENTS once, for repeated substitution.
+
+    Args:
+        content: Output of apply_base_directory()
+
+    Returns:
+        Literal segments around each placeholder (a single segment when
+        there is no placeholder)
+    """
+    return tuple(content.split("$ARGUMENTS"))
+
+
+def apply_arguments_template(template: Tuple[str, ...], arguments: str | None) -> str:
+    """Same as apply_arguments(), on content pre-split by split_arguments_template().
+
+    Substitution is a single str.join() over the segments, with no search
+    through the content.
+
+    Args:
+        template: Output of split_arguments_template()
+        arguments: User-provided arguments (may be None or empty)
+
+    Returns:
+        Content with arguments handled
+
+    Raises:
+        SizeLimitExceededError: If arguments exceed 1MB
+    """
+    # Validate argument size (1MB limit)
+    if arguments is not None and len(arguments.encode("utf-8")) > 1_000_000:
+        raise SizeLimitExceededError("Arguments exceed maximum size of 1000000 bytes")
+
+    if arguments is None:
+        return "$ARGUMENTS".join(template)  # No arguments provided
+
+    if len(template) > 1:
+        # Replace all $ARGUMENTS placeholders (including empty string)
+        return arguments.join(template)
+    elif arguments:  # Non-empty after normalization
+        # Append arguments
+        return f"{template[0]}\n\nARGUMENTS: {arguments}"
+    else:
+        # Empty arguments, no placeholder
+        return template[0]
 
 
 class ContentProcessor(ABC):
@@ -274,11 +362,16 @@ class ArgumentSubstitutionProcessor(ContentProcessor):
         # Detect suspicious patterns (defense-in-depth, log warnings)
         self._check_suspicious_patterns(arguments, context.get("skill_name", "unknown"))
 
-        # Detect common typos in content
-        self._check_for_typos(content)
+        # Static content (no "$" at all) cannot hold a placeholder or a typo
+        # of one, so skip the typo regexes and the Template scan entirely
+        if "$" in content:
+            # Detect common typos in content
+            self._check_for_typos(content)
 
-        # Check if placeholder exists
-        has_placeholder = self._has_placeholder(content)
+            # Check if placeholder exists
+            has_placeholder = self._has_placeholder(content)
+        else:
+            has_placeholder = False
 
         if not has_placeholder and arguments:
             # No placeholder but arguments provided → append
@@ -305,6 +398,10 @@ class ArgumentSubstitutionProcessor(ContentProcessor):
         Returns:
             True if $ARGUMENTS (not $$ARGUMENTS) found
         """
+        # Cheap substring check before building a Template
+        if self.PLACEHOLDER_NAME not in content:
+            return False
+
         # Get all identifiers from template
         identifiers = self._get_identifiers(content)
         return self.PLACEHOLDER_NAME in identifiers
@@ -0,0 +1,283 @@
+"""Persistent interpreter workers for Python skill scripts.
+
+This module provides an opt-in alternative to spawning a fresh interpreter for
+every script execution. A worker is a long-lived Python process bound to one
+script; each execution sends the JSON arguments as one line on the worker's
+stdin and reads one JSON response line back. Interpreter startup (typically
+30-80ms) is paid once per script instead of once per call.
+
+Protocol (one line each, UTF-8 JSON):
+    request:  {"input": "<arguments JSON passed to the script on stdin>"}
+    response: {"exit_code": int, "stdout": str, "stderr": str}
+
+Inside the worker the script is re-run with runpy for each request, with
+sys.stdin, sys.stdout and sys.stderr replaced by in-memory streams. Output
+written directly to file descriptors 1/2 (e.g. by child processes) is not
+captured. The working directory, sys.path, sys.argv and os.environ are
+restored after every run, so changes a script makes to them do not leak into
+the next call. Module-level state of imported libraries persists between
+calls.
+
+Classes:
+    ScriptWorker: One persistent worker process for a single script
+    ScriptWorkerPool: Registry of workers keyed by interpreter, script and cwd
+
+Version:
+    Added in v0.5.0
+"""
+
+import contextlib
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Worker-side loop, run with ``python -u -c _WORKER_SOURCE <script_path>``
+_WORKER_SOURCE = r"""
+import contextlib, io, json, os, runpy, sys, traceback
+
+script = sys.argv[1]
+sys.argv = [script]
+protocol_in = sys.stdin
+protocol_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+# Keep stray fd-level writes away from the protocol channel
+os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+sys.path.insert(0, os.path.dirname(script))
+# Process state restored after every run so one call cannot affect the next
+base_cwd = os.getcwd()
+base_path = list(sys.path)
+base_environ = dict(os.environ)
+
+for line in protocol_in:
+    request = json.loads(line)
+    sys.stdin = io.TextIOWrapper(io.BytesIO(request["input"].encode("utf-8")), encoding="utf-8")
+    out, err = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            os.chdir(base_cwd)
+            sys.path[:] = base_path
+            sys.argv = [script]
+            if os.environ != base_environ:
+                os.environ.clear()
+                os.environ.update(base_environ)
+    protocol_out.write(
+        json.dumps({"exit_code": exit_code, "stdout": out.getvalue(), "stderr": err.getvalue()})
+        + "\n"
+    )
+    protocol_out.flush()
+"""
+
+# Worker result: (exit_code, stdout, stderr, signal_name, signal_number)
+WorkerResult = Tuple[int, str, str, str | None, int | None]
+
+# Pool key: (interpreter, script_path, cwd)
+WorkerKey = Tuple[str, str, str]
+
+
+class ScriptWorker:
+    """A persistent interpreter process running one script on demand.
+
+    Calls are serialized per worker. A call that exceeds its timeout kills
+    the worker; the pool starts a new one on the next call.
+    """
+
+    def __init__(
+        self,
+        interpreter: str,
+        script_path: Path,
+        env: Dict[str, str],
+        cwd: Path,
+    ) -> None:
+        """Start the worker process.
+
+        Args:
+            interpreter: Python interpreter command
+            script_path: Absolute path to the script
+            env: Environment for the worker process
+            cwd: Working directory for the worker process
+        """
+        self.script_path = script_path
+        self.env = env
+        self._lock = threading.Lock()
+        self._responses: queue.Queue[str | None] = queue.Queue()
+        self._process = subprocess.Popen(
+            [interpreter, "-u", "-c", _WORKER_SOURCE, str(script_path)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            cwd=str(cwd),
+            env=env,
+            shell=False,  # CRITICAL: Never use shell=True
+        )
+        # Reader thread turns the blocking pipe into a queue with timeouts
+        self._reader = threading.Thread(
+            target=self._read_responses, name=f"skillkit-worker-{script_path.name}", daemon=True
+        )
+        self._reader.start()
+        logger.debug(f"Started persistent worker for {script_path} (pid={self._process.pid})")
+
+    def _read_responses(self) -> None:
+        """Forward response lines to the queue; None marks end of stream."""
+        assert self._process.stdout is not None
+        for line in self._process.stdout:
+            self._responses.put(line)
+        self._responses.put(None)
+
+    @property
+    def alive(self) -> bool:
+        """True while the worker process is running."""
+        return self._process.poll() is None
+
+    def run(self, arguments_json: str, timeout: float) -> WorkerResult:
+        """Execute the script once with the given stdin payload.
+
+        Args:
+            arguments_json: JSON arguments passed to the script on stdin
+            timeout: Maximum execution time in seconds
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr, signal_name, signal_number),
+            matching ScriptExecutor's subprocess result
+        """
+        with self._lock:
+            assert self._process.stdin is not None
+            try:
+                self._process.stdin.write(json.dumps({"input": arguments_json}) + "\n")
+                self._process.stdin.flush()
+                line = self._responses.get(timeout=timeout)
+            except queue.Empty:
+                logger.warning(
+                    f"Script execution timed out after {timeout}s - "
+                    f"script={self.script_path.name}, timeout={timeout}s"
+                )
+                self.close()
+                return (124, "", "\nTimeout", None, None)
+            except (BrokenPipeError, OSError):
+                line = None
+
+            if line is None:
+                # Worker exited; report its exit status like a one-shot run
+                exit_code = self._process.wait()
+                return (exit_code, "", "Persistent worker exited unexpectedly", None, None)
+
+            response = json.loads(line)
+            return (int(response["exit_code"]), response["stdout"], response["stderr"], None, None)
+
+    def retire(self) -> None:
+        """Stop the worker once a call in progress (if any) has finished."""
+        with self._lock:
+            self.close()
+
+    def close(self) -> None:
+        """Stop the worker process."""
+        if self.alive:
+            self._process.kill()
+        self._process.wait()
+        if self._process.stdin is not None:
+            with contextlib.suppress(OSError):
+                self._process.stdin.close()
+
+
+class ScriptWorkerPool:
+    """Registry of persistent workers for Python scripts.
+
+    Workers are created lazily on first execution and reused for subsequent
+    executions of the same script and working directory. An execution with a
+    different environment replaces the script's worker with a new one, so at
+    most one worker runs per script. All workers are stopped when close() is
+    called, when the pool is garbage collected, or at interpreter exit.
+
+    Example:
+        >>> pool = ScriptWorkerPool()
+        >>> executor = ScriptExecutor(timeout=30, worker_pool=pool)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool and arrange for its workers to be stopped."""
+        self._workers: Dict[WorkerKey, ScriptWorker] = {}
+        self._lock = threading.Lock()
+        # Runs at garbage collection or interpreter exit, whichever comes first,
+        # without keeping the pool alive until exit
+        weakref.finalize(self, _close_workers, self._workers, self._lock)
+
+    @staticmethod
+    def supports(interpreter: str) -> bool:
+        """Return True if scripts for this interpreter can run in a worker.
+
+        Args:
+            interpreter: Interpreter command resolved for the script
+        """
+        return os.path.basename(interpreter).lower().startswith("python")
+
+    def run(
+        self,
+        interpreter: str,
+        script_path: Path,
+        arguments_json: str,
+        env: Dict[str, str],
+        cwd: Path,
+        timeout: float,
+    ) -> WorkerResult:
+        """Execute a script in its persistent worker, starting one if needed.
+
+        Args:
+            interpreter: Python interpreter command
+            script_path: Absolute path to the script
+            arguments_json: JSON arguments passed to the script on stdin
+            env: Environment for the worker; a worker started with a
+                different environment is stopped and replaced
+            cwd: Working directory used when a new worker is started
+            timeout: Maximum execution time in seconds
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr, signal_name, signal_number)
+        """
+        key = (interpreter, str(script_path), str(cwd))
+        stale = None
+        with self._lock:
+            worker = self._workers.get(key)
+            if worker is None or not worker.alive or worker.env != env:
+                stale = worker
+                worker = self._workers[key] = ScriptWorker(interpreter, script_path, env, cwd)
+        if stale is not None:
+            stale.retire()
+        return worker.run(arguments_json, timeout)
+
+    def close(self) -> None:
+        """Stop all workers; later executions start new ones."""
+        _close_workers(self._workers, self._lock)
+
+
+def _close_workers(workers: Dict[WorkerKey, ScriptWorker], lock: threading.Lock) -> None:
+    """Stop and forget all workers of a pool.
+
+    Args:
+        workers: The pool's worker registry
+        lock: The pool's registry lock
+    """
+    with lock:
+        to_close = list(workers.values())
+        workers.clear()
+    for worker in to_close:
+        worker.close()
@@ -29,6 +29,7 @@ Classes:
 
 Constants:
     INTERPRETER_MAP: Mapping of file extensions to interpreters
+    MAX_ARGUMENTS_SIZE: Maximum serialized argument size in bytes
 
 Version:
     Added in v0.3.0
@@ -43,10 +44,11 @@ import subprocess
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping
 
 if TYPE_CHECKING:
     from skillkit.core.models import SkillMetadata
+    from skillkit.core.script_workers import ScriptWorkerPool
 
 # Type aliases for clarity
 ScriptArguments = Dict[str, Any]
@@ -70,6 +72,14 @@ INTERPRETER_MAP: Dict[str, str] = {
     ".ps1": "powershell",  # PowerShell (cross-platform)
 }
 
+# Maximum serialized argument payload written to script stdin (10MB)
+MAX_ARGUMENTS_SIZE = 10_000_000
+
+# Shared JSON encoder for script arguments. json.dumps() builds a new encoder on
+# every call when given non-default options; compact separators also shrink
+# the payload scripts have to parse.
+_ARGUMENTS_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -345,6 +355,40 @@ class ScriptExecutionResult:
         return self.signal is not None
 
 
+def build_script_environment(
+    base_env: Mapping[str, str],
+    skill_metadata: "SkillMetadata",
+    skill_base_dir: Path,
+) -> ScriptEnvironment:
+    """Build the environment for a skill's scripts.
+
+    Args:
+        base_env: Base environment to copy (e.g. os.environ)
+        skill_metadata: SkillMetadata instance
+        skill_base_dir: Base directory of the skill
+
+    Returns:
+        New environment dict: base_env plus the injected skill variables
+
+    Injects:
+        - SKILL_NAME: Name of the skill
+        - SKILL_BASE_DIR: Absolute path to skill directory
+        - SKILL_VERSION: Version from metadata (if available)
+        - SKILLKIT_VERSION: Current skillkit version
+    """
+    import skillkit
+
+    env = dict(base_env)
+
+    # Inject skill metadata
+    env["SKILL_NAME"] = skill_metadata.name
+    env["SKILL_BASE_DIR"] = str(skill_base_dir)
+    env["SKILLKIT_VERSION"] = skillkit.__version__
+    env["SKILL_VERSION"] = skill_metadata.version or "0.0.0"
+
+    return env
+
+
 def _get_script_type(file_path: Path) -> str:
     """Map file extension to script type.
 
@@ -756,6 +800,7 @@ class ScriptExecutor:
         timeout: int = 30,
         max_output_size: int = 10_000_000,
         use_cache: bool = False,
+        worker_pool: "ScriptWorkerPool | None" = None,
     ):
         """Initialize script executor.
 
@@ -763,10 +808,13 @@ class ScriptExecutor:
             timeout: Maximum execution time in seconds (default: 30)
             max_output_size: Maximum output size in bytes (default: 10MB)
             use_cache: Enable execution result caching (default: False)
+            worker_pool: Run Python scripts in persistent workers from this pool
+                instead of a new interpreter per call (default: None)
         """
         self.timeout = timeout
         self.max_output_size = max_output_size
         self.use_cache = use_cache
+        self.worker_pool = worker_pool
 
     def _validate_script_path(self, script_path: Path, skill_base_dir: Path) -> Path:
         """Validate script path and prevent path traversal attacks.
@@ -951,14 +999,16 @@ class ScriptExecutor:
         from skillkit.core.exceptions import ArgumentSerializationError, ArgumentSizeError
 
         try:
-            serialized = json.dumps(arguments, ensure_ascii=False, indent=None)
+            serialized = _ARGUMENTS_ENCODER.encode(arguments)
         except (TypeError, ValueError) as e:
             raise ArgumentSerializationError(f"Cannot serialize arguments to JSON: {e}") from e
 
-        # Check size limit (10MB)
-        size_bytes = len(serialized.encode("utf-8"))
-        if size_bytes > 10_000_000:
-            raise ArgumentSizeError(f"Arguments too large: {size_bytes} bytes (max 10MB)")
+        # Check size limit (10MB). UTF-8 uses at most 4 bytes per character, so
+        # the payload only needs encoding to measure it when it could be near the limit.
+        if len(serialized) * 4 > MAX_ARGUMENTS_SIZE:
+            size_bytes = len(serialized.encode("utf-8"))
+            if size_bytes > MAX_ARGUMENTS_SIZE:
+                raise ArgumentSizeError(f"Arguments too large: {size_bytes} bytes (max 10MB)")
 
         return serialized
 
@@ -980,17 +1030,7 @@ class ScriptExecutor:
             - SKILL_VERSION: Version from metadata (if available)
             - SKILLKIT_VERSION: Current skillkit version
         """
-        import skillkit
-
-        env = os.environ.copy()
-
-        # Inject skill metadata
-        env["SKILL_NAME"] = skill_metadata.name
-        env["SKILL_BASE_DIR"] = str(skill_base_dir)
-        env["SKILLKIT_VERSION"] = skillkit.__version__
-        env["SKILL_VERSION"] = skill_metadata.version or "0.0.0"
-
-        return env
+        return build_script_environment(os.environ, skill_metadata, skill_base_dir)
 
     def _execute_subprocess(
         self,
@@ -1017,6 +1057,11 @@ class ScriptExecutor:
             - Uses list-based arguments (no shell interpretation)
             - Enforces timeout
         """
+        if self.worker_pool is not None and self.worker_pool.supports(interpreter):
+            return self.worker_pool.run(
+                interpreter, script_path, arguments_json, env, skill_base_dir, self.timeout
+            )
+
         try:
             result = subprocess.run(
                 [interpreter, str(script_path)],
@@ -1119,6 +1164,7 @@ class ScriptExecutor:
         arguments: ScriptArguments,
         skill_base_dir: Path,
         skill_metadata: "SkillMetadata",
+        env: ScriptEnvironment | None = None,
     ) -> ScriptExecutionResult:
         """Execute a script with security controls.
 
@@ -1127,6 +1173,9 @@ class ScriptExecutor:
             arguments: Arguments to pass as JSON via stdin
             skill_base_dir: Base directory of the skill
             skill_metadata: SkillMetadata instance
+            env: Prebuilt environment (default: built from os.environ and
+                skill_metadata via build_script_environment()); passed to the
+                subprocess as-is and never mutated
 
         Returns:
             ScriptExecutionResult with execution details
@@ -1164,8 +1213,9 @@ class ScriptExecutor:
         # Serialize arguments
         arguments_json = self._serialize_arguments(arguments)
 
-        # Build environment
-        env = self._build_environment(skill_metadata, skill_base_dir)
+        # Build environment (unless the caller reuses a prebuilt one)
+        if env is None:
+            env = self._build_environment(skill_metadata, skill_base_dir)
 
         # Execute subprocess
         exit_code, stdout, stderr, signal_name, signal_number = self._execute_subprocess(
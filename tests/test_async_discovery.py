@@ -18,6 +18,15 @@ from skillkit.core.exceptions import AsyncStateError
 from skillkit.core.models import InitMode
 
 
+def _write_skill(skills_dir: Path, name: str, description: str) -> None:
+    """Create skills_dir/<name>/SKILL.md with minimal frontmatter."""
+    skill_dir = skills_dir / name
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n\nContent\n"
+    )
+
+
 class TestAsyncFileIO:
     """Test async file I/O wrappers."""
 
@@ -87,6 +96,21 @@ class TestAsyncDiscovery:
         assert len(skill_files) == len(sync_files)
         assert set(skill_files) == set(sync_files)
 
+    @pytest.mark.asyncio
+    async def test_aiter_skill_files_matches_adiscover_skills(self, fixtures_dir):
+        """Test that streamed paths match the materialized list, in order."""
+        from skillkit.core.models import SkillSource, SourceType
+
+        discovery = SkillDiscovery()
+        source = SkillSource(
+            source_type=SourceType.PROJECT, directory=fixtures_dir / "skills", priority=100
+        )
+
+        streamed = [skill_file async for skill_file in discovery.aiter_skill_files(source)]
+
+        assert streamed
+        assert streamed == await discovery.adiscover_skills(source)
+
     @pytest.mark.asyncio
     async def test_async_discovery_performance(self, fixtures_dir):
         """Test that async discovery doesn't block event loop."""
@@ -178,6 +202,87 @@ class TestSkillManagerAsync:
         # Results should be identical
         assert sync_skills == async_skills
 
+    @pytest.mark.asyncio
+    async def test_adiscover_concurrent_sources_keep_priority(self, tmp_path, monkeypatch):
+        """Test that the highest priority source wins even if it finishes scanning last."""
+        project_dir = tmp_path / "project"
+        extra_dir = tmp_path / "extra"
+        _write_skill(project_dir, "shared", "From project")
+        _write_skill(extra_dir, "shared", "From extra")
+
+        manager = SkillManager(
+            project_skill_dir=project_dir,
+            anthropic_config_dir="",
+            plugin_dirs=[],
+            additional_search_paths=[extra_dir],
+        )
+        original = manager._discovery.aiter_skill_files
+
+        async def slow_project_scan(source):
+            if source.directory == project_dir.resolve():
+                await asyncio.sleep(0.05)
+            async for skill_file in original(source):
+                yield skill_file
+
+        monkeypatch.setattr(manager._discovery, "aiter_skill_files", slow_project_scan)
+        await manager.adiscover()
+
+        assert manager.get_skill("shared").description == "From project"
+
+    @pytest.mark.asyncio
+    async def test_adiscover_failing_source_is_skipped(self, tmp_path, monkeypatch):
+        """Test that a source whose scan raises is logged and skipped."""
+        project_dir = tmp_path / "project"
+        extra_dir = tmp_path / "extra"
+        project_dir.mkdir()
+        _write_skill(extra_dir, "kept", "Kept skill")
+
+        manager = SkillManager(
+            project_skill_dir=project_dir,
+            anthropic_config_dir="",
+            plugin_dirs=[],
+            additional_search_paths=[extra_dir],
+        )
+        _write_skill(project_dir, "dropped", "Found before the scan failed")
+        original = manager._discovery.aiter_skill_files
+
+        async def failing_project_scan(source):
+            async for skill_file in original(source):
+                yield skill_file
+            if source.directory == project_dir.resolve():
+                raise OSError("scan failed")
+
+        monkeypatch.setattr(manager._discovery, "aiter_skill_files", failing_project_scan)
+        await manager.adiscover()
+
+        assert [s.name for s in manager.list_skills()] == ["kept"]
+
+    @pytest.mark.asyncio
+    async def test_adiscover_parses_off_event_loop(self, tmp_path, monkeypatch):
+        """Test that SKILL.md parsing runs in worker threads, not on the loop thread."""
+        import threading
+
+        for i in range(5):
+            _write_skill(tmp_path, f"skill-{i}", f"Skill {i}")
+        (tmp_path / "broken").mkdir()
+        (tmp_path / "broken" / "SKILL.md").write_text("no frontmatter")
+
+        manager = SkillManager(
+            project_skill_dir=tmp_path, anthropic_config_dir="", plugin_dirs=[]
+        )
+        original = manager._parser.parse_skill_file
+        parse_threads = set()
+
+        def recording_parse(skill_file):
+            parse_threads.add(threading.get_ident())
+            return original(skill_file)
+
+        monkeypatch.setattr(manager._parser, "parse_skill_file", recording_parse)
+        await manager.adiscover()
+
+        assert len(manager.list_skills()) == 5  # Broken skill logged and skipped
+        assert threading.get_ident() not in parse_threads
+
 
 class TestAsyncStateManagement:
     """Test async/sync state management."""
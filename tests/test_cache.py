@@ -26,7 +26,7 @@ async def test_cache_get_miss_returns_none():
     """
     cache = ContentCache(max_size=10)
 
-    result = await cache.get("skill-name", "args", 1000.0)
+    result = await cache.get("skill-name", "args", 1_000_000_000_000)
 
     assert result is None
 
@@ -43,8 +43,8 @@ async def test_cache_put_and_get_success():
     """
     cache = ContentCache(max_size=10)
 
-    await cache.put("skill-name", "args", "content", 1000.0)
-    result = await cache.get("skill-name", "args", 1000.0)
+    await cache.put("skill-name", "args", "content", 1_000_000_000_000)
+    result = await cache.get("skill-name", "args", 1_000_000_000_000)
 
     assert result == "content"
 
@@ -64,22 +64,22 @@ async def test_cache_lru_eviction_at_capacity():
     cache = ContentCache(max_size=3)
 
     # Fill cache to capacity
-    await cache.put("skill1", "args", "content1", 1000.0)
-    await cache.put("skill2", "args", "content2", 1000.0)
-    await cache.put("skill3", "args", "content3", 1000.0)
+    await cache.put("skill1", "args", "content1", 1_000_000_000_000)
+    await cache.put("skill2", "args", "content2", 1_000_000_000_000)
+    await cache.put("skill3", "args", "content3", 1_000_000_000_000)
 
     # Verify all 3 entries present
     stats = cache.get_stats()
     assert stats.size == 3
 
     # Add 4th entry - should evict skill1 (oldest)
-    await cache.put("skill4", "args", "content4", 1000.0)
+    await cache.put("skill4", "args", "content4", 1_000_000_000_000)
 
     # Verify skill1 evicted, skill4 present
-    result1 = await cache.get("skill1", "args", 1000.0)
+    result1 = await cache.get("skill1", "args", 1_000_000_000_000)
     assert result1 is None  # Evicted
 
-    result4 = await cache.get("skill4", "args", 1000.0)
+    result4 = await cache.get("skill4", "args", 1_000_000_000_000)
     assert result4 == "content4"  # Present
 
     stats = cache.get_stats()
@@ -96,23 +96,23 @@ async def test_cache_lru_move_to_end_on_access():
     cache = ContentCache(max_size=3)
 
     # Fill cache
-    await cache.put("skill1", "args", "content1", 1000.0)
-    await cache.put("skill2", "args", "content2", 1000.0)
-    await cache.put("skill3", "args", "content3", 1000.0)
+    await cache.put("skill1", "args", "content1", 1_000_000_000_000)
+    await cache.put("skill2", "args", "content2", 1_000_000_000_000)
+    await cache.put("skill3", "args", "content3", 1_000_000_000_000)
 
     # Access skill1 (mark as recently used)
-    result = await cache.get("skill1", "args", 1000.0)
+    result = await cache.get("skill1", "args", 1_000_000_000_000)
     assert result == "content1"
 
     # Add skill4 - should evict skill2 (now oldest)
-    await cache.put("skill4", "args", "content4", 1000.0)
+    await cache.put("skill4", "args", "content4", 1_000_000_000_000)
 
     # Verify skill1 still present (was marked recent)
-    result1 = await cache.get("skill1", "args", 1000.0)
+    result1 = await cache.get("skill1", "args", 1_000_000_000_000)
     assert result1 == "content1"
 
     # Verify skill2 evicted
-    result2 = await cache.get("skill2", "args", 1000.0)
+    result2 = await cache.get("skill2", "args", 1_000_000_000_000)
     assert result2 is None
 
 
@@ -125,16 +125,16 @@ async def test_cache_mtime_invalidation():
     """
     cache = ContentCache(max_size=10)
 
-    # Cache content with mtime 1000.0
-    await cache.put("skill", "args", "old_content", 1000.0)
+    # Cache content with mtime 1_000_000_000_000
+    await cache.put("skill", "args", "old_content", 1_000_000_000_000)
 
     # Retrieve with same mtime - cache hit
-    result1 = await cache.get("skill", "args", 1000.0)
+    result1 = await cache.get("skill", "args", 1_000_000_000_000)
     assert result1 == "old_content"
     assert cache.get_stats().hits == 1
 
-    # File modified (mtime increased to 2000.0)
-    result2 = await cache.get("skill", "args", 2000.0)
+    # File modified (mtime increased to 2_000_000_000_000)
+    result2 = await cache.get("skill", "args", 2_000_000_000_000)
     assert result2 is None  # Invalidated
     assert cache.get_stats().misses == 1
 
@@ -151,30 +151,34 @@ async def test_cache_mtime_exact_match_valid():
     """
     cache = ContentCache(max_size=10)
 
-    await cache.put("skill", "args", "content", 1500.5)
+    await cache.put("skill", "args", "content", 1_500_500_000_000)
 
     # Exact mtime match - cache valid
-    result = await cache.get("skill", "args", 1500.5)
+    result = await cache.get("skill", "args", 1_500_500_000_000)
     assert result == "content"
     assert cache.get_stats().hits == 1
 
 
 @pytest.mark.asyncio
-async def test_cache_mtime_newer_cached_valid():
-    """Validate cache hit when cached_mtime >= file_mtime.
+async def test_cache_mtime_older_file_invalidates():
+    """Validate cache miss when the file mtime moves backwards.
 
-    Tests that cached content is valid if cached_mtime is newer
-    than or equal to current file_mtime.
+    Tests that any mtime change invalidates the entry, so a file replaced
+    by an older copy (e.g. a VCS checkout) is not served stale.
     """
     cache = ContentCache(max_size=10)
 
-    # Cache with mtime 2000.0
-    await cache.put("skill", "args", "content", 2000.0)
+    # Cache with mtime 2_000_000_000_000
+    await cache.put("skill", "args", "content", 2_000_000_000_000)
 
-    # File mtime 1500.0 (older than cached) - cache valid
-    result = await cache.get("skill", "args", 1500.0)
-    assert result == "content"
-    assert cache.get_stats().hits == 1
+    # File mtime 1_500_000_000_000 (older than cached) - cache invalid
+    assert cache.peek_sync("skill", "args", 1_500_000_000_000) is None
+    result = await cache.get("skill", "args", 1_500_000_000_000)
+    assert result is None
+    stats = cache.get_stats()
+    assert stats.misses == 1
+    assert stats.invalidations == 1
+    assert stats.size == 0
 
 
 @pytest.mark.asyncio
@@ -195,14 +199,14 @@ async def test_cache_statistics_tracking():
     assert stats.hit_rate == 0.0
 
     # Miss
-    await cache.get("skill", "args", 1000.0)
+    await cache.get("skill", "args", 1_000_000_000_000)
     stats = cache.get_stats()
     assert stats.misses == 1
     assert stats.hit_rate == 0.0  # 0 / 1
 
     # Put and hit
-    await cache.put("skill", "args", "content", 1000.0)
-    await cache.get("skill", "args", 1000.0)
+    await cache.put("skill", "args", "content", 1_000_000_000_000)
+    await cache.get("skill", "args", 1_000_000_000_000)
     stats = cache.get_stats()
     assert stats.hits == 1
     assert stats.misses == 1
@@ -211,7 +215,7 @@ async def test_cache_statistics_tracking():
 
     # Multiple hits
     for _ in range(4):
-        await cache.get("skill", "args", 1000.0)
+        await cache.get("skill", "args", 1_000_000_000_000)
 
     stats = cache.get_stats()
     assert stats.hits == 5
@@ -219,6 +223,27 @@ async def test_cache_statistics_tracking():
     assert stats.hit_rate == 5 / 6  # 5 / (5 + 1)
 
 
+def test_cache_stats_snapshot_reused_while_unchanged():
+    """Validate get_stats() returns the same snapshot until something changes.
+
+    Tests that polling an idle cache does not build new CacheStats objects,
+    and that any hit, miss or size change produces a fresh snapshot.
+    """
+    cache = ContentCache(max_size=10)
+    cache.put_sync("skill", "args", "content", 1000)
+
+    first = cache.get_stats()
+    assert cache.get_stats() is first
+
+    cache.get_sync("skill", "args", 1000)
+    second = cache.get_stats()
+    assert second is not first
+    assert second.hits == 1
+
+    cache.clear_sync()
+    assert cache.get_stats().size == 0
+
+
 @pytest.mark.asyncio
 async def test_cache_clear_all():
     """Validate clear() removes all cache entries.
@@ -229,9 +254,9 @@ async def test_cache_clear_all():
     cache = ContentCache(max_size=10)
 
     # Add multiple entries
-    await cache.put("skill1", "args", "content1", 1000.0)
-    await cache.put("skill2", "args", "content2", 1000.0)
-    await cache.put("skill3", "args", "content3", 1000.0)
+    await cache.put("skill1", "args", "content1", 1_000_000_000_000)
+    await cache.put("skill2", "args", "content2", 1_000_000_000_000)
+    await cache.put("skill3", "args", "content3", 1_000_000_000_000)
 
     stats = cache.get_stats()
     assert stats.size == 3
@@ -245,7 +270,7 @@ async def test_cache_clear_all():
     assert stats.size == 0
 
     # Verify entries removed
-    result = await cache.get("skill1", "args", 1000.0)
+    result = await cache.get("skill1", "args", 1_000_000_000_000)
     assert result is None
 
 
@@ -259,9 +284,9 @@ async def test_cache_clear_specific_skill():
     cache = ContentCache(max_size=10)
 
     # Add entries for multiple skills
-    await cache.put("skill1", "args1", "content1", 1000.0)
-    await cache.put("skill1", "args2", "content2", 1000.0)
-    await cache.put("skill2", "args1", "content3", 1000.0)
+    await cache.put("skill1", "args1", "content1", 1_000_000_000_000)
+    await cache.put("skill1", "args2", "content2", 1_000_000_000_000)
+    await cache.put("skill2", "args1", "content3", 1_000_000_000_000)
 
     stats = cache.get_stats()
     assert stats.size == 3
@@ -271,20 +296,40 @@ async def test_cache_clear_specific_skill():
     assert cleared == 2  # Two entries for skill1
 
     # Verify skill1 entries removed
-    result1 = await cache.get("skill1", "args1", 1000.0)
+    result1 = await cache.get("skill1", "args1", 1_000_000_000_000)
     assert result1 is None
 
-    result2 = await cache.get("skill1", "args2", 1000.0)
+    result2 = await cache.get("skill1", "args2", 1_000_000_000_000)
     assert result2 is None
 
     # Verify skill2 entry still present
-    result3 = await cache.get("skill2", "args1", 1000.0)
+    result3 = await cache.get("skill2", "args1", 1_000_000_000_000)
     assert result3 == "content3"
 
     stats = cache.get_stats()
     assert stats.size == 1
 
 
+def test_cache_clear_specific_skill_after_eviction_and_invalidation():
+    """Validate clear(skill_name) counts only entries still cached.
+
+    Tests that the per-skill key index used by clear(skill_name) is kept in
+    sync when entries are evicted or invalidated.
+    """
+    cache = ContentCache(max_size=3)
+    cache.put_sync("skill1", "a", "c", 1000)
+    cache.put_sync("skill1", "b", "c", 1000)
+    cache.put_sync("skill2", "a", "c", 1000)
+    cache.put_sync("skill2", "b", "c", 1000)  # Evicts ("skill1", "a")
+
+    assert cache.get_sync("skill2", "a", 2000) is None  # Invalidated
+
+    assert cache.clear_sync("skill1") == 1
+    assert cache.clear_sync("skill2") == 1
+    assert cache.clear_sync("skill1") == 0
+    assert cache.get_stats().size == 0
+
+
 @pytest.mark.asyncio
 async def test_cache_different_arguments_separate_entries():
     """Validate different arguments create separate cache entries.
@@ -294,11 +339,11 @@ async def test_cache_different_arguments_separate_entries():
     """
     cache = ContentCache(max_size=10)
 
-    await cache.put("skill", "args1", "content1", 1000.0)
-    await cache.put("skill", "args2", "content2", 1000.0)
+    await cache.put("skill", "args1", "content1", 1_000_000_000_000)
+    await cache.put("skill", "args2", "content2", 1_000_000_000_000)
 
-    result1 = await cache.get("skill", "args1", 1000.0)
-    result2 = await cache.get("skill", "args2", 1000.0)
+    result1 = await cache.get("skill", "args1", 1_000_000_000_000)
+    result2 = await cache.get("skill", "args2", 1_000_000_000_000)
 
     assert result1 == "content1"
     assert result2 == "content2"
@@ -317,17 +362,17 @@ async def test_cache_update_existing_entry():
     cache = ContentCache(max_size=10)
 
     # Initial put
-    await cache.put("skill", "args", "old_content", 1000.0)
+    await cache.put("skill", "args", "old_content", 1_000_000_000_000)
     stats = cache.get_stats()
     assert stats.size == 1
 
     # Update same key
-    await cache.put("skill", "args", "new_content", 2000.0)
+    await cache.put("skill", "args", "new_content", 2_000_000_000_000)
     stats = cache.get_stats()
     assert stats.size == 1  # Still only 1 entry
 
     # Verify updated content
-    result = await cache.get("skill", "args", 2000.0)
+    result = await cache.get("skill", "args", 2_000_000_000_000)
     assert result == "new_content"
 
 
@@ -341,8 +386,8 @@ async def test_cache_concurrent_access_different_skills():
     cache = ContentCache(max_size=100)
 
     async def put_and_get(skill_name: str, args: str):
-        await cache.put(skill_name, args, f"content-{skill_name}", 1000.0)
-        result = await cache.get(skill_name, args, 1000.0)
+        await cache.put(skill_name, args, f"content-{skill_name}", 1_000_000_000_000)
+        result = await cache.get(skill_name, args, 1_000_000_000_000)
         assert result == f"content-{skill_name}"
 
     # Launch 10 concurrent tasks
@@ -373,3 +418,145 @@ async def test_cache_empty_after_initialization():
     assert stats.hits == 0
     assert stats.misses == 0
     assert stats.hit_rate == 0.0
+    assert stats.evictions == 0
+    assert stats.invalidations == 0
+
+
+def test_cache_sync_methods_without_event_loop():
+    """Validate the *_sync methods work from plain synchronous code."""
+    cache = ContentCache(max_size=10)
+
+    cache.put_sync("skill-a", "args", "content", 1_000_000_000_000)
+
+    assert cache.get_sync("skill-a", "args", 1_000_000_000_000) == "content"
+    assert cache.peek_sync("skill-a", "args", 1_000_000_000_000) == "content"
+    assert cache.get_sync("skill-a", "args", 2_000_000_000_000) is None  # Stale
+    stats = cache.get_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+    cache.put_sync("skill-a", "args", "content", 2_000_000_000_000)
+    assert cache.clear_sync("skill-a") == 1
+    assert cache.get_stats().size == 0
+
+
+def test_cache_shared_across_threads_and_event_loops():
+    """Validate one cache can be used from several threads and event loops.
+
+    Tests that the cache is not bound to a single event loop and that
+    concurrent puts/gets from worker threads keep the LRU bound intact.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = ContentCache(max_size=20)
+
+    async def worker(thread_id: int) -> None:
+        for i in range(50):
+            await cache.put(f"skill-{thread_id}", f"args-{i}", "content", 1_000_000_000_000)
+            await cache.get(f"skill-{thread_id}", f"args-{i}", 1_000_000_000_000)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda t: asyncio.run(worker(t)), range(4)))
+
+    stats = cache.get_stats()
+    assert stats.size == 20
+    assert stats.max_size == 20
+
+
+@pytest.mark.asyncio
+async def test_cache_eviction_and_invalidation_counters():
+    """Validate evictions and invalidations are tracked separately.
+
+    Tests that LRU evictions and mtime-triggered invalidations each
+    increment their own counter in CacheStats.
+    """
+    cache = ContentCache(max_size=2)
+
+    await cache.put("skill1", "args", "content1", 1_000_000_000_000)
+    await cache.put("skill2", "args", "content2", 1_000_000_000_000)
+    await cache.put("skill3", "args", "content3", 1_000_000_000_000)  # Evicts skill1
+
+    # Re-putting an existing key is an update, not an eviction
+    await cache.put("skill3", "args", "content3b", 1_000_000_000_000)
+
+    stats = cache.get_stats()
+    assert stats.evictions == 1
+    assert stats.invalidations == 0
+
+    # File modified - stale entry invalidated
+    assert await cache.get("skill2", "args", 2_000_000_000_000) is None
+
+    stats = cache.get_stats()
+    assert stats.evictions == 1
+    assert stats.invalidations == 1
+    assert stats.size == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_metrics_sink_receives_events():
+    """Validate every hit, miss, eviction and invalidation reaches the sink."""
+    from collections import Counter
+
+    from skillkit.core.metrics import (
+        CACHE_EVICTIONS,
+        CACHE_HITS,
+        CACHE_INVALIDATIONS,
+        CACHE_MISSES,
+    )
+
+    events: Counter[str] = Counter()
+    cache = ContentCache(max_size=1, metrics_sink=lambda name, value: events.update({name: value}))
+
+    await cache.get("skill1", "args", 1_000_000_000_000)  # Miss
+    await cache.put("skill1", "args", "content1", 1_000_000_000_000)
+    await cache.get("skill1", "args", 1_000_000_000_000)  # Hit
+    await cache.put("skill2", "args", "content2", 1_000_000_000_000)  # Evicts skill1
+    await cache.get("skill2", "args", 2_000_000_000_000)  # Invalidation + miss
+
+    assert events == {CACHE_MISSES: 2, CACHE_HITS: 1, CACHE_EVICTIONS: 1, CACHE_INVALIDATIONS: 1}
+
+
+@pytest.mark.asyncio
+async def test_cache_metrics_sink_failure_does_not_break_lookup():
+    """Validate a failing metrics sink is logged, not raised."""
+
+    def broken_sink(name: str, value: int) -> None:
+        raise RuntimeError("collector down")
+
+    cache = ContentCache(max_size=10, metrics_sink=broken_sink)
+    await cache.put("skill1", "args", "content1", 1_000_000_000_000)
+
+    assert await cache.get("skill1", "args", 1_000_000_000_000) == "content1"
+    assert cache.get_stats().hits == 1
+
+
+def test_counter_metrics_sink_adapts_inc_and_add():
+    """Validate CounterMetricsSink drives Prometheus- and OTel-style counters."""
+    from skillkit.core.metrics import CACHE_HITS, CACHE_MISSES, CounterMetricsSink
+
+    class PrometheusStyle:
+        def __init__(self):
+            self.value = 0
+
+        def inc(self, amount=1):
+            self.value += amount
+
+    class OpenTelemetryStyle:
+        def __init__(self):
+            self.value = 0
+
+        def add(self, amount, attributes=None):
+            self.value += amount
+
+    hits, misses = PrometheusStyle(), OpenTelemetryStyle()
+    sink = CounterMetricsSink({CACHE_HITS: hits, CACHE_MISSES: misses})
+
+    sink(CACHE_HITS, 1)
+    sink(CACHE_MISSES, 2)
+    sink("unregistered_metric", 1)  # Ignored
+
+    assert hits.value == 1
+    assert misses.value == 2
+
+    with pytest.raises(TypeError):
+        CounterMetricsSink({CACHE_HITS: object()})
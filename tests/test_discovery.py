@@ -125,3 +125,43 @@ def test_discover_skips_invalid_skills_gracefully(
 
     # Should discover the valid skill and skip the invalid one
     assert "valid-skill" in discovered
+
+
+def test_find_skill_files_reuses_unchanged_directory_listings(
+    temp_skills_dir: Path, skill_factory: callable, monkeypatch
+) -> None:
+    """Test that re-discovery skips listing directories whose mtime is unchanged."""
+    import os
+
+    from skillkit.core import discovery as discovery_module
+    from skillkit.core.discovery import SkillDiscovery
+
+    skill_factory("skill-a", "First skill", "Content A")
+
+    # Age the tree beyond the racy-mtime window so listings are memoized
+    old = 1_000_000_000
+    for path in (temp_skills_dir, temp_skills_dir / "skill-a"):
+        os.utime(path, (old, old))
+
+    discovery = SkillDiscovery()
+    first = discovery.find_skill_files(temp_skills_dir)
+    assert [p.name for p in first] == ["SKILL.md"]
+
+    scandir_calls: list = []
+    original_scandir = os.scandir
+
+    def tracked_scandir(path):
+        scandir_calls.append(path)
+        return original_scandir(path)
+
+    monkeypatch.setattr(discovery_module.os, "scandir", tracked_scandir)
+
+    # Unchanged tree: no directory is re-listed
+    assert discovery.find_skill_files(temp_skills_dir) == first
+    assert scandir_calls == []
+
+    # Adding a skill bumps the root mtime, so the root is re-listed
+    skill_factory("skill-b", "Second skill", "Content B")
+    second = discovery.find_skill_files(temp_skills_dir)
+    assert len(second) == 2
+    assert temp_skills_dir in [Path(p) for p in scandir_calls]
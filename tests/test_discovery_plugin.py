@@ -6,6 +6,9 @@ This module tests:
 - Graceful error handling for malformed manifests
 """
 
+import json
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -99,6 +102,42 @@ class TestDiscoverPluginManifest:
 
         assert result is None
 
+    def test_discover_reuses_parse_until_manifest_changes(self, tmp_path):
+        """Test unchanged manifests are served from cache and edits reparse."""
+        manifest_dir = tmp_path / "plugin" / ".claude-plugin"
+        manifest_dir.mkdir(parents=True)
+        manifest_file = manifest_dir / "plugin.json"
+
+        def write_manifest(version: str, age: int) -> None:
+            manifest_file.write_text(
+                json.dumps(
+                    {
+                        "manifest_version": "0.1",
+                        "name": "cached-plugin",
+                        "version": version,
+                        "description": "Cache test",
+                        "author": {"name": "Test"},
+                        "skills": ["skills/"],
+                    }
+                )
+            )
+            # Age the file past the racy-mtime window so it is cacheable
+            old = time.time() - age
+            os.utime(manifest_file, (old, old))
+
+        write_manifest("1.0.0", age=120)
+        first = discover_plugin_manifest(tmp_path / "plugin")
+        second = discover_plugin_manifest(tmp_path / "plugin")
+
+        assert first is not None
+        assert second is first
+
+        write_manifest("1.0.1", age=60)
+        third = discover_plugin_manifest(tmp_path / "plugin")
+
+        assert third is not None
+        assert third.version == "1.0.1"
+
 
 class TestSkillDiscoveryWithPlugins:
     """Test SkillDiscovery with plugin sources."""
@@ -240,3 +240,19 @@ def test_windows_line_endings_handled_on_unix(temp_skills_dir: Path):
     # Invocation should work
     result = skill.invoke(arguments="test")
     assert "Content with test" in result
+
+
+def test_invoke_skill_decodes_bom_and_line_endings(temp_skills_dir: Path):
+    """Test that invoke_skill() strips a BOM and normalizes CRLF/CR newlines."""
+    skill_dir = temp_skills_dir / "bom-skill"
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    raw = "---\r\nname: bom-skill\r\ndescription: BOM\r\n---\r\nLine one\r\nLine two\rDo $ARGUMENTS\r\n"
+    (skill_dir / "SKILL.md").write_bytes(b"\xef\xbb\xbf" + raw.encode("utf-8"))
+
+    manager = SkillManager(str(temp_skills_dir))
+    manager.discover()
+    result = manager.invoke_skill("bom-skill", "it")
+
+    assert "\ufeff" not in result
+    assert "\r" not in result
+    assert result.endswith("---\nLine one\nLine two\nDo it\n")
@@ -8,6 +8,7 @@ import asyncio
 import pytest
 from pathlib import Path
 
+from skillkit.core import manager as manager_module
 from skillkit.core.manager import SkillManager
 from skillkit.core.models import SkillMetadata, Skill
 from skillkit.core.exceptions import SkillNotFoundError, ContentLoadError, ConfigurationError
@@ -34,6 +35,11 @@ def test_manager_list_skills_returns_list(sample_skills):
     assert len(skills) > 0
     assert all(isinstance(skill, SkillMetadata) for skill in skills)
 
+    # Each call returns a fresh list; mutating it does not affect the registry
+    count = len(skills)
+    skills.clear()
+    assert len(manager.list_skills()) == count
+
 
 # T050: test_manager_get_skill_by_name
 def test_manager_get_skill_by_name(sample_skills):
@@ -396,6 +402,43 @@ def test_scenario_7_explicit_invalid_raises_error(tmp_path):
     assert "does not exist" in error_message
 
 
+def test_conflict_warning_names_owning_source(tmp_path, caplog):
+    """Test the conflict warning reports the source of the kept skill."""
+    import logging
+
+    project_dir = tmp_path / "skills"
+    # Sibling directory whose path contains the project path as a substring
+    extra_dir = tmp_path / "skills-extra"
+    for skills_dir, description in ((project_dir, "Project"), (extra_dir, "Extra")):
+        (skills_dir / "shared").mkdir(parents=True)
+        (skills_dir / "shared" / "SKILL.md").write_text(
+            f"---\nname: shared\ndescription: {description}\n---\nContent"
+        )
+
+    manager = SkillManager(
+        project_skill_dir=project_dir,
+        anthropic_config_dir="",
+        plugin_dirs=[],
+        additional_search_paths=[extra_dir],
+    )
+    with caplog.at_level(logging.WARNING):
+        manager.discover()
+
+    assert manager.get_skill("shared").description == "Project"
+    assert "(source: project, priority: 100)" in caplog.text
+
+
+def test_explicit_path_to_file_raises_error(tmp_path):
+    """Test that an explicitly configured path to a regular file is rejected."""
+    not_a_dir = tmp_path / "file.txt"
+    not_a_dir.write_text("not a directory")
+
+    with pytest.raises(ConfigurationError) as exc_info:
+        SkillManager(project_skill_dir="", additional_search_paths=[not_a_dir])
+
+    assert exc_info.value.parameter_name == "additional_search_paths"
+
+
 def test_scenario_8_empty_string_opt_out(tmp_path, monkeypatch, caplog):
     """Scenario 8: Explicit opt-out with empty strings and empty lists.
 
@@ -520,6 +563,116 @@ def test_cache_hit_on_repeated_invocation(fixtures_dir):
     assert content1 == content2
 
 
+def test_cold_miss_skips_separate_mtime_stat(fixtures_dir, monkeypatch):
+    """Validate a miss with no cached entry reads the mtime with the content.
+
+    Only lookups that have an entry to validate fetch the mtime separately.
+    """
+    manager = SkillManager(skill_dir=fixtures_dir)
+    manager.discover()
+    skill_name = manager.list_skills()[0].name
+
+    mtime_lookups = []
+    original = manager._get_file_mtime_sync
+
+    def counting_mtime(file_path):
+        mtime_lookups.append(file_path)
+        return original(file_path)
+
+    monkeypatch.setattr(manager, "_get_file_mtime_sync", counting_mtime)
+
+    manager.invoke_skill(skill_name, "test-args")
+    assert mtime_lookups == []
+    assert manager.get_cache_stats().misses == 1
+
+    manager.invoke_skill(skill_name, "test-args")
+    assert len(mtime_lookups) == 1
+    assert manager.get_cache_stats().hits == 1
+
+
+def test_new_arguments_miss_reuses_base_content(tmp_path, monkeypatch):
+    """Validate a miss on new arguments does not re-read an unchanged file.
+
+    The base-directory-prefixed content is remembered per skill and only
+    re-read after the file's mtime changes.
+    """
+    import os
+
+    skill_dir = tmp_path / "reuse-skill"
+    skill_dir.mkdir()
+    skill_file = skill_dir / "SKILL.md"
+    skill_file.write_text("---\nname: reuse-skill\ndescription: Test\n---\nDo $ARGUMENTS\n")
+
+    manager = SkillManager(project_skill_dir=tmp_path)
+    manager.discover()
+
+    reads = []
+    original = manager_module._read_skill_file
+
+    def counting_read(file_path):
+        reads.append(file_path)
+        return original(file_path)
+
+    monkeypatch.setattr(manager_module, "_read_skill_file", counting_read)
+
+    assert manager.invoke_skill("reuse-skill", "one").endswith("Do one\n")
+    assert manager.invoke_skill("reuse-skill", "two").endswith("Do two\n")
+    assert len(reads) == 1
+    assert manager.get_cache_stats().misses == 2
+
+    skill_file.write_text("---\nname: reuse-skill\ndescription: Test\n---\nRedo $ARGUMENTS\n")
+    mtime = skill_file.stat().st_mtime
+    os.utime(skill_file, (mtime + 10, mtime + 10))
+
+    assert manager.invoke_skill("reuse-skill", "three").endswith("Redo three\n")
+    assert len(reads) == 2
+
+
+def test_same_mtime_size_change_invalidates_cache(tmp_path):
+    """Validate an edit that preserves the mtime is still detected.
+
+    Tests that the cache validator includes the file size, so content
+    rewritten with its old mtime restored (cp -p, checkouts) is reloaded.
+    """
+    import os
+
+    skill_dir = tmp_path / "keep-mtime"
+    skill_dir.mkdir()
+    skill_file = skill_dir / "SKILL.md"
+    skill_file.write_text("---\nname: keep-mtime\ndescription: Test\n---\nOld\n")
+
+    manager = SkillManager(project_skill_dir=tmp_path)
+    manager.discover()
+    assert manager.invoke_skill("keep-mtime").endswith("Old\n")
+
+    st = skill_file.stat()
+    skill_file.write_text("---\nname: keep-mtime\ndescription: Test\n---\nNew body\n")
+    os.utime(skill_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert manager.invoke_skill("keep-mtime").endswith("New body\n")
+    assert manager.get_cache_stats().invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_invoke_skill_uses_cache_inside_running_event_loop(fixtures_dir):
+    """Validate invoke_skill() caches even when called under an event loop.
+
+    The cache is used through its sync methods, so there is no asyncio.run()
+    that would fail inside a running loop.
+    """
+    manager = SkillManager(skill_dir=fixtures_dir)
+    manager.discover()
+    skill_name = manager.list_skills()[0].name
+
+    content1 = manager.invoke_skill(skill_name, "test-args")
+    content2 = manager.invoke_skill(skill_name, "test-args")
+
+    stats = manager.get_cache_stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert content1 == content2
+
+
 def test_cache_miss_on_different_arguments(fixtures_dir):
     """Validate cache miss when arguments differ.
 
@@ -586,6 +739,48 @@ def test_cache_invalidation_on_file_modification(fixtures_dir):
     assert stats3.hits == 1
 
 
+def test_cache_stat_ttl_skips_recent_mtime_checks(temp_skills_dir, skill_factory, monkeypatch):
+    """Validate stat_ttl trusts a recently checked mtime.
+
+    Tests that within the TTL window a modified file is still served
+    from cache, and that the change is picked up once the window expires.
+    """
+    import os
+    from types import SimpleNamespace
+
+    # Clock controlled by the test, so the TTL window expires deterministically
+    clock = {"now": 1000.0}
+    monkeypatch.setattr(manager_module, "time", SimpleNamespace(monotonic=lambda: clock["now"]))
+
+    skill_dir = skill_factory("ttl-skill", "TTL test skill", "Content $ARGUMENTS")
+    skill_path = skill_dir / "SKILL.md"
+
+    manager = SkillManager(project_skill_dir=temp_skills_dir, stat_ttl=60.0)
+    manager.discover()
+
+    manager.invoke_skill("ttl-skill", "test")
+    assert manager.get_cache_stats().misses == 1
+
+    # Move mtime forward: within the TTL the remembered mtime is reused
+    stat_result = skill_path.stat()
+    os.utime(skill_path, (stat_result.st_atime, stat_result.st_mtime + 10))
+    manager.invoke_skill("ttl-skill", "test")
+    stats = manager.get_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+    # Let the TTL window pass: the modification is now detected
+    clock["now"] += 61.0
+    manager.invoke_skill("ttl-skill", "test")
+    assert manager.get_cache_stats().misses == 2
+
+
+def test_cache_stat_ttl_negative_raises():
+    """Validate negative stat_ttl is rejected."""
+    with pytest.raises(ValueError):
+        SkillManager(project_skill_dir="", anthropic_config_dir="", stat_ttl=-1.0)
+
+
 def test_processed_content_includes_base_directory(fixtures_dir):
     """Validate processed content includes base directory line.
 
@@ -704,6 +899,22 @@ def test_normalization_multiple_spaces_collapsed(fixtures_dir):
     assert stats3.hits == 2
 
 
+def test_multiline_arguments_substituted_verbatim(temp_skills_dir, skill_factory):
+    """Validate normalization only affects the cache key.
+
+    Tests that multi-line arguments reach the processed content with their
+    line breaks and indentation intact.
+    """
+    skill_factory("code-skill", "Code skill", "Review:\n$ARGUMENTS")
+    manager = SkillManager(project_skill_dir=temp_skills_dir)
+    manager.discover()
+
+    code = "def f():\n    return 1\n"
+    content = manager.invoke_skill("code-skill", code)
+
+    assert content.endswith("Review:\n" + code)
+
+
 def test_normalization_none_and_empty_equivalent(fixtures_dir):
     """Validate None and empty string are equivalent for caching.
 
@@ -797,6 +1008,109 @@ async def test_concurrent_same_skill_serialized(fixtures_dir):
     assert stats.misses == 10  # All first invocations
 
 
+@pytest.mark.asyncio
+async def test_concurrent_same_key_reads_file_once(fixtures_dir, monkeypatch):
+    """Validate concurrent misses on the same key are coalesced.
+
+    Tests that a stampede of identical invocations reads the skill file
+    only once and that the per-key lock registry is emptied afterwards.
+    """
+    manager = SkillManager(skill_dir=fixtures_dir)
+    await manager.adiscover()
+    skill_name = manager.list_skills()[0].name
+
+    read_count = {"count": 0}
+    original_read = manager_module._read_skill_file
+
+    def tracked_read(file_path):
+        read_count["count"] += 1
+        return original_read(file_path)
+
+    monkeypatch.setattr(manager_module, "_read_skill_file", tracked_read)
+
+    results = await asyncio.gather(
+        *[manager.ainvoke_skill(skill_name, "same-args") for _ in range(10)]
+    )
+
+    assert len(set(results)) == 1
+    assert read_count["count"] == 1
+    assert manager.get_cache_stats().size == 1
+    assert manager._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_same_key_cancelled_caller_does_not_cancel_load(
+    fixtures_dir, monkeypatch
+):
+    """Validate cancelling one caller leaves the shared load running.
+
+    Tests that a coalesced caller being cancelled does not cancel the
+    in-flight load awaited by the other callers, and that a failed load
+    is reported to every waiter.
+    """
+    manager = SkillManager(skill_dir=fixtures_dir)
+    await manager.adiscover()
+    skill_name = manager.list_skills()[0].name
+
+    first = asyncio.ensure_future(manager.ainvoke_skill(skill_name, "shared"))
+    second = asyncio.ensure_future(manager.ainvoke_skill(skill_name, "shared"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    result = await second
+    assert "Base directory for this skill" in result
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    def failing_read(file_path):
+        raise ContentLoadError(f"boom: {file_path}")
+
+    # Forget the remembered content so the next miss has to read the file
+    await manager.aclear_cache(skill_name)
+    monkeypatch.setattr(manager_module, "_read_skill_file", failing_read)
+    results = await asyncio.gather(
+        *[manager.ainvoke_skill(skill_name, "fails") for _ in range(3)],
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, ContentLoadError) for r in results)
+    assert manager._inflight == {}
+
+
+def test_threaded_same_key_reads_file_once(fixtures_dir, monkeypatch):
+    """Validate concurrent sync invocations from threads are coalesced.
+
+    Tests that invoke_skill() serializes identical cache misses with a
+    per-key threading lock and cleans the lock registry afterwards.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    manager = SkillManager(skill_dir=fixtures_dir)
+    manager.discover()
+    skill_name = manager.list_skills()[0].name
+
+    read_count = {"count": 0}
+    original_read = manager_module._read_skill_file
+    barrier = threading.Barrier(4)
+
+    def tracked_read(file_path):
+        read_count["count"] += 1
+        return original_read(file_path)
+
+    monkeypatch.setattr(manager_module, "_read_skill_file", tracked_read)
+
+    def invoke() -> str:
+        barrier.wait()
+        return manager.invoke_skill(skill_name, "same-args")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: invoke(), range(4)))
+
+    assert len(set(results)) == 1
+    assert read_count["count"] == 1
+    assert manager._sync_key_locks == {}
+
+
 @pytest.mark.asyncio
 async def test_concurrent_different_skills_parallel(fixtures_dir):
     """Validate concurrent invocations of different skills run in parallel.
@@ -855,6 +1169,71 @@ async def test_concurrent_cache_statistics_accurate(fixtures_dir):
     assert stats.hit_rate == 10 / 11
 
 
+@pytest.mark.asyncio
+async def test_adiscover_prewarm_fills_free_cache_slots(temp_skills_dir, skill_factory):
+    """Validate adiscover(prewarm=True) caches no-argument content up to capacity.
+
+    Tests that prewarmed skills are cache hits on first invocation and that
+    prewarming stops at max_cache_size instead of evicting.
+    """
+    for i in range(3):
+        skill_factory(f"warm-skill-{i}", f"Prewarm test skill {i}", "Content $ARGUMENTS")
+
+    manager = SkillManager(project_skill_dir=temp_skills_dir, max_cache_size=2)
+    await manager.adiscover(prewarm=True)
+
+    stats = manager.get_cache_stats()
+    assert stats.size == 2
+    assert stats.evictions == 0
+
+    cached_name = next(iter(manager._skills))
+    await manager.ainvoke_skill(cached_name)
+    stats = manager.get_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_aprewarm_cache_named_skills(temp_skills_dir, skill_factory):
+    """Validate aprewarm_cache() loads the named skills and rejects unknown ones."""
+    from skillkit.core.exceptions import SkillNotFoundError
+
+    skill_factory("hot-skill", "Hot path skill", "Hot $ARGUMENTS")
+    skill_factory("cold-skill", "Cold path skill", "Cold $ARGUMENTS")
+
+    manager = SkillManager(project_skill_dir=temp_skills_dir)
+    await manager.adiscover()
+
+    with pytest.raises(SkillNotFoundError):
+        await manager.aprewarm_cache(["hot-skill", "missing-skill"])
+    assert manager.get_cache_stats().size == 0
+
+    assert await manager.aprewarm_cache(["hot-skill"]) == 1
+    await manager.ainvoke_skill("hot-skill")
+    await manager.ainvoke_skill("cold-skill")
+
+    stats = manager.get_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_skills_returns_results_in_request_order(temp_skills_dir, skill_factory):
+    """Validate ainvoke_skills() matches individual ainvoke_skill() results."""
+    skill_factory("first-skill", "First skill", "First: $ARGUMENTS")
+    skill_factory("second-skill", "Second skill", "Second: $ARGUMENTS")
+
+    manager = SkillManager(project_skill_dir=temp_skills_dir)
+    await manager.adiscover()
+
+    requests = [("second-skill", "b"), ("first-skill", "a"), ("second-skill", "b")]
+    results = await manager.ainvoke_skills(requests)
+
+    assert results == [await manager.ainvoke_skill(name, args) for name, args in requests]
+    assert "Second: b" in results[0]
+    assert "First: a" in results[1]
+
+
 # ==============================================================================
 # Phase 5: User Story 3 - Cache Management Methods (T032)
 # ==============================================================================
@@ -12,7 +12,7 @@ from pathlib import Path
 
 import pytest
 
-from skillkit.core.exceptions import SkillNotFoundError
+from skillkit.core.exceptions import ConfigurationError, SkillNotFoundError
 from skillkit.core.manager import SkillManager
 from skillkit.core.models import QualifiedSkillName
 
@@ -97,6 +97,39 @@ class TestSkillManagerPluginSources:
         source_types = {s.source_type.value for s in manager.sources}
         assert "project" in source_types or "plugin" in source_types
 
+    @pytest.mark.asyncio
+    async def test_create_matches_sync_constructor(self):
+        """Test SkillManager.create() builds the same sources as __init__."""
+        valid_plugin = Path("tests/fixtures/plugins/valid-plugin")
+        multi_plugin = Path("tests/fixtures/plugins/multi-dir-plugin")
+
+        if not valid_plugin.exists() or not multi_plugin.exists():
+            pytest.skip("Fixture not found")
+
+        # Duplicate plugin name: disambiguation must follow plugin_dirs order
+        kwargs = {
+            "project_skill_dir": "",
+            "anthropic_config_dir": "",
+            "plugin_dirs": [valid_plugin, multi_plugin, valid_plugin],
+        }
+        expected = SkillManager(**kwargs)
+        manager = await SkillManager.create(**kwargs)
+
+        assert manager.sources == expected.sources
+        assert [s.plugin_name for s in manager.sources] == [
+            "valid-plugin",
+            "multi-dir-plugin",
+            "valid-plugin-2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_rejects_missing_plugin_dir(self, tmp_path):
+        """Test SkillManager.create() raises ConfigurationError like __init__."""
+        with pytest.raises(ConfigurationError) as exc_info:
+            await SkillManager.create(plugin_dirs=[tmp_path / "missing"])
+
+        assert exc_info.value.parameter_name == "plugin_dirs"
+
 
 class TestSkillManagerPluginDiscovery:
     """Test skill discovery from plugins."""
@@ -301,6 +334,46 @@ class TestPluginConflictResolution:
         # Plugin fixture has "test plugin" in description
         assert "plugin" in skill.description.lower()
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_async", [False, True])
+    async def test_list_skills_includes_qualified_name_only_for_conflicts(
+        self, tmp_path, use_async
+    ):
+        """Test include_qualified lists shadowed plugin skills by qualified name."""
+        project_dir = tmp_path / "skills" / "test-skill"
+        project_dir.mkdir(parents=True)
+        (project_dir / "SKILL.md").write_text(
+            "---\nname: test-skill\ndescription: Project version\n---\n"
+        )
+
+        plugin_dir = Path("tests/fixtures/plugins/valid-plugin")
+
+        if not plugin_dir.exists():
+            pytest.skip("Fixture not found")
+
+        manager = SkillManager(
+            project_skill_dir=tmp_path / "skills",
+            anthropic_config_dir="",
+            plugin_dirs=[plugin_dir],
+        )
+        if use_async:
+            await manager.adiscover()
+        else:
+            manager.discover()
+
+        names = manager.list_skills(include_qualified=True)
+
+        assert names.count("test-skill") == 1
+        assert "valid-plugin:test-skill" in names
+
+        # Without the project skill there is no conflict to qualify
+        plugin_only = SkillManager(
+            project_skill_dir="", anthropic_config_dir="", plugin_dirs=[plugin_dir]
+        )
+        plugin_only.discover()
+
+        assert "valid-plugin:test-skill" not in plugin_only.list_skills(include_qualified=True)
+
     def test_multiple_plugins_with_same_skill_name(self):
         """Test conflict resolution between multiple plugins with same skill name."""
         plugin1 = Path("tests/fixtures/plugins/valid-plugin")
@@ -366,6 +439,17 @@ class TestQualifiedSkillNameParsing:
         with pytest.raises(ValueError):
             QualifiedSkillName.parse("plugin:")
 
+    def test_parse_memoizes_short_names(self):
+        """Test repeated short names reuse the parsed instance; long ones still parse."""
+        assert QualifiedSkillName.parse("data-tools:csv-parser") is QualifiedSkillName.parse(
+            "data-tools:csv-parser"
+        )
+
+        long_name = "p:" + "s" * 1000
+        result = QualifiedSkillName.parse(long_name)
+        assert result.plugin == "p"
+        assert result.skill == "s" * 1000
+
 
 class TestPluginIntegrationEndToEnd:
     """End-to-end integration tests."""
@@ -56,6 +56,22 @@ def test_skill_metadata_allowed_tools_optional(fixtures_dir):
     assert isinstance(metadata.allowed_tools, tuple)
 
 
+def test_skill_metadata_base_directory_precomputed(fixtures_dir):
+    """Validate base_directory is derived once from skill_path.
+
+    Tests that base_directory is the SKILL.md parent and does not take part
+    in equality or repr.
+    """
+    skill_path = fixtures_dir / "valid-basic" / "SKILL.md"
+
+    metadata = SkillMetadata(name="s", description="d", skill_path=skill_path)
+
+    assert metadata.base_directory == skill_path.parent
+    assert metadata.base_directory is metadata.base_directory
+    assert metadata == SkillMetadata(name="s", description="d", skill_path=skill_path)
+    assert "base_directory" not in repr(metadata)
+
+
 # T038: test_skill_creation_with_metadata
 def test_skill_creation_with_metadata(fixtures_dir, tmp_path):
     """Validate Skill instantiation with SkillMetadata.
@@ -36,6 +36,69 @@ def test_parse_valid_basic_skill(fixtures_dir):
     assert isinstance(metadata.allowed_tools, tuple)
 
 
+def test_parse_skill_name_is_interned(fixtures_dir):
+    """Validate parsed skill names are interned for cheap cache-key comparisons."""
+    import sys
+
+    metadata = SkillParser().parse_skill_file(fixtures_dir / "valid-basic" / "SKILL.md")
+
+    assert sys.intern("".join(metadata.name)) is metadata.name
+
+
+def test_parse_skill_reads_only_frontmatter_head(tmp_path):
+    """Validate a large body is not read, while long frontmatter still parses."""
+    head_size = SkillParser.FRONTMATTER_READ_SIZE
+
+    large_body = tmp_path / "large-body" / "SKILL.md"
+    large_body.parent.mkdir()
+    # Invalid UTF-8 far past the frontmatter is never decoded during parsing
+    large_body.write_bytes(
+        b"---\nname: large-body\ndescription: Big\n---\n"
+        + b"x" * (head_size * 2)
+        + b"\xff\xfe"
+    )
+
+    long_frontmatter = tmp_path / "long-frontmatter" / "SKILL.md"
+    long_frontmatter.parent.mkdir()
+    long_frontmatter.write_text(
+        f"---\nname: long-frontmatter\ndescription: {'d' * head_size}\n---\nBody\n"
+    )
+
+    parser = SkillParser()
+    assert parser.parse_skill_file(large_body).name == "large-body"
+    metadata = parser.parse_skill_file(long_frontmatter)
+    assert metadata.description == "d" * head_size
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "---\nname: a\n---\nBody",
+        "---\nname: a\n\n\n---\nBody",
+        "---\r\nname: a\r\n---\r\nBody",
+        "---\n\nname: a\n---",
+        "---\nname: a\rb: c\r---\n---",
+        "---\nname: a\nno closing delimiter",
+        "no frontmatter",
+    ],
+)
+def test_split_frontmatter_matches_pattern(content):
+    """Validate the str.find() fast path agrees with FRONTMATTER_PATTERN."""
+    parser = SkillParser()
+    match = SkillParser.FRONTMATTER_PATTERN.match(content)
+
+    assert parser._split_frontmatter(content) == (match.group(1) if match else None)
+
+
+@pytest.mark.asyncio
+async def test_aparse_skill_file(fixtures_dir):
+    """Validate the async parser returns the same metadata as the sync one."""
+    parser = SkillParser()
+    skill_path = fixtures_dir / "valid-basic" / "SKILL.md"
+
+    assert await parser.aparse_skill_file(skill_path) == parser.parse_skill_file(skill_path)
+
+
 # T029: test_parse_valid_skill_with_arguments
 def test_parse_valid_skill_with_arguments(fixtures_dir):
     """Validate $ARGUMENTS placeholder is preserved during parsing.
@@ -464,3 +464,16 @@ class TestFilePathResolverEdgeCases:
         # Verify - should resolve to base_dir/.../file.txt (doesn't exist, but path is safe)
         assert resolved.is_relative_to(base_dir)
         # The ... would be a directory name, not a traversal pattern
+
+    def test_block_sibling_with_shared_prefix(self, tmp_path: Path):
+        """Test sibling directory sharing the base name prefix is rejected."""
+        # Setup - "skill-other" starts with the string "skill"
+        base_dir = tmp_path / "skill"
+        base_dir.mkdir()
+        sibling = tmp_path / "skill-other"
+        sibling.mkdir()
+        (sibling / "secret.txt").write_text("secret")
+
+        # Test & Verify
+        with pytest.raises(PathSecurityError, match="Path traversal attempt detected"):
+            FilePathResolver.resolve_path(base_dir, "../skill-other/secret.txt")
@@ -12,7 +12,10 @@ from skillkit.core.processors import (
     BaseDirectoryProcessor,
     ArgumentSubstitutionProcessor,
     CompositeProcessor,
+    apply_arguments,
+    apply_arguments_template,
     normalize_arguments,
+    split_arguments_template,
 )
 from skillkit.core.exceptions import (
     SizeLimitExceededError,
@@ -159,6 +162,22 @@ def test_substitute_arguments_no_placeholder_with_arguments():
     assert result.endswith("Additional info")
 
 
+# Additional test: Static content skips placeholder detection
+def test_substitute_arguments_static_content_skips_scan(monkeypatch):
+    """Validate content without any "$" skips typo checks and Template parsing."""
+    processor = ArgumentSubstitutionProcessor()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("placeholder scan should be skipped for static content")
+
+    monkeypatch.setattr(processor, "_check_for_typos", fail)
+    monkeypatch.setattr(processor, "_has_placeholder", fail)
+    context = {"arguments": "extra", "skill_name": "test-skill"}
+
+    assert processor.process("Static docs.", context) == "Static docs.\n\nextra"
+    assert processor.process("Static docs.", {"arguments": ""}) == "Static docs."
+
+
 # Additional test: BaseDirectoryProcessor
 def test_base_directory_processor(tmp_path):
     """Validate BaseDirectoryProcessor injects base directory at beginning.
@@ -371,6 +390,25 @@ def test_normalize_arguments_case_preserved():
     assert result != "file.pdf"
 
 
+def test_normalize_arguments_long_input_bypasses_memo():
+    """Validate long arguments are normalized without being memoized.
+
+    Tests that inputs above the memo length limit are still normalized
+    correctly and do not grow the memo.
+    """
+    from skillkit.core.processors import _normalize_memoized
+
+    _normalize_memoized.cache_clear()
+    long_args = "  word  " * 1000
+
+    assert normalize_arguments(long_args) == " ".join(["word"] * 1000)
+    assert _normalize_memoized.cache_info().currsize == 0
+
+    normalize_arguments("  short  ")
+    normalize_arguments("  short  ")
+    assert _normalize_memoized.cache_info().hits == 1
+
+
 @pytest.mark.parametrize("input_args,expected", [
     ("file.pdf", "file.pdf"),
     (" file.pdf", "file.pdf"),
@@ -382,6 +420,7 @@ def test_normalize_arguments_case_preserved():
     ("   ", ""),
     ("", ""),
     (None, ""),
+    ("a\u00a0\u2003b\x1cc", "a b c"),  # Unicode whitespace collapses too
 ])
 def test_normalize_arguments_parametrized(input_args, expected):
     """Parametrized test for normalize_arguments with various inputs.
@@ -391,3 +430,27 @@ def test_normalize_arguments_parametrized(input_args, expected):
     """
     result = normalize_arguments(input_args)
     assert result == expected
+
+
+@pytest.mark.parametrize("content", [
+    "Process $ARGUMENTS now",
+    "$ARGUMENTS at start and end $ARGUMENTS",
+    "No placeholder here",
+    "",
+])
+@pytest.mark.parametrize("arguments", ["file.pdf", "", None])
+def test_apply_arguments_template_matches_apply_arguments(content, arguments):
+    """Validate pre-split substitution gives the same result as apply_arguments().
+
+    Covers placeholders, no placeholder (append / unchanged), empty and
+    None arguments.
+    """
+    template = split_arguments_template(content)
+    assert apply_arguments_template(template, arguments) == apply_arguments(content, arguments)
+
+
+def test_apply_arguments_template_size_limit_enforcement():
+    """Validate pre-split substitution enforces the 1MB argument limit."""
+    template = split_arguments_template("Process $ARGUMENTS")
+    with pytest.raises(SizeLimitExceededError):
+        apply_arguments_template(template, "x" * 1_000_001)
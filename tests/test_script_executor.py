@@ -550,6 +550,17 @@ print("Done")
                 skill_metadata=skill_metadata
             )
 
+    def test_argument_size_limit_counts_utf8_bytes(self):
+        """Test size limit is measured in UTF-8 bytes, not characters."""
+        executor = ScriptExecutor(timeout=5)
+
+        # 3.5M three-byte characters: under 10M characters but over 10MB
+        with pytest.raises(ArgumentSizeError):
+            executor._serialize_arguments({"data": "\u20ac" * 3_500_000})
+
+        # Multi-byte payload under the limit serializes compactly
+        assert executor._serialize_arguments({"data": "\u20ac", "n": 1}) == '{"data":"\u20ac","n":1}'
+
     def test_signal_detection_sigsegv(self, tmp_path):
         """Test detection of SIGSEGV signal (Unix only)."""
         import sys
@@ -420,6 +420,46 @@ class TestScriptExecution:
         assert result.success
         assert "my-skill" in result.stdout
 
+    def test_prebuilt_environment_is_used_as_is(self, tmp_path):
+        """Test that a caller-provided env is passed through unchanged."""
+        from skillkit.core.scripts import build_script_environment
+
+        skill_dir = tmp_path / "skill"
+        skill_dir.mkdir()
+
+        scripts_dir = skill_dir / "scripts"
+        scripts_dir.mkdir()
+        script = scripts_dir / "env.py"
+        script.write_text(
+            "import os; print(f'{os.environ.get(\"SKILL_NAME\")}:{os.environ.get(\"EXTRA\")}')"
+        )
+
+        skill_md = skill_dir / "SKILL.md"
+        skill_md.write_text("# Test")
+
+        skill_metadata = SkillMetadata(
+            name="my-skill",
+            description="Test",
+            skill_path=skill_md,
+            allowed_tools=()
+        )
+        env = build_script_environment(
+            {"PATH": os.environ.get("PATH", ""), "EXTRA": "snapshot"}, skill_metadata, skill_dir
+        )
+        env_before = dict(env)
+
+        result = ScriptExecutor().execute(
+            script_path=script.relative_to(skill_dir),
+            arguments={},
+            skill_base_dir=skill_dir,
+            skill_metadata=skill_metadata,
+            env=env,
+        )
+
+        assert result.success
+        assert result.stdout.strip() == "my-skill:snapshot"
+        assert env == env_before
+
     def test_output_capture(self, tmp_path):
         """Test stdout/stderr capture (T027)."""
         skill_dir = tmp_path / "skill"
@@ -685,6 +725,92 @@ print(json.dumps(result))
             assert result.success
             assert f"script {script_meta.name[-1]}" in result.stdout
 
+    def test_manager_script_lookup_by_name(self, tmp_path):
+        """Test execute_skill_script() dispatch through Skill.scripts_by_name."""
+        from skillkit.core.manager import SkillManager
+
+        skill_dir = tmp_path / "lookup-skill"
+        scripts_dir = skill_dir / "scripts"
+        scripts_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: lookup-skill\ndescription: Lookup\n---\nContent\n"
+        )
+        for name in ("alpha", "beta"):
+            (scripts_dir / f"{name}.py").write_text(f"print('{name}')")
+
+        manager = SkillManager(project_skill_dir=tmp_path)
+        manager.discover()
+
+        skill = manager.load_skill("lookup-skill")
+        assert set(skill.scripts_by_name) == {"alpha", "beta"}
+
+        result = manager.execute_skill_script("lookup-skill", "beta", {})
+        assert result.stdout.strip() == "beta"
+
+        with pytest.raises(ScriptNotFoundError, match="Available scripts: .*alpha"):
+            manager.execute_skill_script("lookup-skill", "gamma", {})
+
+    def test_manager_detects_scripts_once_per_discovery(self, tmp_path, monkeypatch):
+        """Test execute_skill_script() reuses detected scripts until rediscovery."""
+        from skillkit.core.manager import SkillManager
+        from skillkit.core.scripts import ScriptDetector
+
+        skill_dir = tmp_path / "detect-skill"
+        scripts_dir = skill_dir / "scripts"
+        scripts_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: detect-skill\ndescription: Detect\n---\nContent\n"
+        )
+        (scripts_dir / "alpha.py").write_text("print('alpha')")
+
+        calls = {"count": 0}
+        original_detect = ScriptDetector.detect_scripts
+
+        def counting_detect(self, skill_base_dir):
+            calls["count"] += 1
+            return original_detect(self, skill_base_dir)
+
+        monkeypatch.setattr(ScriptDetector, "detect_scripts", counting_detect)
+
+        manager = SkillManager(project_skill_dir=tmp_path)
+        manager.discover()
+
+        manager.execute_skill_script("detect-skill", "alpha", {})
+        manager.execute_skill_script("detect-skill", "alpha", {})
+        assert calls["count"] == 1
+
+        # Scripts added later are picked up by the next discovery
+        (scripts_dir / "beta.py").write_text("print('beta')")
+        manager.discover()
+        result = manager.execute_skill_script("detect-skill", "beta", {})
+        assert result.stdout.strip() == "beta"
+        assert calls["count"] == 2
+
+    def test_manager_scripts_see_current_environment(self, tmp_path, monkeypatch):
+        """Test variables set after manager creation reach scripts."""
+        from skillkit.core.manager import SkillManager
+
+        skill_dir = tmp_path / "env-skill"
+        scripts_dir = skill_dir / "scripts"
+        scripts_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: env-skill\ndescription: Env\n---\nContent\n"
+        )
+        (scripts_dir / "show.py").write_text(
+            "import os; print(f'{os.environ.get(\"SKILL_NAME\")}:{os.environ.get(\"LATE_VAR\")}')"
+        )
+
+        monkeypatch.delenv("LATE_VAR", raising=False)
+        manager = SkillManager(project_skill_dir=tmp_path)
+        manager.discover()
+
+        result = manager.execute_skill_script("env-skill", "show", {})
+        assert result.stdout.strip() == "env-skill:None"
+
+        monkeypatch.setenv("LATE_VAR", "set-later")
+        result = manager.execute_skill_script("env-skill", "show", {})
+        assert result.stdout.strip() == "env-skill:set-later"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -464,6 +464,9 @@ print("Done")
         assert result2.exit_code == 124
         assert result2.timeout is True
 
+        # One reusable executor per distinct timeout
+        assert {t: e.timeout for t, e in manager._script_executors.items()} == {5: 5, 1: 1}
+
     def test_default_timeout_when_custom_not_specified(self, tmp_path):
         """Test that default_script_timeout is used when custom timeout not specified."""
         # Create test skill structure
@@ -604,3 +607,35 @@ print("Completed")
             # Each execution should timeout consistently
             assert result.exit_code == 124
             assert result.timeout is True
+
+
+class TestArgumentKeyNormalization:
+    """Test argument key lowercasing in SkillManager.execute_skill_script()."""
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [{"file_path": "a.pdf"}, {"File_Path": "a.pdf"}],
+    )
+    def test_script_receives_lowercase_keys(self, tmp_path, arguments):
+        """Test that mixed-case and already-lowercase keys both arrive lowercase."""
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("---\nname: test-skill\ndescription: Test\n---\nContent\n")
+
+        scripts_dir = skill_dir / "scripts"
+        scripts_dir.mkdir()
+        (scripts_dir / "echo.py").write_text(
+            "import json, sys\nprint(json.dumps(json.load(sys.stdin)))"
+        )
+
+        manager = SkillManager(project_skill_dir=tmp_path)
+        manager.discover()
+
+        result = manager.execute_skill_script(
+            skill_name="test-skill",
+            script_name="echo",
+            arguments=arguments,
+        )
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {"file_path": "a.pdf"}
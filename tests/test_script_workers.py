@@ -0,0 +1,177 @@
+"""Tests for persistent script workers.
+
+This module validates ScriptWorkerPool and its integration with
+ScriptExecutor and SkillManager(persistent_workers=True).
+"""
+
+import gc
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from skillkit.core.models import SkillMetadata
+from skillkit.core.script_workers import ScriptWorkerPool
+from skillkit.core.scripts import ScriptExecutor
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Script permission checks differ on Windows"
+)
+
+
+@pytest.fixture
+def worker_pool():
+    """Pool that is always shut down after the test."""
+    pool = ScriptWorkerPool()
+    yield pool
+    pool.close()
+
+
+def _make_skill(tmp_path: Path, script_body: str) -> tuple[Path, SkillMetadata]:
+    """Create a skill directory with a single Python script."""
+    (tmp_path / "SKILL.md").write_text("---\nname: worker-skill\ndescription: Test\n---\n")
+    script = tmp_path / "scripts" / "run.py"
+    script.parent.mkdir()
+    script.write_text(script_body)
+    metadata = SkillMetadata(
+        name="worker-skill", description="Test", skill_path=tmp_path / "SKILL.md"
+    )
+    return script, metadata
+
+
+def test_worker_reused_across_executions(tmp_path, worker_pool):
+    """Test that consecutive executions run in the same worker process."""
+    script, metadata = _make_skill(
+        tmp_path,
+        "import json, os, sys\n"
+        "args = json.load(sys.stdin)\n"
+        "print(json.dumps({'pid': os.getpid(), 'name': args['name']}))\n",
+    )
+    executor = ScriptExecutor(timeout=10, worker_pool=worker_pool)
+
+    first = executor.execute(script, {"name": "a"}, tmp_path, metadata)
+    second = executor.execute(script, {"name": "b"}, tmp_path, metadata)
+
+    assert first.success and second.success
+    first_out, second_out = json.loads(first.stdout), json.loads(second.stdout)
+    assert first_out["name"] == "a"
+    assert second_out["name"] == "b"
+    assert first_out["pid"] == second_out["pid"]
+
+
+def test_worker_reports_exit_code_and_stderr(tmp_path, worker_pool):
+    """Test that sys.exit() codes and stderr output are reported per call."""
+    script, metadata = _make_skill(
+        tmp_path,
+        "import sys\nprint('failing', file=sys.stderr)\nsys.exit(3)\n",
+    )
+    executor = ScriptExecutor(timeout=10, worker_pool=worker_pool)
+
+    result = executor.execute(script, {}, tmp_path, metadata)
+
+    assert result.exit_code == 3
+    assert "failing" in result.stderr
+
+
+def test_worker_timeout_kills_and_restarts_worker(tmp_path, worker_pool):
+    """Test that a timed-out call returns 124 and the next call gets a new worker."""
+    script, metadata = _make_skill(
+        tmp_path,
+        "import json, sys, time\n"
+        "if json.load(sys.stdin).get('sleep'):\n"
+        "    time.sleep(30)\n"
+        "print('done')\n",
+    )
+    executor = ScriptExecutor(timeout=1, worker_pool=worker_pool)
+
+    timed_out = executor.execute(script, {"sleep": True}, tmp_path, metadata)
+    assert timed_out.exit_code == 124
+    assert timed_out.timeout
+
+    recovered = executor.execute(script, {"sleep": False}, tmp_path, metadata)
+    assert recovered.success
+    assert recovered.stdout.strip() == "done"
+
+
+def test_worker_restores_process_state_between_calls(tmp_path, worker_pool):
+    """Test that cwd, sys.path and os.environ changes do not leak into the next call."""
+    script, metadata = _make_skill(
+        tmp_path,
+        "import json, os, sys\n"
+        "print(json.dumps({'cwd': os.getcwd(), 'path': 'leaked' in sys.path,\n"
+        "                  'env': os.environ.get('LEAKED_VAR')}))\n"
+        "os.chdir(os.path.dirname(os.getcwd()))\n"
+        "sys.path.append('leaked')\n"
+        "os.environ['LEAKED_VAR'] = '1'\n",
+    )
+    executor = ScriptExecutor(timeout=10, worker_pool=worker_pool)
+
+    first = json.loads(executor.execute(script, {}, tmp_path, metadata).stdout)
+    second = json.loads(executor.execute(script, {}, tmp_path, metadata).stdout)
+
+    assert second == first
+    assert first["path"] is False
+    assert first["env"] is None
+
+
+def test_worker_replaced_when_environment_changes(tmp_path, worker_pool):
+    """Test that a new environment replaces the worker and stops the old process."""
+    script, metadata = _make_skill(
+        tmp_path,
+        "import json, os\n"
+        "print(json.dumps({'pid': os.getpid(), 'value': os.environ.get('POOL_VALUE')}))\n",
+    )
+    executor = ScriptExecutor(timeout=10, worker_pool=worker_pool)
+    base_env = {"PATH": os.environ.get("PATH", "")}
+
+    first = executor.execute(script, {}, tmp_path, metadata, env={**base_env, "POOL_VALUE": "a"})
+    (first_worker,) = worker_pool._workers.values()
+    second = executor.execute(script, {}, tmp_path, metadata, env={**base_env, "POOL_VALUE": "b"})
+    same = executor.execute(script, {}, tmp_path, metadata, env={**base_env, "POOL_VALUE": "b"})
+
+    first_out, second_out, same_out = (json.loads(r.stdout) for r in (first, second, same))
+    assert (first_out["value"], second_out["value"]) == ("a", "b")
+    assert first_out["pid"] != second_out["pid"]
+    assert same_out["pid"] == second_out["pid"]
+    assert not first_worker.alive
+    assert len(worker_pool._workers) == 1
+
+
+def test_pool_stops_workers_when_collected(tmp_path):
+    """Test that dropping the last reference to a pool stops its workers."""
+    script, metadata = _make_skill(tmp_path, "print('ok')\n")
+    pool = ScriptWorkerPool()
+    ScriptExecutor(timeout=10, worker_pool=pool).execute(script, {}, tmp_path, metadata)
+    (worker,) = pool._workers.values()
+
+    del pool
+    gc.collect()
+
+    assert not worker.alive
+
+
+def test_manager_persistent_workers(temp_skills_dir, skill_factory):
+    """Test SkillManager(persistent_workers=True) routes Python scripts to workers."""
+    from skillkit import SkillManager
+
+    skill_dir = skill_factory("worker-skill", "Worker test skill", "Content")
+    scripts_dir = skill_dir / "scripts"
+    scripts_dir.mkdir()
+    (scripts_dir / "echo.py").write_text(
+        "import json, os, sys\nprint(json.dumps({'pid': os.getpid(), **json.load(sys.stdin)}))\n"
+    )
+
+    manager = SkillManager(project_skill_dir=temp_skills_dir, persistent_workers=True)
+    manager.discover()
+    try:
+        first = manager.execute_skill_script("worker-skill", "echo", {"Value": 1})
+        second = manager.execute_skill_script("worker-skill", "echo", {"Value": 2})
+    finally:
+        manager.shutdown_script_workers()
+
+    first_out, second_out = json.loads(first.stdout), json.loads(second.stdout)
+    assert first_out["value"] == 1
+    assert second_out["value"] == 2
+    assert first_out["pid"] == second_out["pid"]